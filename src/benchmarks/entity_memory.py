@@ -0,0 +1,194 @@
+"""
+Benchmark of the memory held by the entities parsed from a response.
+
+Measures, with tracemalloc, the memory still allocated once a response body
+has been parsed into entities and the parsed JSON is no longer referenced
+by anything but the entities themselves. Each workload is run:
+
+    eager               from_dict with Context(lazy_entities=False)
+    eager, __dict__     the same entities with their fields held in an
+                        instance __dict__ instead of __slots__, which is how
+                        entities were stored before they declared slots
+    lazy                from_dict with Context(lazy_entities=True), before
+                        any field is read
+    lazy, all read      the lazy entities after every field of every entity
+                        (and child entity) has been read
+
+for a candles response of M1 Candlesticks with mid prices and for a
+transaction.range response of filled Market Orders.
+
+    python benchmarks/entity_memory.py
+"""
+
+import gc
+import tracemalloc
+import ujson as json
+
+import v20
+from v20.base_entity import BaseEntity
+
+
+CANDLE_COUNT = 20000
+
+TRANSACTION_COUNT = 20000
+
+
+def candle(i):
+    return {
+        "time": "2018-01-01T00:{:02d}:00.000000000Z".format(i % 60),
+        "volume": i % 100,
+        "complete": True,
+        "mid": {
+            "o": "1.10000",
+            "h": "1.10020",
+            "l": "1.09990",
+            "c": "1.10010",
+        },
+    }
+
+
+def fill(i):
+    return {
+        "id": str(i),
+        "type": "ORDER_FILL",
+        "time": "2018-01-01T00:00:00.000000000Z",
+        "accountID": "101-001-1-001",
+        "orderID": str(i - 1),
+        "instrument": "EUR_USD",
+        "units": "100",
+        "price": "1.10000",
+        "pl": "0.5000",
+        "financing": "0.0000",
+        "commission": "0.0000",
+        "accountBalance": "1000.5000",
+        "reason": "MARKET_ORDER",
+        "tradeOpened": {"tradeID": str(i), "units": "100", "price": "1.1"},
+    }
+
+
+#
+# Classes with an instance __dict__ standing in for each entity class
+#
+_DICT_CLASSES = {}
+
+
+def with_dict(value):
+    """
+    Copy an entity, and any child entities, to objects of the same name that
+    hold their fields in an instance __dict__
+    """
+    if isinstance(value, list):
+        return [with_dict(v) for v in value]
+
+    if not isinstance(value, BaseEntity):
+        return value
+
+    cls = type(value)
+
+    dict_cls = _DICT_CLASSES.get(cls)
+
+    if dict_cls is None:
+        dict_cls = type(cls.__name__, (object,), {})
+        _DICT_CLASSES[cls] = dict_cls
+
+    copy = dict_cls()
+
+    for prop in cls._properties:
+        setattr(copy, prop.name, with_dict(getattr(value, prop.name)))
+
+    return copy
+
+
+def read_all(value):
+    """
+    Read every field of an entity and of its child entities
+    """
+    if isinstance(value, list):
+        for v in value:
+            read_all(v)
+    elif isinstance(value, BaseEntity):
+        for prop in value._properties:
+            read_all(getattr(value, prop.name))
+
+
+def measure(body, parse, after=None):
+    """
+    Returns:
+        The bytes still allocated after parsing the body into entities
+    """
+    gc.collect()
+
+    tracemalloc.start()
+
+    start_size = tracemalloc.get_traced_memory()[0]
+
+    entities = parse(json.loads(body))
+
+    if after is not None:
+        after(entities)
+
+    gc.collect()
+
+    size = tracemalloc.get_traced_memory()[0] - start_size
+
+    tracemalloc.stop()
+
+    return size
+
+
+def bench(name, body, count, parse):
+    eager = v20.Context("localhost", lazy_entities=False)
+    lazy = v20.Context("localhost", lazy_entities=True)
+
+    print("{} ({} entities, body {:.1f} MB):".format(
+        name, count, len(body) / 1e6
+    ))
+
+    for label, fn, after in [
+        ("eager", lambda data: parse(data, eager), None),
+        ("eager, __dict__", lambda data: with_dict(parse(data, eager)),
+            None),
+        ("lazy", lambda data: parse(data, lazy), None),
+        ("lazy, all read", lambda data: parse(data, lazy), read_all),
+    ]:
+        size = measure(body, fn, after)
+
+        print("  {:16} {:8.1f} MB {:8.0f} bytes/entity".format(
+            label, size / 1e6, size / count
+        ))
+
+
+def bench_candles():
+    body = json.dumps({
+        "instrument": "EUR_USD",
+        "granularity": "M1",
+        "candles": [candle(i) for i in range(CANDLE_COUNT)],
+    }).encode("utf-8")
+
+    def parse(data, ctx):
+        return [
+            ctx.instrument.Candlestick.from_dict(d, ctx)
+            for d in data["candles"]
+        ]
+
+    bench("candles", body, CANDLE_COUNT, parse)
+
+
+def bench_transactions():
+    body = json.dumps({
+        "transactions": [fill(i) for i in range(TRANSACTION_COUNT)],
+        "lastTransactionID": str(TRANSACTION_COUNT),
+    }).encode("utf-8")
+
+    def parse(data, ctx):
+        return [
+            ctx.transaction.Transaction.from_dict(d, ctx)
+            for d in data["transactions"]
+        ]
+
+    bench("transaction.range", body, TRANSACTION_COUNT, parse)
+
+
+if __name__ == "__main__":
+    bench_candles()
+    bench_transactions()
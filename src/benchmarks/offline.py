@@ -0,0 +1,137 @@
+"""
+Offline benchmark of the client over the in-process MockTransport.
+
+No network or server is involved, so the results only depend on the
+client. Measured:
+
+    stream throughput   pricing stream messages parsed per second, as
+                        ClientPrices and as PriceTicks
+    stream latency      the delay between a price being generated and being
+                        parsed, for a stream at a fixed rate
+    gather              the time to make 200 REST calls with 5 ms of latency
+                        each, sequentially and with Context.gather
+
+    python benchmarks/offline.py
+"""
+
+import time
+
+import v20
+from v20 import timestamps
+from v20.call import Call
+from v20.mock import MockTransport, PricingStream
+from v20.price_tick import PriceTickParser
+
+
+ACCOUNT = "101-001-1-001"
+
+STREAM_PATH = "/v3/accounts/{}/pricing/stream".format(ACCOUNT)
+
+MESSAGE_COUNT = 100000
+
+LATENCY_RATE = 5000
+
+CALL_COUNT = 200
+
+
+def stream_throughput():
+    print("stream throughput ({} messages):".format(MESSAGE_COUNT))
+
+    for name, parser in [
+        ("ClientPrice", None),
+        ("PriceTick", PriceTickParser),
+    ]:
+        transport = MockTransport()
+
+        transport.add_stream(
+            STREAM_PATH,
+            PricingStream(
+                ["EUR_USD", "USD_JPY", "GBP_USD"],
+                count=MESSAGE_COUNT,
+                batch_size=100
+            )
+        )
+
+        ctx = v20.Context("localhost", transport=transport)
+
+        response = ctx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+        if parser is not None:
+            response.set_line_parser(parser(ctx))
+
+        start = time.time()
+
+        count = sum(len(batch) for batch in response.batches())
+
+        elapsed = time.time() - start
+
+        print("  {:12} {:10.0f} msgs/s".format(name, count / elapsed))
+
+
+def stream_latency():
+    transport = MockTransport()
+
+    transport.add_stream(
+        STREAM_PATH,
+        PricingStream(["EUR_USD"], rate=LATENCY_RATE, count=LATENCY_RATE)
+    )
+
+    ctx = v20.Context("localhost", transport=transport)
+
+    response = ctx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+    response.set_line_parser(PriceTickParser(ctx))
+
+    latencies = []
+
+    for msg_type, msg in response.parts():
+        if msg_type == "pricing.PriceTick":
+            latencies.append(
+                time.time() - timestamps.to_ns(msg.time) / 1e9
+            )
+
+    latencies.sort()
+
+    print("stream latency ({} msgs/s):".format(LATENCY_RATE))
+
+    for percentile in [50, 99, 100]:
+        index = min(len(latencies) - 1, len(latencies) * percentile // 100)
+
+        print("  p{:<3} {:8.1f} us".format(percentile, latencies[index] * 1e6))
+
+
+def gather():
+    transport = MockTransport(latency=0.005)
+
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}/summary".format(ACCOUNT),
+        {"account": {"id": ACCOUNT}, "lastTransactionID": "1"}
+    )
+
+    ctx = v20.Context("localhost", transport=transport, pool_maxsize=20)
+
+    calls = [Call(ctx.account.summary, ACCOUNT) for _ in range(CALL_COUNT)]
+
+    print("gather ({} calls, 5 ms latency):".format(CALL_COUNT))
+
+    start = time.time()
+
+    for call in calls:
+        ctx.request(call.prepare(ctx))
+
+    print(
+        "  {:12} {:8.1f} ms".format("sequential", (time.time() - start) * 1e3)
+    )
+
+    start = time.time()
+
+    ctx.gather(calls)
+
+    print("  {:12} {:8.1f} ms".format("gather", (time.time() - start) * 1e3))
+
+
+if __name__ == "__main__":
+    stream_throughput()
+    stream_latency()
+    gather()
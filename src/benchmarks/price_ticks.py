@@ -0,0 +1,104 @@
+"""
+Benchmark of the PriceTick stream parser.
+
+Compares parsing pricing stream lines into ClientPrice entities (the
+pricing.stream Parser) with parsing them into PriceTicks (PriceTickParser),
+for prices with and without quoteHomeConversionFactors. The lines are held
+in memory, so only the parsing is measured.
+
+    python benchmarks/price_ticks.py
+"""
+
+import time
+import ujson as json
+
+import v20
+from v20.call import Call
+from v20.price_tick import PriceTickParser
+
+
+PRICE_COUNT = 200000
+
+
+def price(i, factors):
+    data = {
+        "type": "PRICE",
+        "instrument": "EUR_USD",
+        "time": "2018-01-01T00:00:00.{:09d}Z".format(i),
+        "bids": [
+            {"price": "1.10000", "liquidity": 1000000},
+            {"price": "1.09990", "liquidity": 5000000},
+        ],
+        "asks": [
+            {"price": "1.10010", "liquidity": 1000000},
+            {"price": "1.10020", "liquidity": 5000000},
+        ],
+        "closeoutBid": "1.09990",
+        "closeoutAsk": "1.10020",
+        "status": "tradeable",
+        "tradeable": True,
+    }
+
+    if factors:
+        data["quoteHomeConversionFactors"] = {
+            "positiveUnits": "1.00000",
+            "negativeUnits": "1.00000",
+        }
+
+    return data
+
+
+def best(fn, repeat=5):
+    times = []
+
+    for _ in range(repeat):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+
+    return min(times)
+
+
+def main():
+    ctx = v20.Context("localhost")
+
+    parsers = [
+        (
+            "ClientPrice",
+            Call(
+                ctx.pricing.stream,
+                "101-001-1-001",
+                instruments="EUR_USD"
+            ).prepare(ctx).line_parser
+        ),
+        ("PriceTick", PriceTickParser(ctx)),
+    ]
+
+    for factors in [False, True]:
+        lines = [
+            json.dumps(price(i, factors)).encode("utf-8")
+            for i in range(PRICE_COUNT)
+        ]
+
+        print("{} prices{}:".format(
+            PRICE_COUNT,
+            " with quoteHomeConversionFactors" if factors else ""
+        ))
+
+        for name, parse in parsers:
+            def run():
+                for line in lines:
+                    parse(line)
+
+            elapsed = best(run)
+
+            print("  {:12} {:8.1f} ms {:10.0f} lines/s {:6.2f} us/line".format(
+                name,
+                elapsed * 1000,
+                PRICE_COUNT / elapsed,
+                elapsed / PRICE_COUNT * 1e6
+            ))
+
+
+if __name__ == "__main__":
+    main()
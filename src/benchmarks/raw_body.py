@@ -0,0 +1,147 @@
+"""
+Benchmark of the bytes body path.
+
+Compares decoding a response body to a str before parsing it (what
+Context.request and the stream parsers used to do) with parsing the bytes
+received directly, for a large transaction.range body and for a high rate
+pricing stream.
+
+    python benchmarks/raw_body.py
+"""
+
+import time
+import ujson as json
+
+import requests
+
+import v20
+from v20.call import Call
+from v20.response import Response
+
+
+TRANSACTION_COUNT = 20000
+
+PRICE_COUNT = 200000
+
+
+def fill(i):
+    return {
+        "id": str(i),
+        "type": "ORDER_FILL",
+        "time": "2018-01-01T00:00:00.000000000Z",
+        "accountID": "101-001-1-001",
+        "orderID": str(i - 1),
+        "instrument": "EUR_USD",
+        "units": "100",
+        "price": "1.10000",
+        "pl": "0.5000",
+        "financing": "0.0000",
+        "commission": "0.0000",
+        "accountBalance": "1000.5000",
+        "reason": "MARKET_ORDER",
+        "tradeOpened": {"tradeID": str(i), "units": "100", "price": "1.1"},
+    }
+
+
+def price(i):
+    return {
+        "type": "PRICE",
+        "instrument": "EUR_USD",
+        "time": "2018-01-01T00:00:00.{:09d}Z".format(i),
+        "bids": [{"price": "1.10000", "liquidity": 1000000}],
+        "asks": [{"price": "1.10010", "liquidity": 1000000}],
+        "closeoutBid": "1.10000",
+        "closeoutAsk": "1.10010",
+        "tradeable": True,
+    }
+
+
+def best(fn, repeat=5):
+    times = []
+
+    for _ in range(repeat):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+
+    return min(times)
+
+
+def bench_body():
+    body = json.dumps({
+        "transactions": [fill(i) for i in range(TRANSACTION_COUNT)],
+        "lastTransactionID": str(TRANSACTION_COUNT)
+    }).encode("utf-8")
+
+    http_response = requests.models.Response()
+    http_response._content = body
+    http_response.headers["content-type"] = "application/json"
+
+    def as_text():
+        json.loads(http_response.text)
+
+    def as_bytes():
+        json.loads(http_response.content)
+
+    print("body: {:.1f} MB".format(len(body) / 1e6))
+
+    for name, fn in [
+        ("text + loads", as_text),
+        ("bytes + loads", as_bytes),
+    ]:
+        print("  {:20} {:8.1f} ms".format(name, best(fn) * 1000))
+
+
+def bench_stream():
+    ctx = v20.Context("localhost")
+
+    lines = [
+        json.dumps(price(i)).encode("utf-8") for i in range(PRICE_COUNT)
+    ]
+
+    request = Call(
+        ctx.pricing.stream,
+        "101-001-1-001",
+        instruments="EUR_USD"
+    ).prepare(ctx)
+
+    def run(lines):
+        response = Response(request, "GET", request.path, 200, "OK", {})
+        response.set_line_parser(request.line_parser)
+        response.set_lines(lines)
+
+        for _ in response.parts():
+            pass
+
+    def as_text():
+        run(line.decode("utf-8") for line in lines)
+
+    def as_bytes():
+        run(iter(lines))
+
+    def loads_text():
+        for line in lines:
+            json.loads(line.decode("utf-8"))
+
+    def loads_bytes():
+        for line in lines:
+            json.loads(line)
+
+    print("pricing stream: {} lines".format(PRICE_COUNT))
+
+    for name, fn in [
+        ("decode + loads", loads_text),
+        ("loads", loads_bytes),
+        ("parts() from text", as_text),
+        ("parts() from bytes", as_bytes),
+    ]:
+        elapsed = best(fn)
+
+        print("  {:20} {:8.1f} ms {:10.0f} lines/s".format(
+            name, elapsed * 1000, PRICE_COUNT / elapsed
+        ))
+
+
+if __name__ == "__main__":
+    bench_body()
+    bench_stream()
@@ -0,0 +1,159 @@
+"""
+Benchmark of the stream line reader.
+
+A local server (in a separate process) streams newline-delimited pricing
+messages for 100 instruments as fast as it can, using chunked transfer
+encoding like the v20 streaming endpoints. The messages are consumed
+through:
+
+    iter_lines(512)   the requests iter_lines() path streams used to take
+    parts()           Response.parts() over the LineReader
+    batches()         Response.batches() over the LineReader
+
+once splitting lines only, and once parsing them into entities. The
+throughput and the client CPU time per message are reported.
+
+    python benchmarks/stream_lines.py
+"""
+
+import multiprocessing
+import time
+import ujson as json
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+import v20
+from v20.call import Call
+
+
+MESSAGE_COUNT = 200000
+
+INSTRUMENT_COUNT = 100
+
+WRITE_SIZE = 65536
+
+
+def price(i):
+    return {
+        "type": "PRICE",
+        "instrument": "I{:03d}".format(i % INSTRUMENT_COUNT),
+        "time": "2018-01-01T00:00:00.{:09d}Z".format(i),
+        "bids": [{"price": "1.10000", "liquidity": 1000000}],
+        "asks": [{"price": "1.10010", "liquidity": 1000000}],
+        "closeoutBid": "1.10000",
+        "closeoutAsk": "1.10010",
+        "tradeable": True,
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    payload = b"".join(
+        json.dumps(price(i)).encode("utf-8") + b"\n"
+        for i in range(MESSAGE_COUNT)
+    )
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        for start in range(0, len(self.payload), WRITE_SIZE):
+            data = self.payload[start:start + WRITE_SIZE]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+        self.wfile.write(b"0\r\n\r\n")
+
+
+def serve(port):
+    ThreadingHTTPServer(("127.0.0.1", port), Handler).serve_forever()
+
+
+def measure(name, consume):
+    wall = time.time()
+    cpu = time.process_time()
+
+    count = consume()
+
+    wall = time.time() - wall
+    cpu = time.process_time() - cpu
+
+    assert count == MESSAGE_COUNT, count
+
+    print("  {:16} {:10.0f} msgs/s {:8.2f} us CPU/msg".format(
+        name, count / wall, cpu / count * 1e6
+    ))
+
+
+def main():
+    port = 18765
+
+    server = multiprocessing.Process(target=serve, args=(port,))
+    server.daemon = True
+    server.start()
+
+    time.sleep(0.5)
+
+    ctx = v20.Context("127.0.0.1", port=port, ssl=False, stream_timeout=30)
+
+    parser = Call(
+        ctx.pricing.stream,
+        "A",
+        instruments="EUR_USD"
+    ).prepare(ctx).line_parser
+
+    url = "http://127.0.0.1:{}/v3/accounts/A/pricing/stream".format(port)
+
+    def iter_lines(parse):
+        def consume():
+            response = requests.get(url, stream=True)
+            count = 0
+            for line in response.iter_lines(512):
+                if line:
+                    parse(line)
+                    count += 1
+            return count
+        return consume
+
+    def parts(parse):
+        def consume():
+            response = ctx.pricing.stream("A", instruments="EUR_USD")
+            response.set_line_parser(parse)
+            count = 0
+            for _ in response.parts():
+                count += 1
+            return count
+        return consume
+
+    def batches(parse):
+        def consume():
+            response = ctx.pricing.stream("A", instruments="EUR_USD")
+            response.set_line_parser(parse)
+            count = 0
+            for batch in response.batches():
+                count += len(batch)
+            return count
+        return consume
+
+    for title, parse in [
+        ("split only", lambda line: line),
+        ("split and parse", parser),
+    ]:
+        print("{} ({} messages):".format(title, MESSAGE_COUNT))
+
+        measure("iter_lines(512)", iter_lines(parse))
+        measure("parts()", parts(parse))
+        measure("batches()", batches(parse))
+
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
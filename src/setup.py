@@ -32,7 +32,15 @@ def main():
         "author_email": "api@oanda.com",
         "url": "https://github.com/oanda/v20-python",
         "license": "MIT",
-        "install_requires": ['requests', 'ujson'],
+        "install_requires": [
+            'requests',
+            'ujson',
+            'futures; python_version < "3"'
+        ],
+        "extras_require": {
+            "columns": ['numpy'],
+            "http2": ['httpx[http2]']
+        },
         "packages": ["v20"],
         "data_files": [('', ['LICENSE.txt', 'ChangeLog'])],
         "platforms": ["any"],
@@ -0,0 +1,109 @@
+"""
+Fixtures shared by the tests.
+
+Tests talk to the v20 REST server through a FixtureTransport: a
+v20.mock.MockTransport that also counts the stream connections opened and
+given up, and can answer requests through handlers added by a test.
+"""
+
+import asyncio
+import ujson as json
+
+import pytest
+
+import v20
+from v20.aio_mock import AsyncMockTransport
+from v20.mock import MockTransport
+
+
+class FixtureTransport(MockTransport):
+    """
+    A MockTransport whose requests can also be answered by handlers, and
+    which counts the stream connections opened and given up
+    """
+    def __init__(self, latency=0):
+        super(FixtureTransport, self).__init__(latency)
+
+        self.opened = 0
+        self.released = 0
+        self._handlers = []
+
+    def add_handler(self, handler):
+        """
+        Answer requests with a callable taking the v20.request.Request and
+        returning the (status, reason, body) of its response, the body as a
+        dict or bytes, or None to leave the request to the responses and
+        streams added. Handlers are tried in the order they were added.
+        """
+        self._handlers.append(handler)
+
+    def _respond(self, request):
+        for handler in self._handlers:
+            response = handler(request)
+
+            if response is None:
+                continue
+
+            status, reason, body = response
+
+            if isinstance(body, dict):
+                body = json.dumps(body).encode("utf-8")
+
+            return status, reason, body
+
+        return super(FixtureTransport, self)._respond(request)
+
+    def send(self, request, url, headers, timeout):
+        reply = super(FixtureTransport, self).send(
+            request, url, headers, timeout
+        )
+
+        if request.stream:
+            self.opened += 1
+
+            release = reply.release
+
+            def counted():
+                self.released += 1
+
+                if release is not None:
+                    release()
+
+            reply.release = counted
+
+        return reply
+
+
+@pytest.fixture
+def transport():
+    return FixtureTransport()
+
+
+@pytest.fixture
+def ctx(transport):
+    return v20.Context("localhost", transport=transport)
+
+
+@pytest.fixture
+def actx(transport):
+    return v20.AsyncContext(
+        "localhost",
+        transport=AsyncMockTransport(transport)
+    )
+
+
+@pytest.fixture
+def run():
+    """
+    Returns:
+        A function running a coroutine to completion in a new event loop
+    """
+    def run(coroutine):
+        loop = asyncio.new_event_loop()
+
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    return run
@@ -0,0 +1,207 @@
+import threading
+import time
+
+import v20
+from v20.account_mirror import StreamingAccountMirror
+
+
+ACCOUNT = "101-001-1-001"
+
+FINANCING = {
+    "id": "2",
+    "time": "2018-01-01T00:00:00.000000000Z",
+    "accountID": ACCOUNT,
+    "type": "DAILY_FINANCING",
+    "financing": "5.0",
+    "accountBalance": "1005.0",
+}
+
+
+class StreamDuringChanges(object):
+    """
+    Applies a Transaction to the mirror from another thread, as
+    StreamingAccountMirror.stream would, while an account.changes request
+    covering it is in flight
+    """
+    def __init__(self, mirror):
+        self.mirror = mirror
+        self.unlocked = None
+        self.streamed = []
+        self.thread = None
+
+    def __call__(self, request):
+        if not request.path.endswith("/changes"):
+            return None
+
+        ctx = self.mirror.ctx
+
+        #
+        # The mirror must not be locked while the request is made
+        #
+        self.unlocked = self.mirror._lock.acquire(False)
+
+        if self.unlocked:
+            self.mirror._lock.release()
+
+        transaction = ctx.transaction.Transaction.from_dict(FINANCING, ctx)
+
+        def stream():
+            self.streamed.append(self.mirror.apply_transaction(transaction))
+
+        self.thread = threading.Thread(target=stream)
+        self.thread.start()
+
+        time.sleep(0.2)
+
+        #
+        # The changes are answered by the response added
+        #
+        return None
+
+
+def test_poll_does_not_apply_streamed_transaction_twice(ctx, transport):
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}".format(ACCOUNT),
+        {
+            "account": {
+                "id": ACCOUNT,
+                "balance": "1000.0",
+                "financing": "0.0",
+            },
+            "lastTransactionID": "1",
+        }
+    )
+
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}/changes".format(ACCOUNT),
+        {
+            "changes": {"transactions": [FINANCING]},
+            "state": {},
+            "lastTransactionID": "2",
+        }
+    )
+
+    mirror = StreamingAccountMirror(ctx, ACCOUNT)
+
+    streaming = StreamDuringChanges(mirror)
+
+    transport.add_handler(streaming)
+
+    mirror.bootstrap()
+    mirror.poll()
+
+    streaming.thread.join()
+
+    #
+    # The Transaction was applied while the changes were fetched, so it is
+    # not applied again from them
+    #
+    assert streaming.unlocked
+    assert streaming.streamed == [True]
+    assert mirror.lastTransactionID == "2"
+    assert float(mirror.account.financing) == 5.0
+
+
+def financing_mirror(ctx):
+    transport = ctx.transport
+
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}".format(ACCOUNT),
+        {
+            "account": {
+                "id": ACCOUNT,
+                "balance": "1000.0000",
+                "financing": "0.0000",
+            },
+            "lastTransactionID": "1",
+        }
+    )
+
+    mirror = StreamingAccountMirror(ctx, ACCOUNT)
+
+    mirror.bootstrap()
+
+    for id, financing in [(2, "0.1000"), (3, "0.2000")]:
+        mirror.apply_transaction(
+            ctx.transaction.Transaction.from_dict(
+                {
+                    "id": str(id),
+                    "type": "DAILY_FINANCING",
+                    "financing": financing,
+                },
+                ctx
+            )
+        )
+
+    return mirror
+
+
+def test_money_is_added_exactly(transport):
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        decimal_number_as_float=False
+    )
+
+    assert financing_mirror(ctx).account.financing == "0.3000"
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        decimal_number_as_float=True
+    )
+
+    assert financing_mirror(ctx).account.financing == 0.3
+
+
+def fill(id, price):
+    return {
+        "id": str(id),
+        "type": "ORDER_FILL",
+        "orderID": str(id - 1),
+        "instrument": "EUR_USD",
+        "units": "100",
+        "price": price,
+        "pl": "0.0000",
+        "financing": "0.0000",
+        "commission": "0.0000",
+        "accountBalance": "1000.0000",
+        "tradeOpened": {"tradeID": str(id), "units": "100", "price": price},
+    }
+
+
+def test_catch_up_opens_trades_exactly(transport):
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        decimal_number_as_float=False
+    )
+
+    mirror = financing_mirror(ctx)
+
+    since_path = "/v3/accounts/{}/transactions/sinceid".format(ACCOUNT)
+
+    transport.add_response(
+        "GET",
+        since_path,
+        {"transactions": [fill(4, "1.10000")], "lastTransactionID": "5"},
+        params={"id": "3"}
+    )
+
+    transport.add_response(
+        "GET",
+        since_path,
+        {"transactions": [fill(5, "1.10010")], "lastTransactionID": "5"},
+        params={"id": "4"}
+    )
+
+    assert [t.id for t in mirror.catch_up()] == ["4", "5"]
+
+    position = mirror.position("EUR_USD")
+
+    assert position.long.units == "200"
+    assert position.long.averagePrice == "1.10005"
+    assert position.long.tradeIDs == ["4", "5"]
@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+import pytest
+
+ACCOUNT = "101-001-1-001"
+
+
+def test_candles_range_is_not_run_as_a_call(actx):
+    with pytest.raises(TypeError):
+        actx.instrument.candles_range("EUR_USD", "M1", 0, 3600)
+
+
+def test_iter_range_is_not_run_as_a_call(actx):
+    with pytest.raises(TypeError):
+        actx.transaction.iter_range(ACCOUNT, 0, 3600)
+
+
+def test_aio_does_not_import_test_doubles():
+    output = subprocess.check_output([
+        sys.executable,
+        "-c",
+        "import sys, v20.aio; print('v20.mock' in sys.modules)"
+    ])
+
+    assert output.strip() == b"False"
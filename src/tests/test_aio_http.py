@@ -0,0 +1,160 @@
+import asyncio
+import gzip
+
+import pytest
+
+from v20.aio import AsyncHTTPTransport
+from v20.errors import V20ConnectionError
+from v20.request import Request
+
+
+class Server(object):
+    """
+    A loopback HTTP/1.1 server writing canned responses, one per request
+    in turn, with the headers of each request received kept
+    """
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.requests = []
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+
+        while len(self.responses) > 0:
+            head = await reader.readuntil(b"\r\n\r\n")
+
+            self.requests.append(head.decode("latin-1"))
+
+            writer.write(self.responses.pop(0))
+
+            await writer.drain()
+
+        writer.close()
+
+
+def exchange(responses, count, stream=False):
+    """
+    Send count requests to a Server writing the responses. The Reply of a
+    stream is closed without being read.
+
+    Returns:
+        The Server, and the Reply to each request or the exception it
+        raised
+    """
+    server = Server(responses)
+
+    async def run():
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+
+        port = listener.sockets[0].getsockname()[1]
+
+        transport = AsyncHTTPTransport("127.0.0.1", port, ssl=False)
+
+        replies = []
+
+        try:
+            for i in range(count):
+                request = Request("GET", "/v3/accounts")
+                request.set_stream(stream)
+
+                try:
+                    reply = await transport.send(request, "url", {}, 2)
+                except V20ConnectionError as e:
+                    reply = e
+                else:
+                    if stream:
+                        reply.close()
+
+                replies.append(reply)
+        finally:
+            transport.close_idle_connections()
+            listener.close()
+            await listener.wait_closed()
+
+        return replies
+
+    loop = asyncio.new_event_loop()
+
+    try:
+        return server, loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_pool_is_bound_to_the_loop_it_is_used_from():
+    transport = AsyncHTTPTransport("127.0.0.1", 1, ssl=False)
+
+    assert transport._pool._semaphore is None
+
+
+def test_content_length():
+    server, replies = exchange(
+        [b"HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\nhello"] * 2,
+        2
+    )
+
+    assert [r.content for r in replies] == [b"hello", b"hello"]
+    assert server.connections == 1
+
+
+def test_chunked_body_with_trailers():
+    server, replies = exchange(
+        [
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"5;name=value\r\nhello\r\n6\r\n world\r\n0\r\n"
+            b"X-Checksum: 1234\r\nX-Other: 5678\r\n\r\n",
+            b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok",
+        ],
+        2
+    )
+
+    assert [r.content for r in replies] == [b"hello world", b"ok"]
+
+    #
+    # The trailers are consumed, so the connection is reused
+    #
+    assert server.connections == 1
+
+
+def test_gzip_body():
+    body = gzip.compress(b'{"accounts": []}')
+
+    server, replies = exchange(
+        [
+            b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\n"
+            b"Content-Length: " + str(len(body)).encode("ascii") +
+            b"\r\n\r\n" + body
+        ],
+        1
+    )
+
+    assert replies[0].content == b'{"accounts": []}'
+    assert "Accept-Encoding: gzip" in server.requests[0]
+
+
+def test_stream_is_not_compressed():
+    server, replies = exchange(
+        [b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n0\r\n\r\n"],
+        1,
+        stream=True
+    )
+
+    assert "Accept-Encoding: identity" in server.requests[0]
+
+
+@pytest.mark.parametrize("response", [
+    b"garbage\r\n\r\n",
+    b"HTTP/1.1 OK\r\nContent-Length: 0\r\n\r\n",
+    b"HTTP/1.1 200 OK\r\nno colon\r\n\r\n",
+    b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n",
+    b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n5\r\nhel",
+    b"HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nhello",
+    b"HTTP/1.1 200 OK\r\nContent-Encoding: gzip\r\n"
+    b"Content-Length: 5\r\n\r\nhello",
+    b"",
+])
+def test_malformed_response(response):
+    server, replies = exchange([response], 1)
+
+    assert isinstance(replies[0], V20ConnectionError)
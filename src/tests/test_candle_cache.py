@@ -0,0 +1,154 @@
+import threading
+import time
+
+import v20
+from v20 import timestamps
+from v20 import candle_cache
+from v20.candle_cache import CandleCache
+
+
+MINUTE_NS = 60 * 1000000000
+
+
+class Candles(object):
+    """
+    Answers M1 candles requests with a candlestick for every minute of the
+    range that has ended. The candlestick of the current minute is only
+    sent once a tick has arrived.
+    """
+    def __init__(self):
+        self.ticked = False
+
+    def __call__(self, request):
+        now_ns = timestamps.to_ns(time.time())
+
+        from_ns = timestamps.to_ns(request.params["from"])
+        to_ns = timestamps.to_ns(request.params["to"])
+
+        start = -(-from_ns // MINUTE_NS) * MINUTE_NS
+
+        candles = []
+
+        for candle_ns in range(start, min(to_ns, now_ns), MINUTE_NS):
+            complete = candle_ns + MINUTE_NS <= now_ns
+
+            if not complete and not self.ticked:
+                continue
+
+            candles.append({
+                "time": timestamps.format_ns(candle_ns),
+                "volume": 1,
+                "complete": complete,
+                "mid": {
+                    "o": "1.10000",
+                    "h": "1.20000",
+                    "l": "1.00000",
+                    "c": "1.10010",
+                },
+            })
+
+        return 200, "OK", {
+            "instrument": "EUR_USD",
+            "granularity": "M1",
+            "candles": candles,
+        }
+
+
+def test_current_interval_is_not_covered(tmpdir, transport):
+    candles_handler = Candles()
+
+    transport.add_handler(candles_handler)
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        candle_cache=CandleCache(str(tmpdir))
+    )
+
+    #
+    # The test must not run across the end of a minute
+    #
+    if time.time() % 60 > 58:
+        time.sleep(2.5)
+
+    minute_ns = timestamps.to_ns(time.time()) // MINUTE_NS * MINUTE_NS
+
+    def candles():
+        response = ctx.instrument.candles(
+            "EUR_USD",
+            granularity="M1",
+            fromTime=timestamps.format_ns(minute_ns - 10 * MINUTE_NS),
+            toTime=timestamps.format_ns(minute_ns + MINUTE_NS)
+        )
+
+        return response.get("candles", 200)
+
+    assert len(candles()) == 10
+
+    candles_handler.ticked = True
+
+    assert len(candles()) == 11
+
+
+def test_stored_prices_are_served_as_received(tmpdir, transport):
+    transport.add_handler(Candles())
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        candle_cache=CandleCache(str(tmpdir)),
+        decimal_number_as_float=False
+    )
+
+    minute_ns = timestamps.to_ns(time.time()) // MINUTE_NS * MINUTE_NS
+
+    def candles():
+        response = ctx.instrument.candles(
+            "EUR_USD",
+            granularity="M1",
+            fromTime=timestamps.format_ns(minute_ns - 10 * MINUTE_NS),
+            toTime=timestamps.format_ns(minute_ns - 5 * MINUTE_NS)
+        )
+
+        return [
+            (c.mid.o, c.mid.h, c.mid.l, c.mid.c)
+            for c in response.get("candles", 200)
+        ]
+
+    expected = [("1.10000", "1.20000", "1.00000", "1.10010")] * 5
+
+    assert candles() == expected
+
+    #
+    # A new cache reads the precision back from the store
+    #
+    ctx.set_candle_cache(CandleCache(str(tmpdir)))
+
+    assert candles() == expected
+
+
+def test_store_is_created_once(tmpdir, monkeypatch):
+    class SlowCandleStore(candle_cache.CandleStore):
+        def __init__(self, *args):
+            time.sleep(0.05)
+
+            super(SlowCandleStore, self).__init__(*args)
+
+    monkeypatch.setattr(candle_cache, "CandleStore", SlowCandleStore)
+
+    cache = CandleCache(str(tmpdir))
+
+    stores = []
+
+    def store():
+        stores.append(cache.store("EUR_USD", "M1"))
+
+    threads = [threading.Thread(target=store) for i in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert all(s is stores[0] for s in stores)
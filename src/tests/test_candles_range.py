@@ -0,0 +1,140 @@
+import threading
+import time
+
+import pytest
+
+from v20 import candles, timestamps
+from v20.errors import ResponseUnexpectedStatus
+
+
+MINUTE_NS = 60 * 1000000000
+
+START_NS = timestamps.to_ns("2018-01-01T00:00:00Z")
+
+
+class Candles(object):
+    """
+    Answers M1 candles requests with a candlestick for every minute from
+    the start of the range to its end, inclusive, as long as the range is
+    within the server's limit, and records the largest number of requests
+    in flight at once
+    """
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_from = None
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.latency)
+
+        with self._lock:
+            self.in_flight -= 1
+
+        from_ns = timestamps.to_ns(request.params["from"])
+        to_ns = timestamps.to_ns(request.params["to"])
+
+        if from_ns == self.fail_from:
+            return 503, "Service Unavailable", {"errorMessage": "Error"}
+
+        start = from_ns
+
+        if request.params.get("includeFirst") == "false":
+            start += MINUTE_NS
+
+        times = list(range(start, to_ns + 1, MINUTE_NS))
+
+        if len(times) > candles.MAX_CANDLE_COUNT:
+            return 400, "Bad Request", {"errorMessage": "Too many"}
+
+        return 200, "OK", {
+            "instrument": "EUR_USD",
+            "granularity": "M1",
+            "candles": [
+                {
+                    "time": timestamps.format_ns(t),
+                    "volume": 1,
+                    "complete": True,
+                    "mid": {"o": "1.1", "h": "1.1", "l": "1.1", "c": "1.1"},
+                }
+                for t in times
+            ],
+        }
+
+
+def test_split_range():
+    to_ns = START_NS + 12000 * MINUTE_NS
+
+    windows = candles.split_range("M1", START_NS, to_ns)
+
+    assert windows[0][0] == START_NS
+    assert windows[-1][1] == to_ns
+
+    for (a_from, a_to), (b_from, b_to) in zip(windows, windows[1:]):
+        assert a_to == b_from
+
+    for window_from, window_to in windows:
+        assert (window_to - window_from) // MINUTE_NS + 1 <= \
+            candles.MAX_CANDLE_COUNT
+
+    assert candles.split_range("M1", START_NS, START_NS) == []
+
+    with pytest.raises(ValueError):
+        candles.split_range("M3", START_NS, to_ns)
+
+
+def test_candles_range(ctx, transport):
+    server = Candles(latency=0.05)
+
+    transport.add_handler(server)
+
+    count = 12000
+
+    result = list(
+        ctx.instrument.candles_range(
+            "EUR_USD",
+            "M1",
+            timestamps.format_ns(START_NS),
+            timestamps.format_ns(START_NS + count * MINUTE_NS),
+            max_workers=3
+        )
+    )
+
+    #
+    # Each boundary candlestick is requested by both of its windows, but is
+    # yielded once
+    #
+    assert [timestamps.to_ns(c.time) for c in result] == \
+        [START_NS + i * MINUTE_NS for i in range(count + 1)]
+
+    assert len(transport.requests) == 3
+    assert server.max_in_flight > 1
+
+
+def test_candles_range_window_failure(ctx, transport):
+    server = Candles()
+
+    transport.add_handler(server)
+
+    windows = candles.split_range(
+        "M1",
+        START_NS,
+        START_NS + 12000 * MINUTE_NS
+    )
+
+    server.fail_from = windows[1][0] - MINUTE_NS
+
+    with pytest.raises(ResponseUnexpectedStatus):
+        list(
+            ctx.instrument.candles_range(
+                "EUR_USD",
+                "M1",
+                timestamps.format_ns(START_NS),
+                timestamps.format_ns(START_NS + 12000 * MINUTE_NS)
+            )
+        )
@@ -0,0 +1,108 @@
+import pytest
+
+import v20
+from v20 import timestamps
+
+numpy = pytest.importorskip("numpy")
+
+
+START_NS = timestamps.to_ns("2018-01-01T00:00:00Z")
+
+MINUTE_NS = 60 * 1000000000
+
+
+def candle(i, datetime_format="RFC3339"):
+    bid = "{:.5f}".format(1.1 + i * 0.0001)
+    ask = "{:.5f}".format(1.1002 + i * 0.0001)
+
+    return {
+        "time": timestamps.format_ns(
+            START_NS + i * MINUTE_NS,
+            datetime_format
+        ),
+        "volume": 10 + i,
+        "complete": i < 2,
+        "bid": {"o": bid, "h": bid, "l": bid, "c": bid},
+        "ask": {"o": ask, "h": ask, "l": ask, "c": ask},
+    }
+
+
+def add_candles(transport, path, datetime_format="RFC3339"):
+    transport.add_response(
+        "GET",
+        path,
+        {
+            "instrument": "EUR_USD",
+            "granularity": "M1",
+            "candles": [candle(i, datetime_format) for i in range(3)],
+        }
+    )
+
+
+def test_instrument_candles_as_columns(ctx, transport):
+    add_candles(transport, "/v3/instruments/EUR_USD/candles")
+
+    columns = ctx.instrument.candles(
+        "EUR_USD",
+        price="BA",
+        as_columns=True
+    ).get("candles", 200)
+
+    objects = ctx.instrument.candles(
+        "EUR_USD",
+        price="BA"
+    ).get("candles", 200)
+
+    assert len(columns) == 3
+    assert columns.instrument == "EUR_USD"
+    assert columns.granularity == "M1"
+
+    assert columns.time.dtype == numpy.int64
+    assert list(columns.time) == \
+        [START_NS + i * MINUTE_NS for i in range(3)]
+
+    assert list(columns.volume) == [c.volume for c in objects]
+    assert list(columns.complete) == [True, True, False]
+
+    for component in ["bid", "ask"]:
+        for price in ["o", "h", "l", "c"]:
+            assert list(getattr(getattr(columns, component), price)) == [
+                getattr(getattr(c, component), price) for c in objects
+            ]
+
+    assert columns.mid is None
+
+
+def test_pricing_candles_as_columns_in_unix_time(transport):
+    ctx = v20.Context("localhost", transport=transport, datetime_format="UNIX")
+
+    add_candles(
+        transport,
+        "/v3/accounts/{accountID}/instruments/EUR_USD/candles",
+        "UNIX"
+    )
+
+    columns = ctx.pricing.candles(
+        "EUR_USD",
+        as_columns=True
+    ).get("candles", 200)
+
+    assert list(columns.time) == \
+        [START_NS + i * MINUTE_NS for i in range(3)]
+
+
+def test_no_candles(ctx, transport):
+    transport.add_response(
+        "GET",
+        "/v3/instruments/EUR_USD/candles",
+        {"instrument": "EUR_USD", "granularity": "M1", "candles": []}
+    )
+
+    columns = ctx.instrument.candles(
+        "EUR_USD",
+        as_columns=True
+    ).get("candles", 200)
+
+    assert len(columns) == 0
+    assert columns.time.dtype == numpy.int64
+    assert columns.bid is None
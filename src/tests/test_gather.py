@@ -0,0 +1,71 @@
+import time
+
+from v20.call import Call
+from v20.errors import V20Timeout
+
+
+ACCOUNT = "101-001-1-001"
+
+SUMMARY_PATH = "/v3/accounts/{}/summary".format(ACCOUNT)
+
+
+def slow_summary(transport):
+    transport.latency = 0.5
+
+    transport.add_response(
+        "GET",
+        SUMMARY_PATH,
+        {"account": {"id": ACCOUNT}, "lastTransactionID": "1"}
+    )
+
+
+def test_deadline_timeout_reports_url(ctx, transport):
+    slow_summary(transport)
+
+    calls = [Call(ctx.account.summary, ACCOUNT) for i in range(2)]
+
+    sent, queued = ctx.gather(calls, max_workers=1, deadline=0.05)
+
+    assert isinstance(sent, V20Timeout)
+    assert sent.url == "{}{}".format(ctx._base_url, SUMMARY_PATH)
+    assert sent.type == "deadline"
+
+    #
+    # The second call never made its request, and never will
+    #
+    assert isinstance(queued, V20Timeout)
+    assert queued.url == SUMMARY_PATH
+    assert queued.type == "deadline"
+
+    time.sleep(0.6)
+
+    assert len(transport.requests) == 1
+
+
+def test_async_deadline_timeout_reports_url(actx, transport, run):
+    slow_summary(transport)
+
+    timeout, = run(
+        actx.gather([Call(actx.account.summary, ACCOUNT)], deadline=0.05)
+    )
+
+    assert isinstance(timeout, V20Timeout)
+    assert timeout.url == "{}{}".format(actx._base_url, SUMMARY_PATH)
+    assert timeout.type == "deadline"
+
+
+def test_async_gather_is_bounded(actx, transport, run):
+    slow_summary(transport)
+
+    results = run(
+        actx.gather(
+            [Call(actx.account.summary, ACCOUNT) for i in range(6)],
+            max_workers=2,
+            deadline=0.1
+        )
+    )
+
+    assert [result.url for result in results] == \
+        ["{}{}".format(actx._base_url, SUMMARY_PATH)] * 2 + [SUMMARY_PATH] * 4
+
+    assert len(transport.requests) == 2
@@ -0,0 +1,126 @@
+import pytest
+
+import v20
+from v20.aio import AsyncHTTP2Transport
+from v20.errors import V20ConnectionError, V20Timeout
+from v20.transport import HTTP2Transport
+
+httpx = pytest.importorskip("httpx")
+
+
+ACCOUNT = "101-001-1-001"
+
+HEARTBEAT = b'{"type": "HEARTBEAT", "time": "1514764800.000000000"}\n'
+
+
+class Server(object):
+    """
+    Answers the httpx requests of a transport in-process, keeping each
+    request received
+    """
+    def __init__(self, error=None):
+        self.error = error
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+
+        if self.error is not None:
+            raise self.error
+
+        if request.url.path.endswith("/pricing/stream"):
+            return httpx.Response(200, content=HEARTBEAT * 3)
+
+        return httpx.Response(
+            200,
+            json={"account": {"id": ACCOUNT}, "lastTransactionID": "1"}
+        )
+
+
+def http2_context(server):
+    transport = HTTP2Transport()
+
+    transport.client = httpx.Client(transport=httpx.MockTransport(server))
+
+    return v20.Context("localhost", token="token", transport=transport)
+
+
+def async_http2_context(server):
+    transport = AsyncHTTP2Transport()
+
+    transport.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(server)
+    )
+
+    return v20.AsyncContext("localhost", token="token", transport=transport)
+
+
+def test_request():
+    server = Server()
+
+    ctx = http2_context(server)
+
+    response = ctx.account.summary(ACCOUNT)
+
+    assert response.get("account", 200).id == ACCOUNT
+
+    request, = server.requests
+
+    assert str(request.url) == \
+        "https://localhost/v3/accounts/{}/summary".format(ACCOUNT)
+    assert request.headers["Authorization"] == "Bearer token"
+
+
+def test_stream():
+    server = Server()
+
+    ctx = http2_context(server)
+
+    response = ctx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+    assert [msg_type for msg_type, msg in response.parts()] == \
+        ["pricing.PricingHeartbeat"] * 3
+
+    assert server.requests[0].url.params["instruments"] == "EUR_USD"
+
+
+@pytest.mark.parametrize("error, expected, timeout_type", [
+    (httpx.ConnectTimeout("timeout"), V20Timeout, "connect"),
+    (httpx.ReadTimeout("timeout"), V20Timeout, "read"),
+    (httpx.ConnectError("refused"), V20ConnectionError, None),
+])
+def test_errors(error, expected, timeout_type):
+    ctx = http2_context(Server(error))
+
+    with pytest.raises(expected) as e:
+        ctx.account.summary(ACCOUNT)
+
+    if timeout_type is not None:
+        assert e.value.type == timeout_type
+
+
+def test_async_request_and_stream(run):
+    server = Server()
+
+    ctx = async_http2_context(server)
+
+    async def requests():
+        response = await ctx.account.summary(ACCOUNT)
+
+        stream = await ctx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+        msg_types = [msg_type async for msg_type, msg in stream.parts()]
+
+        return response, msg_types
+
+    response, msg_types = run(requests())
+
+    assert response.get("account", 200).id == ACCOUNT
+    assert msg_types == ["pricing.PricingHeartbeat"] * 3
+
+
+def test_async_errors(run):
+    ctx = async_http2_context(Server(httpx.ConnectError("refused")))
+
+    with pytest.raises(V20ConnectionError):
+        run(ctx.account.summary(ACCOUNT))
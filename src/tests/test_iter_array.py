@@ -0,0 +1,75 @@
+import pytest
+
+from v20 import json_stream
+
+
+ACCOUNT = "101-001-1-001"
+
+RANGE_PATH = "/v3/accounts/{}/transactions/idrange".format(ACCOUNT)
+
+
+def financing(id):
+    return {
+        "id": str(id),
+        "type": "DAILY_FINANCING",
+        "financing": "0.1000",
+    }
+
+
+def add_range(transport):
+    transport.add_response(
+        "GET",
+        RANGE_PATH,
+        {
+            "transactions": [financing(id) for id in range(1, 6)],
+            "lastTransactionID": "5",
+        }
+    )
+
+
+def test_json_stream_yields_decoded_elements():
+    chunks = [b'{"a": 1, "b": {"c": [{"d": "x"}, ', b'2.5, "\\u00e9"]}}']
+
+    assert list(json_stream.iter_array(chunks, ["b", "c"])) == \
+        [{"d": "x"}, 2.5, u"é"]
+
+
+def test_iter_array(ctx, transport):
+    add_range(transport)
+
+    transactions = list(
+        ctx.iter_array(
+            "transactions",
+            ctx.transaction.range,
+            ACCOUNT,
+            fromID=1,
+            toID=5
+        )
+    )
+
+    assert [t.id for t in transactions] == ["1", "2", "3", "4", "5"]
+    assert transactions[0].type == "DAILY_FINANCING"
+    assert transport.released == 1
+
+
+def test_abandoned_iter_array_releases_the_connection(ctx, transport):
+    add_range(transport)
+
+    transactions = ctx.iter_array(
+        "transactions",
+        ctx.transaction.range,
+        ACCOUNT,
+        fromID=1,
+        toID=5
+    )
+
+    assert next(transactions).id == "1"
+
+    transactions.close()
+
+    assert transport.released == 1
+
+
+def test_async_iter_array_is_not_supported(actx):
+    with pytest.raises(TypeError):
+        actx.iter_array("transactions", actx.transaction.range, ACCOUNT)
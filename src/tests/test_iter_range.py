@@ -0,0 +1,173 @@
+import random
+import threading
+import time
+
+import pytest
+
+from v20 import parallel
+from v20.errors import ResponseUnexpectedStatus
+
+
+ACCOUNT = "101-001-1-001"
+
+LIST_PATH = "/v3/accounts/{}/transactions".format(ACCOUNT)
+
+RANGE_PATH = "/v3/accounts/{}/transactions/idrange".format(ACCOUNT)
+
+PAGE_SIZE = 100
+
+LAST_TRANSACTION_ID = 450
+
+
+class Pages(object):
+    """
+    Answers transaction.list with pages of PAGE_SIZE Transactions, and
+    each page's transaction.range with its Transactions out of order after
+    a random delay
+    """
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_page = None
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+
+    def __call__(self, request):
+        if request.path == LIST_PATH:
+            return 200, "OK", {
+                "pages": [
+                    "https://localhost{}?from={}&to={}&type={}".format(
+                        RANGE_PATH,
+                        fromID,
+                        min(fromID + PAGE_SIZE - 1, LAST_TRANSACTION_ID),
+                        request.params.get("type", "")
+                    )
+                    for fromID in range(1, LAST_TRANSACTION_ID + 1, PAGE_SIZE)
+                ],
+                "lastTransactionID": str(LAST_TRANSACTION_ID),
+            }
+
+        if request.path != RANGE_PATH:
+            return None
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            delay = self._random.uniform(0, 0.05)
+
+        time.sleep(delay)
+
+        with self._lock:
+            self.in_flight -= 1
+
+        fromID = int(request.params["from"])
+        toID = int(request.params["to"])
+
+        if fromID == self.failing_page:
+            return 503, "Service Unavailable", {"errorMessage": "Error"}
+
+        ids = list(range(fromID, toID + 1))
+
+        self._random.shuffle(ids)
+
+        return 200, "OK", {
+            "transactions": [
+                {"id": str(id), "type": "DAILY_FINANCING"} for id in ids
+            ],
+            "lastTransactionID": str(LAST_TRANSACTION_ID),
+        }
+
+
+def test_iter_range(ctx, transport):
+    pages = Pages()
+
+    transport.add_handler(pages)
+
+    transactions = ctx.transaction.iter_range(
+        ACCOUNT,
+        "2018-01-01T00:00:00Z",
+        "2018-02-01T00:00:00Z",
+        max_workers=3,
+        pageSize=PAGE_SIZE,
+        type=["DAILY_FINANCING", "ORDER_FILL"]
+    )
+
+    assert [int(t.id) for t in transactions] == \
+        list(range(1, LAST_TRANSACTION_ID + 1))
+
+    assert 1 < pages.max_in_flight <= 3
+
+    method, path, params = transport.requests[0]
+
+    assert path == LIST_PATH
+    assert params["type"] == "DAILY_FINANCING,ORDER_FILL"
+    assert params["pageSize"] == str(PAGE_SIZE)
+
+    assert all(
+        params["type"] == "DAILY_FINANCING,ORDER_FILL"
+        for method, path, params in transport.requests[1:]
+    )
+
+
+def test_iter_range_page_failure(ctx, transport):
+    pages = Pages()
+    pages.failing_page = 201
+
+    transport.add_handler(pages)
+
+    transactions = ctx.transaction.iter_range(
+        ACCOUNT,
+        "2018-01-01T00:00:00Z",
+        "2018-02-01T00:00:00Z",
+        pageSize=PAGE_SIZE
+    )
+
+    with pytest.raises(ResponseUnexpectedStatus):
+        for transaction in transactions:
+            assert int(transaction.id) < 201
+
+
+def test_ordered_map_is_ordered_and_bounded():
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    def square(i):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(
+                state["max_in_flight"],
+                state["in_flight"]
+            )
+
+        time.sleep(0.01 * (i % 3))
+
+        with lock:
+            state["in_flight"] -= 1
+
+        return i * i
+
+    assert list(parallel.ordered_map(square, range(20), 4)) == \
+        [i * i for i in range(20)]
+
+    assert state["max_in_flight"] <= 4
+
+
+def test_closed_ordered_map_cancels_calls():
+    called = []
+
+    def call(i):
+        called.append(i)
+
+        time.sleep(0.01)
+
+        return i
+
+    results = parallel.ordered_map(call, range(100), 2)
+
+    assert next(results) == 0
+
+    results.close()
+
+    time.sleep(0.05)
+
+    assert len(called) < 10
@@ -0,0 +1,120 @@
+import pytest
+
+import v20
+
+
+ACCOUNT = "101-001-1-001"
+
+
+def account():
+    return {
+        "id": ACCOUNT,
+        "currency": "USD",
+        "balance": "1000.5000",
+        "NAV": "1001.2500",
+        "openTradeCount": 2,
+        "trades": [
+            {
+                "id": str(id),
+                "instrument": "EUR_USD",
+                "price": "1.10000",
+                "currentUnits": "100",
+                "state": "OPEN",
+            }
+            for id in [10, 11]
+        ],
+        "orders": [
+            {
+                "id": "12",
+                "type": "LIMIT",
+                "instrument": "EUR_USD",
+                "units": "100",
+                "price": "1.05000",
+            },
+            {
+                "id": "13",
+                "type": "STOP_LOSS",
+                "tradeID": "10",
+                "price": "1.00000",
+            },
+        ],
+        "positions": [
+            {
+                "instrument": "EUR_USD",
+                "long": {"units": "200", "averagePrice": "1.10000"},
+                "short": {"units": "0"},
+            },
+        ],
+    }
+
+
+def contexts(transport, **kwargs):
+    return [
+        v20.Context(
+            "localhost",
+            transport=transport,
+            lazy_entities=lazy,
+            **kwargs
+        )
+        for lazy in [False, True]
+    ]
+
+
+@pytest.mark.parametrize("as_float", [True, False])
+def test_lazy_entity_matches_eager(transport, as_float):
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}".format(ACCOUNT),
+        {"account": account(), "lastTransactionID": "13"}
+    )
+
+    eager, lazy = [
+        ctx.account.get(ACCOUNT).get("account", 200)
+        for ctx in contexts(transport, decimal_number_as_float=as_float)
+    ]
+
+    assert lazy.dict() == eager.dict()
+
+    assert lazy.balance == eager.balance
+    assert isinstance(lazy.balance, float if as_float else str)
+
+    assert [type(o).__name__ for o in lazy.orders] == \
+        ["LimitOrder", "StopLossOrder"]
+
+    assert lazy.positions[0].long.averagePrice == \
+        eager.positions[0].long.averagePrice
+
+
+def test_fields_are_converted_once_when_read(transport):
+    ctx = contexts(transport)[1]
+
+    data = account()
+
+    entity = ctx.account.Account.from_dict(data, ctx)
+
+    #
+    # The dict is wrapped rather than copied, so a field is only converted
+    # from it when first read
+    #
+    data["balance"] = "2000.0000"
+
+    assert entity.balance == 2000.0
+
+    trades = entity.trades
+
+    assert entity.trades is trades
+    assert [t.id for t in trades] == ["10", "11"]
+    assert trades[0].price == 1.1
+
+
+def test_missing_fields_default_as_eager(transport):
+    eager, lazy = [
+        ctx.account.Account.from_dict({"id": ACCOUNT}, ctx)
+        for ctx in contexts(transport)
+    ]
+
+    assert lazy.trades == eager.trades
+    assert lazy.balance is None
+
+    with pytest.raises(AttributeError):
+        lazy.notAField
@@ -0,0 +1,54 @@
+from v20.line_reader import LineReader
+from v20.mock import PricingStream
+
+
+ACCOUNT = "101-001-1-001"
+
+INSTRUMENTS = ["EUR_USD", "USD_JPY"]
+
+
+def test_lines_across_chunks():
+    chunks = [b"one\ntw", b"", b"o\n\nthr", b"ee\r\n", b"\r\n", b"four"]
+
+    assert list(LineReader(chunks)) == [b"one", b"two", b"three\r", b"four"]
+
+
+def test_batches_hold_the_lines_of_a_chunk():
+    chunks = [b"a\nb\nc", b"\n", b"d\ne\n", b"\n\n", b"f\n"]
+
+    assert list(LineReader(chunks).batches()) == \
+        [[b"a", b"b"], [b"c"], [b"d", b"e"], [b"f"]]
+
+
+def add_pricing(transport):
+    transport.add_stream(
+        "/v3/accounts/{}/pricing/stream".format(ACCOUNT),
+        PricingStream(INSTRUMENTS, count=12, batch_size=4)
+    )
+
+
+def test_stream_batches(ctx, transport):
+    add_pricing(transport)
+
+    response = ctx.pricing.stream(ACCOUNT, instruments=",".join(INSTRUMENTS))
+
+    batches = list(response.batches())
+
+    assert [len(batch) for batch in batches] == [1, 4, 4, 4]
+    assert batches[0][0][0] == "pricing.PricingHeartbeat"
+
+    ticks = [msg for batch in batches[1:] for msg_type, msg in batch]
+
+    assert [tick.instrument for tick in ticks] == INSTRUMENTS * 6
+    assert all(tick.asks[0].price > tick.bids[0].price for tick in ticks)
+
+
+def test_stream_parts_match_batches(ctx, transport):
+    add_pricing(transport)
+
+    response = ctx.pricing.stream(ACCOUNT, instruments=",".join(INSTRUMENTS))
+
+    msg_types = [msg_type for msg_type, msg in response.parts()]
+
+    assert msg_types == \
+        ["pricing.PricingHeartbeat"] + ["pricing.ClientPrice"] * 12
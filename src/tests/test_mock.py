@@ -0,0 +1,87 @@
+import pytest
+
+import v20
+from v20.errors import V20ConnectionError
+from v20.mock import MockTransport, PricingStream, TransactionStream
+
+
+ACCOUNT = "101-001-1-001"
+
+
+def add_summary(transport):
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}/summary".format(ACCOUNT),
+        {"account": {"id": ACCOUNT}, "lastTransactionID": "7"}
+    )
+
+
+def test_context_replays_responses(ctx, transport):
+    add_summary(transport)
+
+    response = ctx.account.summary(ACCOUNT)
+
+    assert response.status == 200
+    assert response.get("lastTransactionID", 200) == "7"
+
+    assert ctx.account.get(ACCOUNT).status == 404
+
+
+def test_async_context_replays_responses(actx, transport, run):
+    add_summary(transport)
+
+    response = run(actx.account.summary(ACCOUNT))
+
+    assert response.status == 200
+    assert response.get("account", 200).id == ACCOUNT
+
+    assert transport.requests == [
+        ("GET", "/v3/accounts/{}/summary".format(ACCOUNT), {})
+    ]
+
+
+def test_async_context_rejects_sync_transport():
+    with pytest.raises(ValueError):
+        v20.AsyncContext("localhost", transport=MockTransport())
+
+
+def test_async_context_streams(actx, transport, run):
+    transport.add_stream(
+        "/v3/accounts/{}/pricing/stream".format(ACCOUNT),
+        PricingStream(["EUR_USD", "USD_JPY"], count=10, batch_size=3)
+    )
+
+    async def stream():
+        response = await actx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+        return [msg_type async for msg_type, msg in response.parts()]
+
+    msg_types = run(stream())
+
+    assert msg_types[0] == "pricing.PricingHeartbeat"
+    assert msg_types.count("pricing.ClientPrice") == 10
+
+
+def test_async_context_stream_drop(actx, transport, run):
+    transport.add_stream(
+        "/v3/accounts/{}/transactions/stream".format(ACCOUNT),
+        TransactionStream(ACCOUNT, drop_after=4)
+    )
+
+    received = []
+
+    async def stream():
+        response = await actx.transaction.stream(ACCOUNT)
+
+        async for msg_type, msg in response.parts():
+            received.append(msg_type)
+
+    with pytest.raises(V20ConnectionError):
+        run(stream())
+
+    assert received.count("transaction.Transaction") == 4
+
+    response = run(actx.transaction.since(ACCOUNT, id=2))
+
+    assert [t.id for t in response.get("transactions", 200)] == \
+        ["3", "4", "5"]
@@ -0,0 +1,221 @@
+import pytest
+
+from v20.call import Call
+
+
+ACCOUNT = "101-001-1-001"
+
+ORDERS_PATH = "/v3/accounts/{}/orders".format(ACCOUNT)
+
+
+def market_order(units):
+    return {
+        "type": "MARKET",
+        "instrument": "EUR_USD",
+        "units": str(units),
+    }
+
+
+def created(id):
+    return {
+        "orderCreateTransaction": {
+            "id": str(id),
+            "type": "MARKET_ORDER",
+            "instrument": "EUR_USD",
+        },
+        "lastTransactionID": str(id),
+    }
+
+
+def add_orders(transport, bodies):
+    for body in bodies:
+        transport.add_response("POST", ORDERS_PATH, body, status=201)
+
+
+def test_create_many_reports_any_error(ctx, transport):
+    add_orders(transport, [created(1), b"{not json", created(3)])
+
+    result = ctx.order.create_many(
+        ACCOUNT,
+        [market_order(units) for units in [1, 2, 3]],
+        max_workers=1,
+        rate=None
+    )
+
+    assert len(result.successes()) == 2
+    assert len(result.failures()) == 1
+    assert isinstance(result[1], ValueError)
+    assert result[2].get("orderCreateTransaction", 201).id == "3"
+
+
+def test_create_many_cannot_be_deferred(ctx):
+    with pytest.raises(TypeError):
+        Call(ctx.order.create_many, ACCOUNT, [])
+
+
+def test_async_create_many_sends_every_order(actx, transport, run):
+    add_orders(transport, [created(id) for id in [1, 2, 3]])
+
+    result = run(
+        actx.order.create_many(
+            ACCOUNT,
+            [market_order(units) for units in [1, 2, 3]]
+        )
+    )
+
+    assert result.ok
+
+    assert len(transport.requests) == 3
+
+    assert sorted(
+        response.get("orderCreateTransaction", 201).id
+        for response in result
+    ) == ["1", "2", "3"]
+
+
+def add_reconcile(transport):
+    transport.add_response(
+        "POST",
+        ORDERS_PATH,
+        {"errorMessage": "Service Unavailable"},
+        status=503
+    )
+
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}/transactions/sinceid".format(ACCOUNT),
+        {
+            "transactions": [
+                {
+                    "id": "11",
+                    "type": "MARKET_ORDER",
+                    "instrument": "EUR_USD",
+                    "units": "1",
+                    "clientExtensions": {"id": "client-1"},
+                },
+                {
+                    "id": "12",
+                    "type": "ORDER_FILL",
+                    "orderID": "11",
+                    "instrument": "EUR_USD",
+                    "units": "1",
+                },
+            ],
+            "lastTransactionID": "12",
+        }
+    )
+
+
+def reconciled_order():
+    order = market_order(1)
+
+    order["clientExtensions"] = {"id": "client-1"}
+
+    return order
+
+
+def test_create_reconciled_finds_order(ctx, transport):
+    add_reconcile(transport)
+
+    response = ctx.order.create_reconciled(
+        ACCOUNT,
+        reconciled_order(),
+        lastTransactionID="10",
+        settle_delay=0
+    )
+
+    assert response.status == 201
+    assert response.reason == "Reconciled"
+    assert response.get("orderFillTransaction", 201).id == "12"
+
+
+def test_async_create_reconciled_finds_order(actx, transport, run):
+    add_reconcile(transport)
+
+    response = run(
+        actx.order.create_reconciled(
+            ACCOUNT,
+            reconciled_order(),
+            lastTransactionID="10",
+            settle_delay=0
+        )
+    )
+
+    assert response.status == 201
+    assert response.reason == "Reconciled"
+    assert response.get("orderFillTransaction", 201).id == "12"
+
+    assert [method for method, path, params in transport.requests] == \
+        ["POST", "GET"]
+
+
+def test_async_create_reconciled_returns_response(actx, transport, run):
+    add_orders(transport, [created(5)])
+
+    response = run(
+        actx.order.create_reconciled(
+            ACCOUNT,
+            market_order(1),
+            lastTransactionID="4"
+        )
+    )
+
+    assert response.status == 201
+    assert response.get("orderCreateTransaction", 201).id == "5"
+
+
+def test_create_reconciled_pages_transactions(ctx, transport):
+    transport.add_response(
+        "POST",
+        ORDERS_PATH,
+        {"errorMessage": "Service Unavailable"},
+        status=503
+    )
+
+    since_path = "/v3/accounts/{}/transactions/sinceid".format(ACCOUNT)
+
+    #
+    # The Order's Transaction is on the second page
+    #
+    transport.add_response(
+        "GET",
+        since_path,
+        {
+            "transactions": [{"id": "11", "type": "DAILY_FINANCING"}],
+            "lastTransactionID": "12",
+        },
+        params={"id": "10"}
+    )
+
+    transport.add_response(
+        "GET",
+        since_path,
+        {
+            "transactions": [
+                {
+                    "id": "12",
+                    "type": "MARKET_ORDER",
+                    "instrument": "EUR_USD",
+                    "units": "1",
+                    "clientExtensions": {"id": "client-1"},
+                },
+            ],
+            "lastTransactionID": "12",
+        },
+        params={"id": "11"}
+    )
+
+    response = ctx.order.create_reconciled(
+        ACCOUNT,
+        reconciled_order(),
+        lastTransactionID="10",
+        settle_delay=0
+    )
+
+    assert response.reason == "Reconciled"
+    assert response.get("orderCreateTransaction", 201).id == "12"
+
+    assert [
+        params for method, path, params in transport.requests
+        if path == since_path
+    ] == [{"id": "10"}, {"id": "11"}]
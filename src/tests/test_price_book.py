@@ -0,0 +1,57 @@
+from v20.mock import PricingStream
+from v20.price_book import PriceBook
+
+
+ACCOUNT = "101-001-1-001"
+
+INSTRUMENTS = ["EUR_USD", "USD_JPY", "GBP_USD"]
+
+
+def add_pricing(transport):
+    transport.add_stream(
+        "/v3/accounts/{}/pricing/stream".format(ACCOUNT),
+        PricingStream(INSTRUMENTS, count=30, batch_size=10)
+    )
+
+
+def test_feed(ctx, transport):
+    add_pricing(transport)
+
+    book = PriceBook()
+
+    book.feed(ctx.pricing.stream(ACCOUNT, instruments=",".join(INSTRUMENTS)))
+
+    assert sorted(book.instruments()) == sorted(INSTRUMENTS)
+
+    #
+    # Each batch of 10 prices updates each of the 3 instruments once
+    #
+    assert book.version == 9
+
+
+def test_afeed(actx, transport, run):
+    add_pricing(transport)
+
+    book = PriceBook()
+
+    updates = []
+
+    book.add_listener(updates.append)
+
+    async def feed():
+        response = await actx.pricing.stream(
+            ACCOUNT,
+            instruments=",".join(INSTRUMENTS)
+        )
+
+        await book.afeed(response)
+
+    run(feed())
+
+    assert sorted(book.instruments()) == sorted(INSTRUMENTS)
+    assert book.version == 9
+    assert len(updates) == 9
+
+    snapshot = book.get("EUR_USD")
+
+    assert snapshot.ask > snapshot.bid
@@ -0,0 +1,133 @@
+import os
+import time
+import ujson as json
+
+from v20.mock import PricingStream
+from v20.price_hub import PriceHub, PriceHubClient
+
+
+ACCOUNT = "101-001-1-001"
+
+
+def price(instrument, bid):
+    data = {
+        "type": "PRICE",
+        "instrument": instrument,
+        "bids": [{"price": bid, "liquidity": 1000000}],
+    }
+
+    return data, json.dumps(data).encode("utf-8")
+
+
+def test_slow_subscriber_gets_latest_prices(ctx):
+    hub = PriceHub(ctx, ACCOUNT, ["EUR_USD", "USD_JPY"])
+
+    subscription = hub.subscribe()
+
+    hub.publish([price("EUR_USD", "1.10000"), price("USD_JPY", "110.000")])
+    hub.publish([price("EUR_USD", "1.10010")])
+    hub.publish([price("EUR_USD", "1.10020")])
+
+    assert [(p["instrument"], p["bids"][0]["price"])
+            for p in subscription.get()] == \
+        [("USD_JPY", "110.000"), ("EUR_USD", "1.10020")]
+
+    assert subscription.dropped == 2
+
+    assert subscription.get(timeout=0.01) == []
+
+
+def test_subscribers_are_independent(ctx):
+    hub = PriceHub(ctx, ACCOUNT, ["EUR_USD", "USD_JPY"])
+
+    hub.publish([price("EUR_USD", "1.10000"), price("USD_JPY", "110.000")])
+
+    #
+    # A new subscription starts with the latest prices, filtered by its
+    # instruments
+    #
+    everything = hub.subscribe()
+    yen = hub.subscribe(["USD_JPY"])
+
+    assert [p["instrument"] for p in everything.get()] == \
+        ["EUR_USD", "USD_JPY"]
+
+    hub.publish([price("EUR_USD", "1.10010")])
+
+    assert [p["instrument"] for p in everything.get()] == ["EUR_USD"]
+    assert [p["bids"][0]["price"] for p in yen.get()] == ["110.000"]
+    assert yen.get(timeout=0.01) == []
+
+
+def test_closed_subscription(ctx):
+    hub = PriceHub(ctx, ACCOUNT, ["EUR_USD"])
+
+    subscription = hub.subscribe()
+
+    hub.publish([price("EUR_USD", "1.10000")])
+
+    subscription.close()
+
+    hub.publish([price("EUR_USD", "1.10010")])
+
+    assert [p["bids"][0]["price"] for p in subscription] == ["1.10000"]
+    assert subscription.get() is None
+
+
+def test_upstream_prices_are_fanned_out(ctx, transport):
+    instruments = ["EUR_USD", "USD_JPY"]
+
+    transport.add_stream(
+        "/v3/accounts/{}/pricing/stream".format(ACCOUNT),
+        PricingStream(instruments, rate=200)
+    )
+
+    hub = PriceHub(ctx, ACCOUNT, instruments)
+
+    subscriptions = [hub.subscribe(), hub.subscribe(["USD_JPY"])]
+
+    thread = hub.start()
+
+    try:
+        received = [s.get(timeout=5) for s in subscriptions]
+    finally:
+        hub.stop()
+
+    thread.join(5)
+
+    assert all(p["type"] == "PRICE" for p in received[0])
+    assert set(p["instrument"] for p in received[1]) == set(["USD_JPY"])
+
+    #
+    # The hub holds a single upstream stream
+    #
+    assert transport.opened == 1
+
+
+def test_unix_socket(ctx, tmpdir):
+    path = os.path.join(str(tmpdir), "hub.sock")
+
+    hub = PriceHub(ctx, ACCOUNT, ["EUR_USD", "USD_JPY"])
+
+    hub.serve_unix(path)
+
+    client = PriceHubClient(path, ["EUR_USD"])
+
+    try:
+        #
+        # Wait for the client's subscription before publishing
+        #
+        deadline = time.time() + 5
+
+        while len(hub._subscriptions) == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+        hub.publish([price("USD_JPY", "110.000"), price("EUR_USD", "1.1")])
+
+        prices = next(client.batches())
+    finally:
+        client.close()
+        hub.stop()
+
+    assert [(p["instrument"], p["bids"][0]["price"]) for p in prices] == \
+        [("EUR_USD", "1.1")]
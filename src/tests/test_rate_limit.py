@@ -0,0 +1,104 @@
+import asyncio
+
+from concurrent.futures import ThreadPoolExecutor
+
+import v20
+from v20.aio_mock import AsyncMockTransport
+from v20.call import Call
+from v20.rate_limit import PRIORITY_LOW, PRIORITY_NORMAL, RequestScheduler
+
+
+ACCOUNT = "101-001-1-001"
+
+
+def test_async_order_is_not_queued_behind_reads(transport):
+    transport.add_response(
+        "GET",
+        "/v3/accounts/{}/summary".format(ACCOUNT),
+        {"account": {"id": ACCOUNT}, "lastTransactionID": "1"}
+    )
+
+    transport.add_response(
+        "POST",
+        "/v3/accounts/{}/orders".format(ACCOUNT),
+        {"lastTransactionID": "2"},
+        status=201
+    )
+
+    ctx = v20.AsyncContext(
+        "localhost",
+        transport=AsyncMockTransport(transport),
+        scheduler=RequestScheduler(rate=50, burst=1)
+    )
+
+    completed = []
+
+    async def read():
+        await ctx.account.summary(ACCOUNT)
+
+        completed.append("read")
+
+    async def order():
+        #
+        # Submitted once the reads are all waiting for the rate limit
+        #
+        await asyncio.sleep(0.05)
+
+        await ctx.order.market(ACCOUNT, instrument="EUR_USD", units=1)
+
+        completed.append("order")
+
+    async def main():
+        await asyncio.gather(*([read() for i in range(40)] + [order()]))
+
+    loop = asyncio.new_event_loop()
+
+    #
+    # Waiting for the rate limit must not take up executor threads
+    #
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.close()
+
+    assert len(completed) == 41
+    assert completed.index("order") < 10
+
+
+def test_priority_is_local_to_a_task(ctx, run):
+    scheduler = RequestScheduler()
+
+    request = Call(ctx.account.summary, ACCOUNT).prepare(ctx)
+
+    priorities = {}
+
+    async def low():
+        with scheduler.priority(PRIORITY_LOW):
+            await asyncio.sleep(0.02)
+
+            waiter = scheduler.enqueue(request)
+
+            priorities["low"] = waiter.key[0]
+
+            scheduler.cancel(waiter)
+
+    async def normal():
+        #
+        # Runs while the other task is inside its priority block
+        #
+        await asyncio.sleep(0.01)
+
+        waiter = scheduler.enqueue(request)
+
+        priorities["normal"] = waiter.key[0]
+
+        scheduler.cancel(waiter)
+
+    async def main():
+        await asyncio.gather(low(), normal())
+
+    run(main())
+
+    assert priorities == {"low": PRIORITY_LOW, "normal": PRIORITY_NORMAL}
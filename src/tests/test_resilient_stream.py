@@ -0,0 +1,140 @@
+import pytest
+
+import v20
+from v20.errors import ResponseUnexpectedStatus
+from v20.mock import PricingStream, TransactionStream
+from v20.price_hub import PriceHub
+from v20.resilient_stream import (
+    Backoff,
+    ResilientStream,
+    ResilientTransactionStream,
+)
+
+
+ACCOUNT = "101-001-1-001"
+
+SINCE_PATH = "/v3/accounts/{}/transactions/sinceid".format(ACCOUNT)
+
+PRICING_PATH = "/v3/accounts/{}/pricing/stream".format(ACCOUNT)
+
+
+def fail_since(transport, status, failures):
+    """
+    Answer the first transaction.since requests with an error status
+    """
+    remaining = [failures]
+
+    def respond(request):
+        if request.path == SINCE_PATH and remaining[0] > 0:
+            remaining[0] -= 1
+
+            return status, "Error", {"errorMessage": "Error"}
+
+        return None
+
+    transport.add_handler(respond)
+
+
+def stream(transport):
+    transport.add_stream(
+        "/v3/accounts/{}/transactions/stream".format(ACCOUNT),
+        TransactionStream(ACCOUNT, lastTransactionID=3, count=4)
+    )
+
+    ctx = v20.Context("localhost", transport=transport)
+
+    return ResilientTransactionStream(
+        ctx,
+        ACCOUNT,
+        lastTransactionID="3",
+        backoff=Backoff(0, 0),
+        max_retries=3
+    )
+
+
+def transaction_ids(stream, count):
+    ids = []
+
+    for msg_type, msg in stream:
+        if msg_type == "transaction.Transaction":
+            ids.append(msg.id)
+
+        if len(ids) == count:
+            return ids
+
+
+def test_since_retries_unavailable(transport):
+    fail_since(transport, 503, 2)
+
+    assert transaction_ids(stream(transport), 4) == ["4", "5", "6", "7"]
+
+    assert [
+        path for method, path, params in transport.requests
+    ].count(SINCE_PATH) == 3
+
+
+def test_since_raises_client_error(transport):
+    fail_since(transport, 400, 1)
+
+    with pytest.raises(ResponseUnexpectedStatus):
+        transaction_ids(stream(transport), 4)
+
+
+def test_since_failure_releases_connection(transport):
+    fail_since(transport, 400, 1)
+
+    with pytest.raises(ResponseUnexpectedStatus):
+        transaction_ids(stream(transport), 4)
+
+    assert transport.opened == 1
+    assert transport.released == 1
+
+
+def test_ended_and_abandoned_streams_release_connections(ctx, transport):
+    transport.add_stream(
+        PRICING_PATH,
+        PricingStream(["EUR_USD"], count=2, batch_size=1)
+    )
+
+    batches = ResilientStream(
+        ctx,
+        ctx.pricing.stream,
+        ACCOUNT,
+        instruments="EUR_USD",
+        backoff=Backoff(0, 0)
+    ).batches()
+
+    #
+    # Each connection sends a heartbeat and two prices before the server
+    # ends it, so the fourth batch is read from a second connection
+    #
+    for i in range(4):
+        next(batches)
+
+    batches.close()
+
+    assert transport.opened == 2
+    assert transport.released == 2
+
+
+def test_price_hub_stop_closes_upstream(ctx, transport):
+    transport.add_stream(
+        PRICING_PATH,
+        PricingStream(["EUR_USD"], rate=100)
+    )
+
+    hub = PriceHub(ctx, ACCOUNT, ["EUR_USD"])
+
+    subscription = hub.subscribe()
+
+    thread = hub.start()
+
+    assert subscription.get(timeout=5)
+
+    hub.stop()
+
+    thread.join(5)
+
+    assert not thread.is_alive()
+    assert transport.opened == 1
+    assert transport.released >= 1
@@ -0,0 +1,41 @@
+import v20
+from v20.mock import PricingStream
+from v20.resilient_stream import Backoff
+from v20.retry import RetryPolicy
+
+
+ACCOUNT = "101-001-1-001"
+
+
+def test_retried_stream_is_closed(transport):
+    transport.add_stream(
+        "/v3/accounts/{}/pricing/stream".format(ACCOUNT),
+        PricingStream(["EUR_USD"], count=0)
+    )
+
+    #
+    # The stream is refused once before it is served
+    #
+    refused = []
+
+    def refuse(request):
+        if not refused:
+            refused.append(request)
+
+            return 503, "Service Unavailable", {"errorMessage": "Error"}
+
+        return None
+
+    transport.add_handler(refuse)
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        retry_policy=RetryPolicy(backoff=Backoff(0, 0))
+    )
+
+    response = ctx.pricing.stream(ACCOUNT, instruments="EUR_USD")
+
+    assert response.status == 200
+    assert transport.opened == 2
+    assert transport.released == 1
@@ -0,0 +1,37 @@
+import datetime
+import warnings
+
+from v20 import timestamps
+
+
+def test_format_ns():
+    ns = 1514764800123456789
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        assert timestamps.format_ns(ns) == "2018-01-01T00:00:00.123456789Z"
+
+    assert timestamps.format_ns(ns, "UNIX") == "1514764800.123456789"
+    assert timestamps.format_ns(0) == "1970-01-01T00:00:00.000000000Z"
+
+
+def test_round_trip():
+    for value in [
+        "2018-06-30T23:59:59.500000000Z",
+        "1530403199.500000000",
+    ]:
+        ns = timestamps.to_ns(value)
+
+        assert ns == 1530403199500000000
+        assert value in [
+            timestamps.format_ns(ns),
+            timestamps.format_ns(ns, "UNIX"),
+        ]
+
+
+def test_to_ns_of_datetimes():
+    assert timestamps.to_ns(datetime.datetime(2018, 1, 1)) == \
+        1514764800000000000
+
+    assert timestamps.to_ns(1514764800.5) == 1514764800500000000
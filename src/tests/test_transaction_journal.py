@@ -0,0 +1,167 @@
+import threading
+import time
+import ujson as json
+
+import v20
+from v20 import timestamps
+from v20.call import Call
+from v20.transaction_journal import AccountJournal, TransactionJournal
+
+
+ACCOUNT = "101-001-1-001"
+
+LAST_TRANSACTION_ID = 3000
+
+
+class Transactions(object):
+    """
+    Answers transaction.range and transaction.since requests for an Account
+    with Transactions 1 to LAST_TRANSACTION_ID after a delay, and records
+    the largest number of requests in flight at once
+    """
+    def __init__(self, latency=0):
+        self.latency = latency
+        self.status = 200
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        time.sleep(self.latency)
+
+        if request.path.endswith("/sinceid"):
+            fromID = int(request.params["id"]) + 1
+            toID = LAST_TRANSACTION_ID
+        else:
+            fromID = int(request.params["from"])
+            toID = min(int(request.params["to"]), LAST_TRANSACTION_ID)
+
+        body = {
+            "transactions": [
+                transaction(id) for id in range(fromID, toID + 1)
+            ],
+            "lastTransactionID": str(LAST_TRANSACTION_ID),
+        }
+
+        with self._lock:
+            self.in_flight -= 1
+
+        if self.status != 200:
+            body = {"errorMessage": "Error"}
+
+        return self.status, "OK", body
+
+
+def transaction(id):
+    return {
+        "id": str(id),
+        "time": timestamps.format_ns(id * 1000000000),
+        "type": "DAILY_FINANCING",
+    }
+
+
+def test_fetches_run_concurrently(tmpdir, transport):
+    transactions = Transactions(latency=0.1)
+
+    transport.add_handler(transactions)
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        transaction_journal=TransactionJournal(str(tmpdir))
+    )
+
+    ctx.transaction.range(ACCOUNT, fromID=1, toID=1)
+
+    results = {}
+
+    def fetch(fromID):
+        response = ctx.transaction.range(
+            ACCOUNT,
+            fromID=fromID,
+            toID=fromID + 999
+        )
+
+        results[fromID] = [
+            int(t.id) for t in response.get("transactions", 200)
+        ]
+
+    threads = [
+        threading.Thread(target=fetch, args=(fromID,))
+        for fromID in [1, 1001, 2001]
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert transactions.max_in_flight > 1
+
+    for fromID, ids in results.items():
+        assert ids == list(range(fromID, fromID + 1000))
+
+    journal = ctx.transaction_journal.journal(ACCOUNT)
+
+    assert journal.head == LAST_TRANSACTION_ID
+    assert [r[0] for r in journal.records(1, LAST_TRANSACTION_ID)] == \
+        list(range(1, LAST_TRANSACTION_ID + 1))
+
+
+def test_since_does_not_change_the_request(tmpdir, transport):
+    transactions = Transactions()
+
+    transport.add_handler(transactions)
+
+    ctx = v20.Context(
+        "localhost",
+        transport=transport,
+        transaction_journal=TransactionJournal(str(tmpdir))
+    )
+
+    ctx.transaction.range(ACCOUNT, fromID=1, toID=10)
+
+    request = Call(ctx.transaction.since, ACCOUNT, id=5).prepare(ctx)
+
+    response = ctx.transaction_journal.request(ctx, request)
+
+    assert request.params == {"id": "5"}
+    assert transport.requests[-1][2] == {"id": "10"}
+
+    ids = [t["id"] for t in json.loads(response.raw_body)["transactions"]]
+
+    assert ids == [str(id) for id in range(6, LAST_TRANSACTION_ID + 1)]
+
+    transactions.status = 503
+
+    response = ctx.transaction_journal.request(ctx, request)
+
+    assert response.status == 503
+    assert request.params == {"id": "5"}
+
+
+def test_partial_index_record_is_discarded(tmpdir):
+    path = str(tmpdir)
+
+    journal = AccountJournal(path, 1024)
+
+    journal.append([transaction(id) for id in range(1, 4)], 3)
+
+    #
+    # A crash in the middle of writing a record of the index
+    #
+    with open(journal._index_path(), "ab") as f:
+        f.write(b"\x04\x00\x00")
+
+    journal = AccountJournal(path, 1024)
+
+    journal.append([transaction(id) for id in range(4, 6)], 5)
+
+    assert [r[0] for r in journal.records(1, 5)] == [1, 2, 3, 4, 5]
+    assert [json.loads(line)["id"] for line in journal.read(1, 5)] == \
+        ["1", "2", "3", "4", "5"]
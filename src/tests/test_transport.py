@@ -0,0 +1,154 @@
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+import v20
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Answers every request with an empty JSON object over a keep-alive
+    connection, counting the connections open
+    """
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        BaseHTTPRequestHandler.setup(self)
+
+        with self.server.lock:
+            self.server.open += 1
+
+    def finish(self):
+        BaseHTTPRequestHandler.finish(self)
+
+        with self.server.lock:
+            self.server.open -= 1
+
+    def do_HEAD(self):
+        #
+        # Overlap the requests of a prewarm so each gets a connection
+        #
+        time.sleep(0.1)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+
+    def do_GET(self):
+        self.do_HEAD()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+def serve():
+    server = Server(("127.0.0.1", 0), Handler)
+    server.lock = threading.Lock()
+    server.open = 0
+
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+
+    return server
+
+
+def open_connections(server, expected):
+    """
+    Returns:
+        The number of connections open to the server, once it is the
+        expected number or a second has passed
+    """
+    deadline = time.time() + 1.0
+
+    while server.open != expected and time.time() < deadline:
+        time.sleep(0.01)
+
+    return server.open
+
+
+def context(server, **kwargs):
+    return v20.Context(
+        "127.0.0.1",
+        server.server_address[1],
+        ssl=False,
+        **kwargs
+    )
+
+
+def test_close_idle_connections():
+    server = serve()
+
+    try:
+        ctx = context(server)
+
+        ctx.prewarm(4)
+
+        assert open_connections(server, 4) == 4
+
+        ctx.close_idle_connections()
+
+        assert open_connections(server, 0) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_quiet_context_closes_idle_connections():
+    server = serve()
+
+    try:
+        ctx = context(server, idle_timeout=0.3)
+
+        ctx.prewarm(4)
+
+        assert open_connections(server, 4) == 4
+
+        ctx.account.list()
+
+        #
+        # No further request is made
+        #
+        time.sleep(0.6)
+
+        assert open_connections(server, 0) == 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_close_idle_connections_if_urllib3_pools_change():
+    server = serve()
+
+    try:
+        ctx = context(server)
+
+        ctx.prewarm(2)
+
+        assert open_connections(server, 2) == 2
+
+        def close_idle(poolmanager):
+            raise AttributeError("pools")
+
+        ctx.transport._close_idle = close_idle
+
+        ctx.close_idle_connections()
+
+        assert open_connections(server, 0) == 0
+
+        ctx.account.list()
+    finally:
+        server.shutdown()
+        server.server_close()
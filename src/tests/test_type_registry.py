@@ -0,0 +1,92 @@
+import pytest
+
+from v20 import order, transaction
+
+
+FILL = {
+    "id": "2",
+    "type": "ORDER_FILL",
+    "orderID": "1",
+    "instrument": "EUR_USD",
+    "units": "100",
+    "price": "1.10000",
+}
+
+
+@pytest.fixture
+def restore_fill():
+    """
+    Registries are process-wide, so the ORDER_FILL handler is put back
+    """
+    yield
+
+    transaction.transaction_types.register(
+        "ORDER_FILL",
+        transaction.OrderFillTransaction
+    )
+
+
+def test_types_are_dispatched(ctx):
+    Transaction = ctx.transaction.Transaction
+    Order = ctx.order.Order
+
+    assert type(Transaction.from_dict(FILL, ctx)).__name__ == \
+        "OrderFillTransaction"
+
+    assert type(
+        Order.from_dict({"type": "LIMIT", "price": "1.1"}, ctx)
+    ).__name__ == "LimitOrder"
+
+    #
+    # A type without a handler is built as the base class
+    #
+    assert type(
+        Transaction.from_dict({"id": "3", "type": "NEW_TYPE"}, ctx)
+    ) is Transaction
+
+
+def test_every_transaction_type_is_registered(ctx):
+    types = ctx.transaction.types
+
+    assert types is transaction.transaction_types
+    assert ctx.order.types is order.order_types
+
+    for name in types.types():
+        entity = ctx.transaction.Transaction.from_dict({"type": name}, ctx)
+
+        assert entity.type == name
+
+
+def test_register_handler(ctx, restore_fill):
+    seen = []
+
+    def fill(data, ctx):
+        seen.append(data["id"])
+
+        return data["id"]
+
+    ctx.transaction.types.register("ORDER_FILL", fill)
+
+    assert ctx.transaction.Transaction.from_dict(FILL, ctx) == "2"
+    assert seen == ["2"]
+
+
+def test_skip_builds_lazily(ctx, restore_fill):
+    ctx.transaction.types.skip("ORDER_FILL")
+
+    data = dict(FILL)
+
+    entity = ctx.transaction.Transaction.from_dict(data, ctx)
+
+    assert type(entity) is transaction.OrderFillTransaction
+    assert entity._lazy_data is data
+    assert entity.price == 1.1
+
+
+def test_unregister(ctx, restore_fill):
+    ctx.transaction.types.unregister("ORDER_FILL")
+
+    assert "ORDER_FILL" not in ctx.transaction.types.types()
+
+    assert type(ctx.transaction.Transaction.from_dict(FILL, ctx)) is \
+        transaction.Transaction
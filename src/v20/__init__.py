@@ -1,4 +1,7 @@
-import requests
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from v20 import account
 from v20 import user
 from v20 import position
@@ -10,7 +13,13 @@ from v20 import site
 from v20 import pricing_common
 from v20 import order
 from v20 import instrument
+from v20 import json_stream
+from v20.batch import BatchResult
+from v20.call import Call
+from v20.line_reader import LineReader
 from v20.response import Response
+from v20.transport import RequestsTransport
+from v20.errors import ResponseUnexpectedStatus
 from v20.errors import V20ConnectionError, V20Timeout
 
 class Context(object):
@@ -28,7 +37,18 @@ class Context(object):
         stream_chunk_size=512,
         stream_timeout=10,
         datetime_format="RFC3339",
-        poll_timeout=2
+        poll_timeout=2,
+        pool_connections=10,
+        pool_maxsize=10,
+        pool_block=False,
+        keep_alive=True,
+        idle_timeout=None,
+        lazy_entities=False,
+        candle_cache=None,
+        transaction_journal=None,
+        scheduler=None,
+        retry_policy=None,
+        transport=None
     ):
         """
         Create an API context for v20 access
@@ -50,6 +70,34 @@ class Context(object):
             datetime_format: The format to request when dealing with times
             poll_timeout: The timeout to use when making a polling request with
                 the v20 REST server
+            pool_connections: The number of per-host connection pools to
+                keep
+            pool_maxsize: The maximum number of connections to keep open to
+                each host
+            pool_block: Flag that controls whether a request should wait for
+                a free connection when pool_maxsize connections are in use
+                rather than opening (and later discarding) an extra one
+            keep_alive: Flag that controls whether connections are kept open
+                between requests
+            idle_timeout: The number of seconds the context may be idle
+                before its pooled connections are closed, or None to never
+                close them
+            lazy_entities: Flag that controls whether entities built from
+                responses wrap the decoded JSON and only convert each field
+                when it is first read
+            candle_cache: An optional v20.candle_cache.CandleCache consulted
+                by instrument.candles
+            transaction_journal: An optional
+                v20.transaction_journal.TransactionJournal consulted by
+                transaction.list, transaction.get, transaction.range and
+                transaction.since
+            scheduler: An optional v20.rate_limit.RequestScheduler that
+                limits the rate at which requests are sent
+            retry_policy: An optional v20.retry.RetryPolicy deciding which
+                failed requests are retried
+            transport: The v20.transport.Transport that requests are sent
+                with. Defaults to a v20.transport.RequestsTransport using
+                pool_connections, pool_maxsize and pool_block.
         """
 
         #
@@ -62,6 +110,11 @@ class Context(object):
         #
         self.port = port
 
+        #
+        # Flag to enable/disable SSL
+        #
+        self.ssl = ssl
+
         #
         # The format to use when dealing with times
         #
@@ -104,9 +157,43 @@ class Context(object):
         )
 
         #
-        # The session used for communicating with the REST server
+        # The transport used for communicating with the REST server
         #
-        self._session = requests.Session()
+        if transport is None:
+            transport = self._create_transport(
+                pool_connections,
+                pool_maxsize,
+                pool_block
+            )
+
+        self.transport = transport
+
+        #
+        # The maximum number of connections to keep open to each host
+        #
+        self.pool_maxsize = pool_maxsize
+
+        if not keep_alive:
+            self.set_header("Connection", "close")
+
+        #
+        # The number of seconds the context may be idle before its pooled
+        # connections are closed
+        #
+        self.idle_timeout = idle_timeout
+
+        #
+        # The time at which the last request was made through the context
+        #
+        self._last_request_time = time.time()
+
+        #
+        # The timer that closes the pooled connections once the context has
+        # been idle for idle_timeout seconds, without waiting for another
+        # request to notice, and the lock guarding it
+        #
+        self._reaper = None
+        self._reaper_lock = threading.Lock()
 
         #
         # Flag that controls whether the string representation of floats
@@ -114,6 +201,34 @@ class Context(object):
         #
         self.decimal_number_as_float = decimal_number_as_float
 
+        #
+        # Flag that controls whether entities built from responses are
+        # converted lazily, field by field, as they are read
+        #
+        self.lazy_entities = lazy_entities
+
+        #
+        # The store of completed candlesticks consulted by
+        # instrument.candles
+        #
+        self.candle_cache = candle_cache
+
+        #
+        # The journal of Transactions consulted by transaction.list,
+        # transaction.get, transaction.range and transaction.since
+        #
+        self.transaction_journal = transaction_journal
+
+        #
+        # The scheduler limiting the rate at which requests are sent
+        #
+        self.scheduler = scheduler
+
+        #
+        # The policy deciding which failed requests are retried
+        #
+        self.retry_policy = retry_policy
+
         #
         # The size of each chunk to read when processing a stream
         # response
@@ -145,6 +260,17 @@ class Context(object):
         self.instrument = instrument.EntitySpec(self)
 
 
+    def _create_transport(self, pool_connections, pool_maxsize, pool_block):
+        """
+        Create the transport used when none is given to the constructor
+        """
+        return RequestsTransport(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+
+
     def set_header(self, key, value):
         """
         Set an HTTP header for all requests to the v20 API using
@@ -241,6 +367,64 @@ class Context(object):
         self.decimal_number_as_float = value
 
 
+    def set_lazy_entities(self, value):
+        """
+        Enable or disable lazy construction of entities from responses. When
+        enabled, an entity keeps a reference to the decoded JSON it was
+        built from, and child entities and decimal numbers are only
+        converted when the field is first read.
+
+        Args:
+            value: True of False to enable/disable this feature
+        """
+        self.lazy_entities = value
+
+
+    def set_candle_cache(self, cache):
+        """
+        Set the store of completed candlesticks consulted by
+        instrument.candles for requests with both a fromTime and a toTime
+
+        Args:
+            cache: A v20.candle_cache.CandleCache, or None to disable
+                caching
+        """
+        self.candle_cache = cache
+
+
+    def set_transaction_journal(self, journal):
+        """
+        Set the journal of Transactions consulted by transaction.list,
+        transaction.get, transaction.range and transaction.since
+
+        Args:
+            journal: A v20.transaction_journal.TransactionJournal, or None
+                to disable journaling
+        """
+        self.transaction_journal = journal
+
+
+    def set_scheduler(self, scheduler):
+        """
+        Set the scheduler limiting the rate at which requests are sent
+
+        Args:
+            scheduler: A v20.rate_limit.RequestScheduler, or None to send
+                requests immediately
+        """
+        self.scheduler = scheduler
+
+
+    def set_retry_policy(self, policy):
+        """
+        Set the policy deciding which failed requests are retried
+
+        Args:
+            policy: A v20.retry.RetryPolicy, or None to never retry
+        """
+        self.retry_policy = policy
+
+
     def convert_decimal_number(self, value):
         """
         Parse a wire-format DecimalNumber, AccountValue or PriceValue (i.e. a
@@ -277,9 +461,86 @@ class Context(object):
         self.poll_timeout = timeout
 
 
+    def set_idle_timeout(self, timeout):
+        """
+        Set the number of seconds the context may be idle before its pooled
+        connections are closed
+        """
+        self.idle_timeout = timeout
+
+        with self._reaper_lock:
+            if self._reaper is not None:
+                self._reaper.cancel()
+                self._reaper = None
+
+        self._schedule_reaper()
+
+
+    def close_idle_connections(self):
+        """
+        Close every pooled connection that is not currently in use
+        """
+        self.transport.close_idle_connections()
+
+
+    def _schedule_reaper(self):
+        """
+        Start the timer closing the pooled connections once the context has
+        been idle for idle_timeout seconds, unless it is already running
+        """
+        with self._reaper_lock:
+            if self._reaper is not None or self.idle_timeout is None:
+                return
+
+            delay = self._last_request_time + self.idle_timeout - time.time()
+
+            self._reaper = threading.Timer(max(0, delay), self._reap)
+            self._reaper.daemon = True
+            self._reaper.start()
+
+
+    def _reap(self):
+        with self._reaper_lock:
+            self._reaper = None
+
+        if self.idle_timeout is None:
+            return
+
+        #
+        # A request made since the timer was started pushes the deadline
+        # back
+        #
+        if time.time() - self._last_request_time >= self.idle_timeout:
+            self.close_idle_connections()
+        else:
+            self._schedule_reaper()
+
+
+    def prewarm(self, count):
+        """
+        Open connections to the v20 REST server ahead of time so that the
+        first requests made through the context do not pay for the TCP and
+        TLS handshakes
+
+        Args:
+            count: The number of connections to open. At most pool_maxsize
+                connections are kept.
+        """
+        self.transport.prewarm(
+            "{}/".format(self._base_url),
+            count,
+            self.poll_timeout
+        )
+
+        self._last_request_time = time.time()
+
+        self._schedule_reaper()
+
+
     def request(self, request):
         """
-        Perform an HTTP request through the context
+        Perform an HTTP request through the context, retrying it as the
+        context's retry policy allows
 
         Args:
             request: A v20.request.Request object
@@ -288,39 +549,78 @@ class Context(object):
             A v20.response.Response object
         """
 
+        attempt = 0
+
+        while True:
+            try:
+                response = self._request(request)
+            except (V20ConnectionError, V20Timeout) as e:
+                if self.retry_policy is None:
+                    raise
+
+                delay = self.retry_policy.delay(request, attempt, error=e)
+
+                if delay is None:
+                    raise
+            else:
+                if self.retry_policy is None:
+                    return response
+
+                delay = self.retry_policy.delay(
+                    request,
+                    attempt,
+                    response=response
+                )
+
+                if delay is None:
+                    return response
+
+                #
+                # A stream's connection is only given back to the pool once
+                # the stream is closed
+                #
+                response.close()
+
+            time.sleep(delay)
+
+            attempt += 1
+
+
+    def _request(self, request):
         url = "{}{}".format(self._base_url, request.path)
 
+        if self.scheduler is not None:
+            self.scheduler.acquire(request)
+
+        now = time.time()
+
+        if self.idle_timeout is not None and \
+           now - self._last_request_time > self.idle_timeout:
+            self.close_idle_connections()
+
+        self._last_request_time = now
+
+        self._schedule_reaper()
+
         timeout = self.poll_timeout
 
         if request.stream is True:
             timeout = self.stream_timeout
 
-        try:
-            http_response = self._session.request(
-                request.method,
-                url,
-                headers=self._headers,
-                params=request.params,
-                data=request.body,
-                stream=request.stream,
-                timeout=timeout
-            )
-        except requests.exceptions.ConnectionError:
-            raise V20ConnectionError(url)
-        except requests.exceptions.ConnectTimeout:
-            raise V20Timeout(url, "connect")
-        except requests.exceptions.ReadTimeout:
-            raise V20Timeout(url, "read")
+        if request.timeout is not None:
+            timeout = request.timeout
 
-        request.headers = http_response.request.headers
+        reply = self.transport.send(request, url, self._headers, timeout)
+
+        request.headers = reply.request_headers
 
         response = Response(
             request,
             request.method,
-            http_response.url,
-            http_response.status_code,
-            http_response.reason,
-            http_response.headers
+            reply.url,
+            reply.status,
+            reply.reason,
+            reply.headers
         )
 
         if request.stream:
@@ -328,12 +628,241 @@ class Context(object):
                 request.line_parser
             )
 
+            response.set_release(reply.close)
+
+            #
+            # A chunked stream is read a chunk at a time as each one
+            # arrives, however large, rather than in stream_chunk_size
+            # pieces
+            #
+            chunk_size = self.stream_chunk_size
+
+            if reply.chunked:
+                chunk_size = None
+
             response.set_lines(
-                http_response.iter_lines(
+                LineReader(
+                    reply.iter_chunks(chunk_size)
+                )
+            )
+
+            response.set_chunks(
+                reply.iter_chunks(
                     self.stream_chunk_size
                 )
             )
         else:
-            response.set_raw_body(http_response.text)
+            #
+            # The body is kept as the bytes received. ujson parses bytes
+            # directly, so no str copy is made unless Response.text is used.
+            #
+            response.set_raw_body(reply.content)
 
         return response
+
+
+
+    def iter_array(self, path, method, *args, **kwargs):
+        """
+        Call an API method, decoding its response body incrementally as it
+        is received and yielding the entities of one of its arrays one at a
+        time. Memory use is bounded by the size of a single entity rather
+        than by the size of the response.
+
+            for t in ctx.iter_array(
+                "transactions",
+                ctx.transaction.range,
+                accountID,
+                fromID=1,
+                toID=100000
+            ):
+                print(t.id)
+
+        Args:
+            path: The dotted path to the array in the response body, e.g.
+                "transactions", "candles" or "account.trades"
+            method: The API method to call, e.g. ctx.transaction.range
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+
+        Returns:
+            A generator of the entities in the array, parsed exactly as the
+            method parses them
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if the response status is
+            not 200
+        """
+        call = Call(method, *args, **kwargs)
+
+        keys = path.split(".")
+
+        request = call.prepare(self)
+
+        request.set_stream(True)
+
+        response = self.request(request)
+
+        #
+        # The connection is given up however the generator ends, including
+        # when it is abandoned before the array has been read
+        #
+        try:
+            if str(response.status) != "200":
+                response.set_raw_body(b"".join(response.chunks()))
+
+                raise ResponseUnexpectedStatus(
+                    call.complete(self, response),
+                    200
+                )
+
+            for element in json_stream.iter_array(response.chunks(), keys):
+                #
+                # Each element is parsed by the method itself, from a body
+                # holding only that element
+                #
+                body = [element]
+
+                for key in reversed(keys):
+                    body = {key: body}
+
+                response.set_json_body(body)
+
+                value = call.complete(self, response).get(keys[0])
+
+                for key in keys[1:]:
+                    value = getattr(value, key)
+
+                yield value[0]
+        finally:
+            response.close()
+
+
+    def gather(self, calls, max_workers=None, deadline=None):
+        """
+        Perform many API calls concurrently over the context's connection
+        pool, and collect their responses in the order the calls were given
+
+            result = ctx.gather(
+                [
+                    Call(ctx.account.summary, accountID),
+                    Call(ctx.trade.list_open, accountID),
+                    Call(ctx.position.list_open, accountID),
+                ],
+                deadline=2.0
+            )
+
+            summary, trades, positions = result
+
+        The requests are sent directly, so the candle cache and transaction
+        journal are not consulted.
+
+        Args:
+            calls: A list of v20.call.Call objects
+            max_workers: The maximum number of requests in flight at once.
+                Defaults to the size of the connection pool.
+            deadline: The number of seconds the whole batch may take, or
+                None for no limit. Calls that have not completed by then
+                are abandoned: those still queued are cancelled and never
+                sent, but a call already in flight cannot be stopped and
+                may still complete on the server. A deadline should only be
+                used for calls that are safe to repeat, unless the outcome
+                of the others is checked afterwards (e.g. with
+                order.create_reconciled).
+
+        Returns:
+            v20.batch.BatchResult holding, in the order of the calls, the
+            v20.response.Response of each call or the exception raised by
+            it. The result of a call abandoned at the deadline is a
+            V20Timeout.
+        """
+        calls = list(calls)
+
+        if len(calls) == 0:
+            return BatchResult([])
+
+        if max_workers is None:
+            max_workers = self.pool_maxsize
+
+        start = time.time()
+
+        prepared = [None] * len(calls)
+
+        def perform(index, call):
+            request = call.prepare(self)
+
+            prepared[index] = request
+
+            #
+            # A request cannot wait on the server for longer than the batch
+            # has left
+            #
+            if deadline is not None:
+                remaining = max(0.001, deadline - (time.time() - start))
+
+                if request.timeout is None or request.timeout > remaining:
+                    request.set_timeout(remaining)
+
+            return call.complete(self, self.request(request))
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(calls))
+        )
+
+        futures = [
+            executor.submit(perform, index, call)
+            for index, call in enumerate(calls)
+        ]
+
+        wait(futures, timeout=deadline)
+
+        #
+        # The calls still queued are cancelled so that they are never sent.
+        # The worker threads of the calls in flight finish in the background.
+        #
+        for future in futures:
+            future.cancel()
+
+        executor.shutdown(wait=False)
+
+        results = []
+
+        for call, request, future in zip(calls, prepared, futures):
+            if future.cancelled() or not future.done():
+                results.append(self._deadline_timeout(call, request))
+            elif future.exception() is not None:
+                results.append(future.exception())
+            else:
+                results.append(future.result())
+
+        return BatchResult(results)
+
+    def _deadline_timeout(self, call, request):
+        """
+        Build the V20Timeout reported for a call of a batch that did not
+        complete by its deadline
+
+        Args:
+            call: The v20.call.Call abandoned
+            request: The v20.request.Request sent for the call, or None if
+                the call had not got as far as making its request
+
+        Returns:
+            V20Timeout for the URL of the request, or for the endpoint path
+            of the call if no request was made
+        """
+        if request is not None:
+            return V20Timeout(
+                "{}{}".format(self._base_url, request.path),
+                "deadline"
+            )
+
+        try:
+            path = call.prepare(self).path
+        except Exception:
+            path = str(call)
+
+        return V20Timeout(path, "deadline")
+
+if sys.version_info >= (3, 5):
+    from v20.aio import AsyncContext
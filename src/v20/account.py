@@ -1,4 +1,3 @@
-import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
@@ -27,6 +26,11 @@ class Account(BaseEntity):
     #
     _properties = spec_properties.account_Account
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Account instance
@@ -253,6 +257,9 @@ class Account(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Account.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('balance') is not None:
@@ -399,6 +406,11 @@ class AccountChangesState(BaseEntity):
     #
     _properties = spec_properties.account_AccountChangesState
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new AccountChangesState instance
@@ -501,6 +513,9 @@ class AccountChangesState(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return AccountChangesState.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('unrealizedPL') is not None:
@@ -609,6 +624,11 @@ class AccountProperties(BaseEntity):
     #
     _properties = spec_properties.account_AccountProperties
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new AccountProperties instance
@@ -640,6 +660,9 @@ class AccountProperties(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return AccountProperties.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
 
@@ -667,6 +690,11 @@ class AccountSummary(BaseEntity):
     #
     _properties = spec_properties.account_AccountSummary
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new AccountSummary instance
@@ -878,6 +906,9 @@ class AccountSummary(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return AccountSummary.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('balance') is not None:
@@ -1003,6 +1034,11 @@ class CalculatedAccountState(BaseEntity):
     #
     _properties = spec_properties.account_CalculatedAccountState
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CalculatedAccountState instance
@@ -1090,6 +1126,9 @@ class CalculatedAccountState(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CalculatedAccountState.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('unrealizedPL') is not None:
@@ -1182,6 +1221,11 @@ class AccountChanges(BaseEntity):
     #
     _properties = spec_properties.account_AccountChanges
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new AccountChanges instance
@@ -1243,6 +1287,9 @@ class AccountChanges(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return AccountChanges.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('ordersCreated') is not None:
@@ -1348,7 +1395,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1429,7 +1476,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1522,7 +1569,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1625,7 +1672,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1731,7 +1778,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1872,7 +1919,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
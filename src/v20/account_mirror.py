@@ -0,0 +1,711 @@
+import collections
+import decimal
+import threading
+
+from v20.resilient_stream import ResilientTransactionStream
+from v20.transaction import SincePages
+
+
+class AccountMirror(object):
+    """
+    An AccountMirror maintains a local copy of an Account. It is
+    bootstrapped once with account.get and then kept up to date by polling
+    account.changes with the last TransactionID seen, which only transfers
+    what has changed since the previous poll.
+
+        mirror = AccountMirror(ctx, accountID)
+
+        while True:
+            mirror.poll()
+            print(mirror.account.NAV, len(mirror.account.trades))
+            time.sleep(1)
+    """
+    def __init__(self, ctx, accountID):
+        """
+        Create a new AccountMirror
+
+        Args:
+            ctx: The v20.Context used to query the Account
+            accountID: The ID of the Account to mirror
+        """
+        self.ctx = ctx
+        self.accountID = accountID
+
+        #
+        # The mirrored v20.account.Account, or None until bootstrapped
+        #
+        self.account = None
+
+        self._trades = collections.OrderedDict()
+        self._orders = collections.OrderedDict()
+        self._positions = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def lastTransactionID(self):
+        """
+        The ID of the last Transaction applied to the mirror
+        """
+        if self.account is None:
+            return None
+
+        return self.account.lastTransactionID
+
+    def bootstrap(self):
+        """
+        Fetch the full Account with account.get, replacing the mirrored
+        state
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if the Account could not be
+            fetched
+        """
+        response = self.ctx.account.get(self.accountID)
+
+        account = response.get("account", 200)
+
+        with self._lock:
+            self._trades = collections.OrderedDict(
+                (t.id, t) for t in account.trades or []
+            )
+            self._orders = collections.OrderedDict(
+                (o.id, o) for o in account.orders or []
+            )
+            self._positions = collections.OrderedDict(
+                (p.instrument, p) for p in account.positions or []
+            )
+
+            account.lastTransactionID = response.get("lastTransactionID")
+
+            self.account = account
+
+            self._update_collections()
+
+    def poll(self):
+        """
+        Fetch the changes to the Account since the last Transaction applied
+        and apply them to the mirror. The mirror is bootstrapped first if
+        needed.
+
+        Returns:
+            The v20.account.AccountChanges applied, or None if the mirror
+            was just bootstrapped
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if the changes could not be
+            fetched
+        """
+        if self.account is None:
+            self.bootstrap()
+            return None
+
+        with self._lock:
+            sinceTransactionID = self.lastTransactionID
+
+        #
+        # The changes are fetched without holding the lock, so readers and
+        # the Transactions streamed meanwhile by another thread (e.g.
+        # StreamingAccountMirror.stream) are not held up by the request.
+        # apply() skips what has been applied since.
+        #
+        response = self.ctx.account.changes(
+            self.accountID,
+            sinceTransactionID=sinceTransactionID
+        )
+
+        changes = response.get("changes", 200)
+        state = response.get("state", 200)
+
+        with self._lock:
+            self.apply(
+                changes,
+                state,
+                response.get("lastTransactionID")
+            )
+
+        return changes
+
+    def apply(self, changes, state, lastTransactionID):
+        """
+        Apply AccountChanges and AccountChangesState to the mirror. The
+        mirror's lock must be held.
+
+        The changes may overlap with Transactions applied since they were
+        requested. Those Transactions are skipped, and if the mirror is
+        already at or past lastTransactionID only the state is applied, as
+        the Orders, Trades and Positions of the changes would be older than
+        the mirrored ones.
+
+        Args:
+            changes: A v20.account.AccountChanges
+            state: A v20.account.AccountChangesState
+            lastTransactionID: The ID of the last Transaction the changes
+                cover
+        """
+        applied = int(self.lastTransactionID or 0)
+
+        if lastTransactionID is not None and \
+           int(lastTransactionID) <= applied:
+            if state is not None:
+                self._apply_state(state)
+
+            self._update_collections()
+
+            return
+
+        for order in changes.ordersCreated or []:
+            self._orders[order.id] = order
+
+        for orders in [
+            changes.ordersCancelled,
+            changes.ordersFilled,
+            changes.ordersTriggered
+        ]:
+            for order in orders or []:
+                self._orders.pop(order.id, None)
+
+        for trade in changes.tradesOpened or []:
+            self._trades[trade.id] = trade
+
+        for trade in changes.tradesReduced or []:
+            self._trades[trade.id] = trade
+
+        for trade in changes.tradesClosed or []:
+            self._trades.pop(trade.id, None)
+
+        for position in changes.positions or []:
+            self._positions[position.instrument] = position
+
+        for transaction in changes.transactions or []:
+            if int(transaction.id) > applied:
+                self._apply_transaction(transaction)
+
+        if state is not None:
+            self._apply_state(state)
+
+        if lastTransactionID is not None and \
+           int(lastTransactionID) > applied:
+            self.account.lastTransactionID = lastTransactionID
+
+        self._update_collections()
+
+    def _add(self, current, delta):
+        if delta is None:
+            return current
+
+        if current is None:
+            return delta
+
+        #
+        # Money values are added exactly, and keep the precision of the
+        # wire format
+        #
+        return self.ctx.convert_decimal_number(
+            str(_decimal(current) + _decimal(delta))
+        )
+
+    def _apply_transaction(self, transaction):
+        account = self.account
+
+        balance = getattr(transaction, "accountBalance", None)
+
+        if balance is not None:
+            account.balance = balance
+
+        type = transaction.type
+
+        if type == "ORDER_FILL":
+            account.pl = self._add(account.pl, transaction.pl)
+            account.resettablePL = self._add(
+                account.resettablePL, transaction.pl
+            )
+            account.financing = self._add(
+                account.financing, transaction.financing
+            )
+            account.commission = self._add(
+                account.commission, transaction.commission
+            )
+            account.guaranteedExecutionFees = self._add(
+                account.guaranteedExecutionFees,
+                transaction.guaranteedExecutionFee
+            )
+            account.lastOrderFillTimestamp = transaction.time
+        elif type == "DAILY_FINANCING":
+            account.financing = self._add(
+                account.financing, transaction.financing
+            )
+        elif type == "RESET_RESETTABLE_PL":
+            account.resettablePL = self.ctx.convert_decimal_number("0.0")
+            account.resettablePLTime = transaction.time
+        elif type == "CLIENT_CONFIGURE":
+            if transaction.alias is not None:
+                account.alias = transaction.alias
+            if transaction.marginRate is not None:
+                account.marginRate = transaction.marginRate
+        elif type == "MARGIN_CALL_ENTER":
+            account.marginCallEnterTime = transaction.time
+            account.marginCallExtensionCount = 0
+        elif type == "MARGIN_CALL_EXTEND":
+            account.marginCallExtensionCount = transaction.extensionNumber
+            account.lastMarginCallExtensionTime = transaction.time
+        elif type == "MARGIN_CALL_EXIT":
+            account.marginCallEnterTime = None
+            account.marginCallExtensionCount = None
+            account.lastMarginCallExtensionTime = None
+
+    def _apply_state(self, state):
+        account = self.account
+
+        for prop in state._properties:
+            if prop.typeClass != "primitive":
+                continue
+
+            value = getattr(state, prop.name)
+
+            if value is not None:
+                setattr(account, prop.name, value)
+
+        for order_state in state.orders or []:
+            order = self._orders.get(order_state.id)
+
+            if order is None:
+                continue
+
+            for name in [
+                "trailingStopValue",
+                "triggerDistance",
+                "isTriggerDistanceExact"
+            ]:
+                value = getattr(order_state, name)
+
+                if value is not None and hasattr(order.__class__, name):
+                    setattr(order, name, value)
+
+        for trade_state in state.trades or []:
+            trade = self._trades.get(trade_state.id)
+
+            if trade is None:
+                continue
+
+            trade.unrealizedPL = trade_state.unrealizedPL
+            trade.marginUsed = trade_state.marginUsed
+
+        for position_state in state.positions or []:
+            position = self._positions.get(position_state.instrument)
+
+            if position is None:
+                continue
+
+            position.unrealizedPL = position_state.netUnrealizedPL
+            position.marginUsed = position_state.marginUsed
+
+            if position.long is not None:
+                position.long.unrealizedPL = position_state.longUnrealizedPL
+
+            if position.short is not None:
+                position.short.unrealizedPL = position_state.shortUnrealizedPL
+
+    def _update_collections(self):
+        account = self.account
+
+        account.trades = list(self._trades.values())
+        account.orders = list(self._orders.values())
+        account.positions = list(self._positions.values())
+
+        account.openTradeCount = len(self._trades)
+        account.pendingOrderCount = len(self._orders)
+        account.openPositionCount = len([
+            p for p in self._positions.values()
+            if _units(p.long) != 0 or _units(p.short) != 0
+        ])
+
+    def trade(self, tradeID):
+        """
+        Returns:
+            The mirrored open Trade with the given ID, or None
+        """
+        return self._trades.get(str(tradeID))
+
+    def order(self, orderID):
+        """
+        Returns:
+            The mirrored pending Order with the given ID, or None
+        """
+        return self._orders.get(str(orderID))
+
+    def position(self, instrument):
+        """
+        Returns:
+            The mirrored Position for the given instrument, or None
+        """
+        return self._positions.get(instrument)
+
+
+def _decimal(value):
+    """
+    Returns:
+        A DecimalNumber (a string in the wire format, or a float if the
+        Context converts them) as a decimal.Decimal
+    """
+    if isinstance(value, float):
+        return decimal.Decimal(repr(value))
+
+    return decimal.Decimal(value)
+
+
+def _units(side):
+    if side is None or side.units is None:
+        return 0
+
+    return _decimal(side.units)
+
+
+#
+# The Transaction types that create a pending Order, mapped to the type of
+# the Order they create. Market and fixed price orders are filled (or
+# cancelled) immediately and never become pending.
+#
+PENDING_ORDER_TRANSACTION_TYPES = {
+    "LIMIT_ORDER": "LIMIT",
+    "STOP_ORDER": "STOP",
+    "MARKET_IF_TOUCHED_ORDER": "MARKET_IF_TOUCHED",
+    "TAKE_PROFIT_ORDER": "TAKE_PROFIT",
+    "STOP_LOSS_ORDER": "STOP_LOSS",
+    "TRAILING_STOP_LOSS_ORDER": "TRAILING_STOP_LOSS",
+}
+
+
+#
+# The TradeSummary attribute holding the ID of each type of dependent Order
+#
+DEPENDENT_ORDER_ATTRIBUTES = {
+    "TAKE_PROFIT": "takeProfitOrderID",
+    "STOP_LOSS": "stopLossOrderID",
+    "TRAILING_STOP_LOSS": "trailingStopLossOrderID",
+}
+
+
+class StreamingAccountMirror(AccountMirror):
+    """
+    A StreamingAccountMirror maintains a local copy of an Account by
+    applying each Transaction received from transaction.stream to it, so
+    no REST requests are made in steady state. After the stream is
+    (re)connected any Transactions missed are fetched with transaction.since
+    and applied before the streamed ones.
+
+    Orders, trades, positions, balance and realized P/L follow the
+    Transactions exactly. Fields that depend on prices (unrealized P/L, NAV,
+    margin) keep the values of the last account.get or account.changes
+    response; call poll() occasionally to refresh them.
+
+        mirror = StreamingAccountMirror(ctx, accountID)
+
+        for transaction in mirror.stream():
+            print(transaction.type, len(mirror.account.trades))
+    """
+    def __init__(self, ctx, accountID, heartbeat_timeout=10.0,
+                 backoff=None):
+        """
+        Create a new StreamingAccountMirror
+
+        Args:
+            ctx: The v20.Context used to query the Account
+            accountID: The ID of the Account to mirror
+            heartbeat_timeout: The number of seconds without a message
+                after which the stream is reconnected
+            backoff: The v20.resilient_stream.Backoff used between
+                reconnections
+        """
+        super(StreamingAccountMirror, self).__init__(ctx, accountID)
+
+        self.heartbeat_timeout = heartbeat_timeout
+        self.backoff = backoff
+
+    def catch_up(self):
+        """
+        Fetch and apply the Transactions after the last one applied with
+        transaction.since
+
+        Returns:
+            The list of Transactions applied
+        """
+        return list(self._catch_up())
+
+    def _catch_up(self):
+        pages = SincePages(self.lastTransactionID)
+
+        while not pages.done:
+            response = self.ctx.transaction.since(
+                self.accountID,
+                id=pages.sinceID
+            )
+
+            for transaction in pages.add(response):
+                if self.apply_transaction(transaction):
+                    yield transaction
+
+    def stream(self, reconnect=True):
+        """
+        Stream the Account's Transactions, applying each one to the mirror
+        before it is yielded. The mirror is bootstrapped first if needed.
+
+        Args:
+            reconnect: Reconnect the stream and fill the gap with
+                transaction.since when it fails. If False the error is
+                raised.
+
+        Returns:
+            A generator of the Transactions applied
+        """
+        if self.account is None:
+            self.bootstrap()
+
+        stream = ResilientTransactionStream(
+            self.ctx,
+            self.accountID,
+            lastTransactionID=self.lastTransactionID,
+            heartbeat_timeout=self.heartbeat_timeout,
+            backoff=self.backoff,
+            max_retries=None if reconnect else 0
+        )
+
+        #
+        # The stream fills any gap itself. Transactions already applied by
+        # a poll() in the meantime are skipped by apply_transaction.
+        #
+        for msg_type, msg in stream:
+            if msg_type == "transaction.Transaction" and \
+               self.apply_transaction(msg):
+                yield msg
+
+    def apply_transaction(self, transaction):
+        """
+        Apply a single Transaction to the mirror
+
+        Args:
+            transaction: The v20.transaction.Transaction to apply
+
+        Returns:
+            False if the Transaction had already been applied, True
+            otherwise
+        """
+        with self._lock:
+            if int(transaction.id) <= int(self.lastTransactionID):
+                return False
+
+            type = transaction.type
+
+            if type in PENDING_ORDER_TRANSACTION_TYPES:
+                self._create_order(transaction)
+            elif type == "ORDER_FILL":
+                self._orders.pop(transaction.orderID, None)
+                self._apply_fill(transaction)
+            elif type == "ORDER_CANCEL":
+                self._cancel_order(transaction.orderID)
+            elif type == "ORDER_CLIENT_EXTENSIONS_MODIFY":
+                order = self._orders.get(transaction.orderID)
+
+                if order is not None and \
+                   transaction.clientExtensionsModify is not None:
+                    order.clientExtensions = \
+                        transaction.clientExtensionsModify
+            elif type == "TRADE_CLIENT_EXTENSIONS_MODIFY":
+                trade = self._trades.get(transaction.tradeID)
+
+                if trade is not None:
+                    trade.clientExtensions = \
+                        transaction.tradeClientExtensionsModify
+            elif type == "DAILY_FINANCING":
+                self._apply_financing(transaction)
+
+            self._apply_transaction(transaction)
+
+            self.account.lastTransactionID = transaction.id
+
+            self._update_collections()
+
+            return True
+
+    def _create_order(self, transaction):
+        data = transaction.dict()
+
+        type = PENDING_ORDER_TRANSACTION_TYPES[transaction.type]
+
+        #
+        # The Order's fields are a subset of those of the Transaction that
+        # created it. The Transaction-only fields are ignored by from_dict.
+        #
+        data["type"] = type
+        data["state"] = "PENDING"
+        data["createTime"] = transaction.time
+
+        order = self.ctx.order.Order.from_dict(data, self.ctx)
+
+        if transaction.replacesOrderID is not None:
+            self._cancel_order(transaction.replacesOrderID)
+
+        self._orders[order.id] = order
+
+        attribute = DEPENDENT_ORDER_ATTRIBUTES.get(type)
+
+        trade = self._trades.get(getattr(transaction, "tradeID", None))
+
+        if attribute is not None and trade is not None:
+            setattr(trade, attribute, order.id)
+
+    def _cancel_order(self, orderID):
+        order = self._orders.pop(orderID, None)
+
+        if order is None:
+            return
+
+        attribute = DEPENDENT_ORDER_ATTRIBUTES.get(order.type)
+
+        trade = self._trades.get(getattr(order, "tradeID", None))
+
+        if attribute is not None and trade is not None and \
+           getattr(trade, attribute) == orderID:
+            setattr(trade, attribute, None)
+
+    def _position(self, instrument):
+        position = self._positions.get(instrument)
+
+        if position is None:
+            zero = self.ctx.convert_decimal_number("0")
+
+            position = self.ctx.position.Position(
+                instrument=instrument,
+                pl=zero,
+                unrealizedPL=zero,
+                resettablePL=zero,
+                financing=zero,
+                commission=zero,
+                long=self.ctx.position.PositionSide(units=zero, tradeIDs=[]),
+                short=self.ctx.position.PositionSide(units=zero, tradeIDs=[])
+            )
+
+            self._positions[instrument] = position
+
+        return position
+
+    def _apply_fill(self, transaction):
+        position = self._position(transaction.instrument)
+
+        position.pl = self._add(position.pl, transaction.pl)
+        position.resettablePL = self._add(
+            position.resettablePL, transaction.pl
+        )
+        position.financing = self._add(
+            position.financing, transaction.financing
+        )
+        position.commission = self._add(
+            position.commission, transaction.commission
+        )
+
+        for trade_reduce in transaction.tradesClosed or []:
+            self._reduce_trade(position, trade_reduce, True)
+
+        if transaction.tradeReduced is not None:
+            self._reduce_trade(position, transaction.tradeReduced, False)
+
+        if transaction.tradeOpened is not None:
+            self._open_trade(position, transaction, transaction.tradeOpened)
+
+    def _open_trade(self, position, transaction, trade_open):
+        zero = self.ctx.convert_decimal_number("0")
+
+        trade = self.ctx.trade.TradeSummary(
+            id=trade_open.tradeID,
+            instrument=transaction.instrument,
+            price=trade_open.price,
+            openTime=transaction.time,
+            state="OPEN",
+            initialUnits=trade_open.units,
+            initialMarginRequired=trade_open.initialMarginRequired,
+            currentUnits=trade_open.units,
+            realizedPL=zero,
+            unrealizedPL=zero,
+            financing=zero,
+            clientExtensions=trade_open.clientExtensions
+        )
+
+        self._trades[trade.id] = trade
+
+        units = _decimal(trade_open.units)
+
+        side = position.long if units > 0 else position.short
+
+        side_units = _decimal(side.units or "0")
+
+        price = _decimal(trade_open.price)
+
+        averagePrice = _decimal(side.averagePrice or "0")
+
+        #
+        # The average is rounded to the precision of the prices averaged
+        #
+        exponent = min(
+            price.as_tuple().exponent,
+            averagePrice.as_tuple().exponent
+        )
+
+        average = (averagePrice * side_units + price * units) / \
+            (side_units + units)
+
+        side.averagePrice = self.ctx.convert_decimal_number(str(
+            average.quantize(decimal.Decimal(1).scaleb(exponent))
+        ))
+        side.units = self._add(side.units, trade_open.units)
+        side.tradeIDs = (side.tradeIDs or []) + [trade.id]
+
+    def _reduce_trade(self, position, trade_reduce, closed):
+        trade = self._trades.get(trade_reduce.tradeID)
+
+        if trade is None:
+            return
+
+        side = position.long if _decimal(trade.currentUnits) > 0 \
+            else position.short
+
+        side.units = self._add(side.units, trade_reduce.units)
+        side.pl = self._add(side.pl, trade_reduce.realizedPL)
+        side.financing = self._add(side.financing, trade_reduce.financing)
+
+        if closed:
+            del self._trades[trade.id]
+
+            side.tradeIDs = [
+                tradeID for tradeID in side.tradeIDs or []
+                if tradeID != trade.id
+            ]
+        else:
+            trade.currentUnits = self._add(
+                trade.currentUnits, trade_reduce.units
+            )
+            trade.realizedPL = self._add(
+                trade.realizedPL, trade_reduce.realizedPL
+            )
+            trade.financing = self._add(
+                trade.financing, trade_reduce.financing
+            )
+
+        if _decimal(side.units or "0") == 0:
+            side.averagePrice = None
+
+    def _apply_financing(self, transaction):
+        for position_financing in transaction.positionFinancings or []:
+            position = self._positions.get(position_financing.instrument)
+
+            if position is not None:
+                position.financing = self._add(
+                    position.financing, position_financing.financing
+                )
+
+            for trade_financing in \
+                    position_financing.openTradeFinancings or []:
+                trade = self._trades.get(trade_financing.tradeID)
+
+                if trade is not None:
+                    trade.financing = self._add(
+                        trade.financing, trade_financing.financing
+                    )
@@ -0,0 +1,1185 @@
+import asyncio
+import functools
+import inspect
+import ssl as ssl_module
+import time
+import zlib
+
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
+from v20 import Context
+from v20.batch import BatchResult
+from v20.call import Call, Return, Sleep
+from v20.response import Response
+from v20.errors import V20ConnectionError, V20Timeout
+from v20.rate_limit import TokenBucket
+from v20.transport import Reply, httpx, httpx_error, require_httpx
+
+
+class _Connection(object):
+    """
+    A single HTTP/1.1 connection to the v20 REST server
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.time()
+
+    def is_usable(self):
+        return not self.reader.at_eof() and \
+            not self.writer.transport.is_closing()
+
+    def close(self):
+        self.writer.close()
+
+
+class _ConnectionPool(object):
+    """
+    A pool of keep-alive connections to a single host. The number of
+    connections in use at any one time is bounded by a semaphore, so
+    coroutines wait for a free connection instead of opening an unbounded
+    number of sockets.
+    """
+    def __init__(self, hostname, port, ssl, max_connections, idle_timeout):
+        self.hostname = hostname
+        self.port = port
+        self.ssl = ssl_module.create_default_context() if ssl else None
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self._idle = []
+
+        #
+        # The semaphore is created by the first acquire, in the event loop
+        # the pool is used from, rather than wherever the pool is created
+        #
+        self._semaphore = None
+
+    async def acquire(self, timeout):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_connections)
+
+        await self._semaphore.acquire()
+
+        try:
+            self.reap(self.idle_timeout)
+
+            while len(self._idle) > 0:
+                connection = self._idle.pop()
+
+                if connection.is_usable():
+                    return connection
+
+                connection.close()
+
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.hostname,
+                    self.port,
+                    ssl=self.ssl,
+                    server_hostname=self.hostname if self.ssl else None
+                ),
+                timeout
+            )
+
+            return _Connection(reader, writer)
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    def release(self, connection, reusable):
+        if reusable and connection.is_usable():
+            connection.last_used = time.time()
+            self._idle.append(connection)
+        else:
+            connection.close()
+
+        self._semaphore.release()
+
+    def reap(self, idle_timeout):
+        if idle_timeout is None:
+            return
+
+        now = time.time()
+
+        for connection in self._idle:
+            if now - connection.last_used > idle_timeout:
+                connection.close()
+
+        self._idle = [
+            c for c in self._idle if now - c.last_used <= idle_timeout
+        ]
+
+    def close(self):
+        self.reap(-1)
+
+
+class _Chunks(object):
+    """
+    Async iterator over the chunks of a streaming response body read from a
+    pooled connection. The connection is closed once the stream ends, fails
+    or is closed.
+    """
+    def __init__(self, pool, connection, chunked, url, timeout):
+        self._pool = pool
+        self._connection = connection
+        self._chunked = chunked
+        self._url = url
+        self._timeout = timeout
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def _read(self):
+        reader = self._connection.reader
+
+        if not self._chunked:
+            return (await reader.read(65536))
+
+        size = int((await reader.readline()).split(b";")[0], 16)
+
+        if size == 0:
+            return b""
+
+        data = await reader.readexactly(size + 2)
+
+        return data[:-2]
+
+    async def __anext__(self):
+        if self._done:
+            raise StopAsyncIteration
+
+        try:
+            data = await asyncio.wait_for(self._read(), self._timeout)
+        except asyncio.TimeoutError:
+            self.close()
+            raise V20Timeout(self._url, "stream")
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self.close()
+            raise V20ConnectionError(self._url)
+        except BaseException:
+            self.close()
+            raise
+
+        if len(data) == 0:
+            self.close()
+            raise StopAsyncIteration
+
+        return data
+
+    def close(self):
+        if not self._done:
+            self._done = True
+            self._pool.release(self._connection, False)
+
+
+class _StreamLines(object):
+    """
+    Async iterator over the newline-delimited lines of a streaming Reply.
+    The Reply is closed once the stream ends or fails.
+    """
+    def __init__(self, reply):
+        self._reply = reply
+        self._chunks = reply.iter_chunks(None)
+        self._buffer = b""
+        self._lines = []
+        self._done = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while len(self._lines) == 0:
+            if self._done:
+                raise StopAsyncIteration
+
+            try:
+                data = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self.close()
+                data = b"\n"
+            except BaseException:
+                self.close()
+                raise
+
+            lines = (self._buffer + data).split(b"\n")
+            self._buffer = lines.pop()
+            self._lines = [l for l in lines if len(l.strip()) > 0]
+
+        return self._lines.pop(0)
+
+    def buffered(self):
+        """
+        Returns:
+            The lines already received that have not been read yet
+        """
+        lines, self._lines = self._lines, []
+
+        return lines
+
+    def close(self):
+        if not self._done:
+            self._done = True
+            self._reply.close()
+
+
+class _AsyncParts(object):
+    """
+    Async iterator returned by AsyncResponse.parts()
+    """
+    def __init__(self, response):
+        self._response = response
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        response = self._response
+
+        if response.lines is None:
+            raise StopAsyncIteration
+
+        line = await response.lines.__anext__()
+
+        if response.line_parser is None:
+            return "line", line
+
+        return response.line_parser(line)
+
+
+class _AsyncBatches(object):
+    """
+    Async iterator returned by AsyncResponse.batches()
+    """
+    def __init__(self, response):
+        self._response = response
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        response = self._response
+
+        if response.lines is None:
+            raise StopAsyncIteration
+
+        lines = [await response.lines.__anext__()]
+
+        lines.extend(response.lines.buffered())
+
+        if response.line_parser is None:
+            return [("line", line) for line in lines]
+
+        return [response.line_parser(line) for line in lines]
+
+
+class AsyncResponse(Response):
+    """
+    A v20.response.Response for requests made through an AsyncContext. For
+    streaming requests, parts() and batches() return async iterators.
+    """
+    def parts(self):
+        return _AsyncParts(self)
+
+    def batches(self):
+        """
+        Parse the stream's lines a batch at a time, as
+        v20.response.Response.batches() does
+
+        Returns:
+            An async iterator of lists of the parts yielded by parts()
+        """
+        return _AsyncBatches(self)
+
+    def close(self):
+        """
+        Close the connection used by a streaming response
+        """
+        if self.lines is not None:
+            self.lines.close()
+
+
+class AsyncTransport(object):
+    """
+    An AsyncTransport carries requests from an AsyncContext to the v20 REST
+    server, as a v20.transport.Transport does for a Context, except that
+    send() is a coroutine. The Reply of a stream has chunks returning an
+    async iterator of bytes.
+    """
+    async def send(self, request, url, headers, timeout):
+        """
+        Send a request
+
+        Args:
+            request: The v20.request.Request to send. Its method, params,
+                body and stream flag are used.
+            url: The full URL of the request, without its query string
+            headers: The headers to send
+            timeout: The connect and read timeout in seconds
+
+        Returns:
+            A v20.transport.Reply
+
+        Raises:
+            V20ConnectionError if the server could not be reached, or
+            V20Timeout if it did not respond in time
+        """
+        raise NotImplementedError()
+
+    def close_idle_connections(self):
+        """
+        Close every connection that is not currently in use
+        """
+        pass
+
+    async def prewarm(self, url, count, timeout):
+        """
+        Open connections to the server ahead of time
+
+        Args:
+            url: A URL on the server
+            count: The number of connections to open
+            timeout: The timeout for opening each one
+        """
+        pass
+
+
+class AsyncHTTPTransport(AsyncTransport):
+    """
+    An AsyncHTTPTransport sends requests over HTTP/1.1 with asyncio streams.
+    All requests share a bounded pool of keep-alive connections. It is the
+    default AsyncTransport of an AsyncContext.
+
+    Response bodies are requested gzip compressed, as the requests library
+    does for a Context, and decompressed once received. Streams are
+    requested uncompressed, so that each message is handed out as soon as
+    it arrives rather than when the server flushes its compressor.
+    """
+    def __init__(
+        self,
+        hostname,
+        port,
+        ssl=True,
+        max_connections=100,
+        idle_timeout=None
+    ):
+        """
+        Create a new AsyncHTTPTransport
+
+        Args:
+            hostname: The hostname of the v20 REST server
+            port: The port of the v20 REST server
+            ssl: Flag that controls whether connections use TLS
+            max_connections: The maximum number of connections that may be
+                open to the server at once. Open streams count towards this
+                limit.
+            idle_timeout: The number of seconds a pooled connection may be
+                idle before it is closed, or None
+        """
+        self.hostname = hostname
+
+        self._pool = _ConnectionPool(
+            hostname,
+            port,
+            ssl,
+            max_connections,
+            idle_timeout
+        )
+
+    def set_idle_timeout(self, timeout):
+        self._pool.idle_timeout = timeout
+
+    def close_idle_connections(self):
+        self._pool.close()
+
+    async def prewarm(self, url, count, timeout):
+        results = await asyncio.gather(
+            *[self._pool.acquire(timeout) for i in range(count)],
+            return_exceptions=True
+        )
+
+        for connection in results:
+            if isinstance(connection, _Connection):
+                self._pool.release(connection, True)
+
+    def _encode_request(self, request, headers):
+        path = request.path
+
+        if len(request.params) > 0:
+            path += "?" + urlencode(list(request.params.items()))
+
+        body = request.body
+
+        if not isinstance(body, bytes):
+            body = body.encode("utf-8")
+
+        headers = CaseInsensitiveDict(headers)
+        headers["Host"] = self.hostname
+        headers["Accept-Encoding"] = "identity" if request.stream else "gzip"
+        headers["Content-Length"] = str(len(body))
+
+        lines = ["{} {} HTTP/1.1".format(request.method, path)]
+        lines.extend(["{}: {}".format(k, v) for k, v in headers.items()])
+
+        return (
+            ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8") + body,
+            headers
+        )
+
+    async def _read_head(self, reader):
+        status_line = await reader.readline()
+
+        if len(status_line) == 0:
+            raise ConnectionResetError()
+
+        status_line = status_line.decode("latin-1").rstrip("\r\n")
+
+        version, status, reason = (status_line.split(" ", 2) + [""])[:3]
+
+        headers = CaseInsensitiveDict()
+
+        while True:
+            line = await reader.readline()
+
+            line = line.decode("latin-1").rstrip("\r\n")
+
+            if len(line) == 0:
+                break
+
+            key, value = line.split(":", 1)
+            headers[key.strip()] = value.strip()
+
+        reusable = version == "HTTP/1.1" and \
+            headers.get("connection", "").lower() != "close"
+
+        return int(status), reason, headers, reusable
+
+    async def _read_body(self, reader, headers):
+        body, complete = await self._read_raw_body(reader, headers)
+
+        if headers.get("content-encoding", "").lower() == "gzip":
+            try:
+                body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+            except zlib.error:
+                raise ValueError("Invalid gzip response body")
+
+        return body, complete
+
+    async def _read_raw_body(self, reader, headers):
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+
+                if size == 0:
+                    break
+
+                chunks.append((await reader.readexactly(size + 2))[:-2])
+
+            while len((await reader.readline()).strip()) > 0:
+                pass
+
+            return b"".join(chunks), True
+
+        if "content-length" in headers:
+            body = await reader.readexactly(
+                int(headers["content-length"])
+            )
+            return body, True
+
+        body = await reader.read()
+
+        return body, False
+
+    async def _exchange(self, connection, request, url, headers, timeout):
+        data, headers = self._encode_request(request, headers)
+
+        connection.writer.write(data)
+
+        await connection.writer.drain()
+
+        status, reason, response_headers, reusable = \
+            await self._read_head(connection.reader)
+
+        reply = Reply(
+            url,
+            status,
+            reason,
+            response_headers,
+            request_headers=headers
+        )
+
+        if request.stream:
+            chunks = _Chunks(
+                self._pool,
+                connection,
+                response_headers.get(
+                    "transfer-encoding", ""
+                ).lower() == "chunked",
+                url,
+                timeout
+            )
+
+            reply.chunks = lambda chunk_size: chunks
+            reply.chunked = True
+            reply.release = chunks.close
+
+            return reply, reusable
+
+        body, complete = await self._read_body(
+            connection.reader,
+            response_headers
+        )
+
+        reply.content = body
+
+        return reply, reusable and complete
+
+    async def send(self, request, url, headers, timeout):
+        try:
+            connection = await self._pool.acquire(timeout)
+        except asyncio.TimeoutError:
+            raise V20Timeout(url, "connect")
+        except OSError:
+            raise V20ConnectionError(url)
+
+        try:
+            reply, reusable = await asyncio.wait_for(
+                self._exchange(connection, request, url, headers, timeout),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            self._pool.release(connection, False)
+            raise V20Timeout(url, "read")
+        except (OSError, asyncio.IncompleteReadError, ValueError):
+            self._pool.release(connection, False)
+            raise V20ConnectionError(url)
+        except BaseException:
+            self._pool.release(connection, False)
+            raise
+
+        #
+        # The connection of a stream is given back when the stream is
+        # closed
+        #
+        if not request.stream:
+            self._pool.release(connection, reusable)
+
+        return reply
+
+
+class _HTTPXChunks(object):
+    """
+    Async iterator over the chunks of a streaming httpx response
+    """
+    def __init__(self, http_response, url):
+        self._http_response = http_response
+        self._iterator = http_response.aiter_bytes().__aiter__()
+        self._url = url
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return (await self._iterator.__anext__())
+        except httpx.TransportError as e:
+            await self._http_response.aclose()
+            raise httpx_error(e, self._url)
+        except StopAsyncIteration:
+            await self._http_response.aclose()
+            raise
+
+    def close(self):
+        asyncio.ensure_future(self._http_response.aclose())
+
+
+class AsyncHTTP2Transport(AsyncTransport):
+    """
+    An AsyncHTTP2Transport is the AsyncTransport counterpart of
+    v20.transport.HTTP2Transport: it sends requests over HTTP/2 with an
+    httpx.AsyncClient, multiplexing every concurrent request and stream
+    over a single TLS connection to the server. It requires the optional
+    httpx[http2] dependency (pip install 'v20[http2]').
+
+        ctx = AsyncContext(
+            hostname,
+            token=token,
+            transport=AsyncHTTP2Transport()
+        )
+
+    If the server does not offer HTTP/2, requests fall back to HTTP/1.1.
+    """
+    def __init__(self, max_connections=10, verify=True):
+        """
+        Create a new AsyncHTTP2Transport
+
+        Args:
+            max_connections: The maximum number of connections to open
+            verify: Flag that controls whether the server's TLS certificate
+                is verified
+        """
+        require_httpx()
+
+        self.client = httpx.AsyncClient(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+    async def send(self, request, url, headers, timeout):
+        body = request.body
+
+        if not isinstance(body, bytes):
+            body = body.encode("utf-8")
+
+        http_request = self.client.build_request(
+            request.method,
+            url,
+            headers=headers,
+            params=request.params,
+            content=body,
+            timeout=timeout
+        )
+
+        try:
+            http_response = await self.client.send(
+                http_request,
+                stream=request.stream
+            )
+        except httpx.TransportError as e:
+            raise httpx_error(e, url)
+
+        reply = Reply(
+            str(http_response.url),
+            http_response.status_code,
+            http_response.reason_phrase,
+            http_response.headers,
+            request_headers=http_request.headers
+        )
+
+        if request.stream:
+            chunks = _HTTPXChunks(http_response, url)
+
+            reply.chunks = lambda chunk_size: chunks
+            reply.chunked = True
+            reply.release = chunks.close
+        else:
+            reply.content = http_response.content
+
+        return reply
+
+    async def prewarm(self, url, count, timeout):
+        #
+        # A single HTTP/2 connection serves every request
+        #
+        try:
+            await self.client.head(url, timeout=timeout)
+        except httpx.TransportError:
+            pass
+
+
+async def feed_price_book(book, response):
+    """
+    Apply the prices of an AsyncContext pricing.stream response to a
+    v20.price_book.PriceBook until the stream ends. See PriceBook.afeed().
+    """
+    async for batch in response.batches():
+        book._feed_batch(batch)
+
+
+async def run_steps(ctx, steps):
+    """
+    Run an operation that makes more than one request, written as a
+    generator of steps, on the event loop. The steps are those run by
+    v20.call.run_steps.
+
+    Args:
+        ctx: The v20.AsyncContext the calls are made through
+        steps: The generator of steps
+
+    Returns:
+        The value of the Return step, or None if the generator ends without
+        one
+    """
+    value = None
+    error = None
+
+    try:
+        while True:
+            if error is not None:
+                step = steps.throw(error)
+            else:
+                step = steps.send(value)
+
+            value = None
+            error = None
+
+            if isinstance(step, Return):
+                return step.value
+
+            if isinstance(step, Sleep):
+                await asyncio.sleep(step.seconds)
+                continue
+
+            try:
+                value = await ctx.execute(step)
+            except Exception as e:
+                error = e
+    except StopIteration:
+        return None
+    finally:
+        steps.close()
+
+
+class AsyncEntitySpec(object):
+    """
+    An AsyncEntitySpec wraps a module's EntitySpec so that each of its API
+    methods returns an awaitable instead of blocking. The module's type
+    definitions are passed through unchanged.
+
+    Only methods that make a single request are run through a Call. A
+    method marked with v20.call.multi_request raises TypeError unless the
+    AsyncEntitySpec subclass for the module provides a coroutine version
+    of it.
+    """
+    def __init__(self, ctx, spec_class):
+        self.ctx = ctx
+        self._spec = spec_class(ctx)
+
+    def __getattr__(self, name):
+        attr = getattr(self._spec, name)
+
+        if not inspect.ismethod(attr) or name.startswith("_"):
+            return attr
+
+        if getattr(attr, "multi_request", False):
+            @functools.wraps(attr)
+            def method(*args, **kwargs):
+                raise TypeError(
+                    "{}.{} makes more than one request and cannot be used "
+                    "with an AsyncContext".format(
+                        self._spec.__class__.__module__,
+                        name
+                    )
+                )
+        else:
+            @functools.wraps(attr)
+            def method(*args, **kwargs):
+                return self.ctx.execute(Call(attr, *args, **kwargs))
+
+        setattr(self, name, method)
+
+        return method
+
+
+class AsyncOrderEntitySpec(AsyncEntitySpec):
+    """
+    The AsyncEntitySpec of v20.order, with coroutine versions of its
+    methods that make more than one request
+    """
+    async def create_many(
+        self,
+        accountID,
+        orders,
+        max_workers=8,
+        rate=100
+    ):
+        """
+        Create many Orders for an Account at once. The Orders are submitted
+        concurrently, at most max_workers at a time and no faster than rate
+        per second. A failure to create one Order does not stop the others
+        being submitted.
+
+        Args:
+            accountID: Account Identifier
+            orders: The list of Orders to create, each an OrderRequest or a
+                dict in the wire format
+            max_workers: The maximum number of requests in flight at once
+            rate: The maximum number of requests started per second, or None
+                for no limit
+
+        Returns:
+            v20.batch.BatchResult holding, in the order of the orders given,
+            the v20.response.Response of each create request or the
+            exception raised when making it
+        """
+        bucket = None
+
+        if rate is not None:
+            bucket = TokenBucket(rate, burst=max_workers)
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def submit(order):
+            async with semaphore:
+                return (await run_steps(
+                    self.ctx,
+                    self._spec._create_steps(accountID, order, bucket)
+                ))
+
+        results = await asyncio.gather(*[submit(order) for order in orders])
+
+        return BatchResult(list(results))
+
+    async def create_reconciled(
+        self,
+        accountID,
+        order,
+        lastTransactionID=None,
+        attempts=3,
+        settle_delay=1.0
+    ):
+        """
+        Create an Order for an Account, confirming the outcome of a request
+        that received no response instead of blindly resubmitting it. See
+        v20.order.EntitySpec.create_reconciled.
+
+        Args:
+            accountID: Account Identifier
+            order: The Order to create, an OrderRequest or a dict in the
+                wire format
+            lastTransactionID: The ID of the most recent Transaction in the
+                Account before the Order is submitted. Fetched with
+                account.summary if not provided.
+            attempts: The maximum number of times the Order is submitted
+            settle_delay: The number of seconds to wait after a failed
+                request before searching for the Order
+
+        Returns:
+            v20.response.Response containing the results from submitting the
+            request. A response reconstructed from the Account's
+            Transactions has the reason "Reconciled".
+
+        Raises:
+            V20ConnectionError or V20Timeout if the Order could not be
+            submitted and was not found in the Account
+        """
+        return (await run_steps(
+            self.ctx,
+            self._spec._create_reconciled_steps(
+                accountID,
+                order,
+                lastTransactionID,
+                attempts,
+                settle_delay
+            )
+        ))
+
+
+#
+# The AsyncEntitySpec classes of the modules that have coroutine versions of
+# methods making more than one request
+#
+ASYNC_ENTITY_SPECS = {
+    "order": AsyncOrderEntitySpec,
+}
+
+
+class AsyncContext(Context):
+    """
+    A v20.AsyncContext is a v20.Context whose API methods are coroutines
+    executed on an asyncio event loop, e.g.
+
+        response = await ctx.account.get(accountID)
+
+        response = await ctx.pricing.stream(accountID, instruments="EUR_USD")
+
+        async for msg_type, msg in response.parts():
+            ...
+
+    All requests share a bounded pool of keep-alive connections, so many
+    accounts and streams can be serviced from a single thread.
+    """
+    def __init__(self, hostname, *args, **kwargs):
+        """
+        Create an asyncio API context for v20 access
+
+        Args:
+            hostname: The hostname of the v20 REST server
+            max_connections: The maximum number of connections that may be
+                open to the v20 REST server at once. Open streams count
+                towards this limit. Not used if a transport is given.
+            transport: The v20.aio.AsyncTransport that requests are sent
+                with. Defaults to a v20.aio.AsyncHTTPTransport using
+                max_connections.
+            args, kwargs: See v20.Context
+
+        Raises:
+            ValueError if the transport is not a v20.aio.AsyncTransport
+        """
+        self.max_connections = kwargs.pop("max_connections", 100)
+
+        transport = kwargs.get("transport")
+
+        if transport is not None and \
+           not isinstance(transport, AsyncTransport):
+            raise ValueError(
+                "An AsyncContext requires a v20.aio.AsyncTransport, e.g. "
+                "AsyncHTTP2Transport or v20.aio_mock.AsyncMockTransport, "
+                "not {}".format(
+                    transport.__class__.__name__
+                )
+            )
+
+        super(AsyncContext, self).__init__(hostname, *args, **kwargs)
+
+        self.set_idle_timeout(self.idle_timeout)
+
+        for name in [
+            "account", "user", "position", "pricing", "transaction",
+            "primitives", "trade", "site", "pricing_common", "order",
+            "instrument"
+        ]:
+            spec_class = ASYNC_ENTITY_SPECS.get(name, AsyncEntitySpec)
+
+            setattr(
+                self,
+                name,
+                spec_class(self, getattr(self, name).__class__)
+            )
+
+    def _create_transport(self, pool_connections, pool_maxsize, pool_block):
+        return AsyncHTTPTransport(
+            self.hostname,
+            self.port,
+            self.ssl,
+            self.max_connections
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """
+        Close all idle connections held by the context
+        """
+        self.close_idle_connections()
+
+    def set_idle_timeout(self, timeout):
+        """
+        Set the number of seconds a pooled connection may be idle before it
+        is closed
+        """
+        self.idle_timeout = timeout
+
+        if isinstance(self.transport, AsyncHTTPTransport):
+            self.transport.set_idle_timeout(timeout)
+
+    async def prewarm(self, count):
+        """
+        Open connections to the v20 REST server ahead of time so that the
+        first requests made through the context do not pay for the TCP and
+        TLS handshakes
+
+        Args:
+            count: The number of connections to open
+        """
+        await self.transport.prewarm(
+            "{}/".format(self._base_url),
+            count,
+            self.poll_timeout
+        )
+
+    async def execute(self, call):
+        """
+        Execute a deferred EntitySpec call through the context
+
+        Args:
+            call: A v20.call.Call object
+
+        Returns:
+            The value returned by the EntitySpec method, generally a
+            v20.response.Response
+        """
+        request = call.prepare(self)
+
+        response = await self.request(request)
+
+        return call.complete(self, response)
+
+    def iter_array(self, path, method, *args, **kwargs):
+        """
+        Not supported by an AsyncContext. Context.iter_array reads the
+        response body synchronously, which an AsyncResponse cannot provide.
+
+        Raises:
+            TypeError always
+        """
+        raise TypeError(
+            "iter_array is not supported by an AsyncContext, use a "
+            "Context, or await the method and read response.chunks()"
+        )
+
+    async def gather(self, calls, max_workers=None, deadline=None):
+        """
+        Execute many deferred EntitySpec calls concurrently, and collect
+        their responses in the order the calls were given
+
+        Args:
+            calls: A list of v20.call.Call objects
+            max_workers: The maximum number of requests in flight at once.
+                Defaults to the context's max_connections.
+            deadline: The number of seconds the whole batch may take, or
+                None for no limit. Calls that have not completed by then
+                are cancelled: those still waiting for a turn are never
+                sent, but a request already sent may still complete on the
+                server. A deadline should only be used for calls that are
+                safe to repeat, unless the outcome of the others is checked
+                afterwards.
+
+        Returns:
+            v20.batch.BatchResult holding, in the order of the calls, the
+            v20.response.Response of each call or the exception raised by
+            it. The result of a call cancelled at the deadline is a
+            V20Timeout.
+        """
+        calls = list(calls)
+
+        if max_workers is None:
+            max_workers = self.max_connections
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        prepared = [None] * len(calls)
+
+        async def execute(index, call):
+            async with semaphore:
+                request = call.prepare(self)
+
+                prepared[index] = request
+
+                response = await self.request(request)
+
+                return call.complete(self, response)
+
+        tasks = [
+            asyncio.ensure_future(execute(index, call))
+            for index, call in enumerate(calls)
+        ]
+
+        if len(tasks) > 0:
+            await asyncio.wait(tasks, timeout=deadline)
+
+        results = []
+
+        for call, request, task in zip(calls, prepared, tasks):
+            if not task.done():
+                task.cancel()
+
+                results.append(self._deadline_timeout(call, request))
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+
+        return BatchResult(results)
+
+    async def request(self, request):
+        """
+        Perform an HTTP request through the context, retrying it as the
+        context's retry policy allows
+
+        Args:
+            request: A v20.request.Request object
+
+        Returns:
+            A v20.aio.AsyncResponse object
+        """
+
+        attempt = 0
+
+        while True:
+            try:
+                response = await self._request(request)
+            except (V20ConnectionError, V20Timeout) as e:
+                if self.retry_policy is None:
+                    raise
+
+                delay = self.retry_policy.delay(request, attempt, error=e)
+
+                if delay is None:
+                    raise
+            else:
+                if self.retry_policy is None:
+                    return response
+
+                delay = self.retry_policy.delay(
+                    request,
+                    attempt,
+                    response=response
+                )
+
+                if delay is None:
+                    return response
+
+                response.close()
+
+            await asyncio.sleep(delay)
+
+            attempt += 1
+
+    async def _schedule(self, request):
+        """
+        Wait on the event loop until the scheduler lets a request be sent
+        """
+        waiter = self.scheduler.enqueue(request)
+
+        try:
+            while True:
+                delay = self.scheduler.poll(waiter)
+
+                if delay is None:
+                    return
+
+                await asyncio.sleep(delay)
+        except BaseException:
+            self.scheduler.cancel(waiter)
+            raise
+
+    async def _request(self, request):
+        url = "{}{}".format(self._base_url, request.path)
+
+        if self.scheduler is not None:
+            await self._schedule(request)
+
+        timeout = self.poll_timeout
+
+        if request.stream is True:
+            timeout = self.stream_timeout
+
+        if request.timeout is not None:
+            timeout = request.timeout
+
+        reply = await self.transport.send(request, url, self._headers, timeout)
+
+        request.headers = reply.request_headers
+
+        response = AsyncResponse(
+            request,
+            request.method,
+            reply.url,
+            reply.status,
+            reply.reason,
+            reply.headers
+        )
+
+        if request.stream:
+            response.set_line_parser(request.line_parser)
+            response.set_lines(_StreamLines(reply))
+        else:
+            response.set_raw_body(reply.content)
+
+        return response
@@ -0,0 +1,119 @@
+import asyncio
+
+from requests.structures import CaseInsensitiveDict
+
+from v20.aio import AsyncTransport
+from v20.mock import SyntheticStream
+from v20.transport import Reply
+
+
+class _MockChunks(object):
+    """
+    Async iterator over the chunks of a v20.mock.SyntheticStream, paced
+    with asyncio.sleep
+    """
+    def __init__(self, stream, url):
+        self._schedule = stream.schedule(url)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        for item in self._schedule:
+            if not isinstance(item, float):
+                return item
+
+            if item > 0:
+                await asyncio.sleep(item)
+
+        raise StopAsyncIteration
+
+    def close(self):
+        self._schedule.close()
+
+
+class _BodyChunks(object):
+    """
+    Async iterator over a body held in memory, as a single chunk
+    """
+    def __init__(self, body):
+        self._body = body
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._body is None:
+            raise StopAsyncIteration
+
+        body, self._body = self._body, None
+
+        return body
+
+
+class AsyncMockTransport(AsyncTransport):
+    """
+    An AsyncMockTransport serves the responses and SyntheticStreams of a
+    v20.mock.MockTransport to an AsyncContext. Latency and stream pacing
+    are awaited rather than slept, so the event loop is never blocked.
+
+        transport = MockTransport(latency=0.002)
+        transport.load("recorded.jsonl")
+
+        ctx = AsyncContext(
+            "localhost",
+            transport=AsyncMockTransport(transport)
+        )
+    """
+    def __init__(self, transport):
+        """
+        Create a new AsyncMockTransport
+
+        Args:
+            transport: The v20.mock.MockTransport holding the responses.
+                Requests are logged in its requests list.
+        """
+        self.transport = transport
+
+    async def send(self, request, url, headers, timeout):
+        latency = self.transport._receive(request)
+
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        response = self.transport._respond(request)
+
+        if isinstance(response, SyntheticStream):
+            chunks = _MockChunks(response, url)
+
+            return Reply(
+                url,
+                200,
+                "OK",
+                CaseInsensitiveDict(
+                    {"content-type": "application/octet-stream"}
+                ),
+                request_headers=headers,
+                chunks=lambda chunk_size: chunks,
+                chunked=True,
+                release=chunks.close
+            )
+
+        status, reason, body = response
+
+        reply = Reply(
+            url,
+            status,
+            reason,
+            CaseInsensitiveDict({"content-type": "application/json"}),
+            request_headers=headers
+        )
+
+        if request.stream:
+            chunks = _BodyChunks(body)
+
+            reply.chunks = lambda chunk_size: chunks
+        else:
+            reply.content = body
+
+        return reply
@@ -113,12 +113,81 @@ class EntityDict(object):
             self.dict[key] = self.prop_dict_value(value)
 
 
+#
+# The wire types that are converted using Context.convert_decimal_number
+#
+DECIMAL_NUMBER_TYPES = [
+    "primitives.DecimalNumber",
+    "primitives.AccountUnits",
+    "pricing_common.PriceValue"
+]
+
+
 class BaseEntity(object):
     _properties = []
 
+    #
+    # Entities store their properties in slots declared by each subclass.
+    # The base class only holds the source of a lazily constructed entity.
+    #
+    __slots__ = ("_lazy_data", "_lazy_ctx")
+
     def __init__(self):
         pass
 
+    @classmethod
+    def lazy_from_dict(cls, data, ctx):
+        """
+        Instantiate a new entity that wraps the dict passed in (generally
+        from loading a JSON response) without copying it. Each field is
+        converted the same way from_dict would convert it, but only when it
+        is first read, and the result is stored on the entity.
+        """
+        entity = cls.__new__(cls)
+        entity._lazy_data = data
+        entity._lazy_ctx = ctx
+        return entity
+
+    @classmethod
+    def _lazy_properties(cls):
+        properties = cls.__dict__.get("_lazy_property_map")
+
+        if properties is None:
+            properties = {p.name: p for p in cls._properties}
+            cls._lazy_property_map = properties
+
+        return properties
+
+    def __getattr__(self, name):
+        #
+        # Only reached when normal attribute lookup fails, which for an
+        # entity created by lazy_from_dict means a field that has not been
+        # read yet
+        #
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        try:
+            data = self._lazy_data
+        except AttributeError:
+            raise AttributeError(name)
+
+        prop = self._lazy_properties().get(name)
+
+        if prop is None:
+            raise AttributeError(name)
+
+        value = data.get(name)
+
+        if value is None:
+            value = prop.default
+        else:
+            value = _lazy_convert(prop, value, self._lazy_ctx)
+
+        setattr(self, name, value)
+
+        return value
+
     def fields(self):
         for prop in self._properties:
             value = getattr(self, prop.name)
@@ -246,3 +315,118 @@ class BaseEntity(object):
                 self_value.diff(other_value)
 
         return True
+
+
+class TypeRegistry(object):
+    """
+    A TypeRegistry maps the value of the "type" field of a polymorphic
+    entity (such as a Transaction or an Order) to the handler used to
+    instantiate it from a dict. A handler is either an entity class or any
+    callable taking (data, ctx).
+
+    The registries (v20.order.order_types and
+    v20.transaction.transaction_types) are module globals shared by the
+    whole process. Registering, unregistering or skipping a type changes
+    how entities of that type are built for every Context, including those
+    used by other threads or libraries. A handler that should only apply to
+    one Context can check the ctx it is passed and fall back to the entity
+    class otherwise.
+    """
+    def __init__(self, base):
+        self.base = base
+        self._handlers = {}
+        self._classes = {}
+
+    def register(self, type, handler):
+        """
+        Register the handler used to instantiate entities of a type. This
+        applies process-wide, to every Context.
+
+        Args:
+            type: The value of the entity's "type" field
+            handler: An entity class, or a callable taking (data, ctx)
+        """
+        if hasattr(handler, "from_dict"):
+            self._classes[type] = handler
+            handler = handler.from_dict
+
+        self._handlers[type] = handler
+
+    def unregister(self, type):
+        """
+        Remove the handler for a type. Entities of that type are
+        instantiated as the base class, by every Context.
+
+        Args:
+            type: The value of the entity's "type" field
+        """
+        self._handlers.pop(type, None)
+
+    def skip(self, type):
+        """
+        Skip the construction of entities of a type. They are instantiated
+        lazily instead (see BaseEntity.lazy_from_dict), so reading the
+        stream or list they appear in costs a single allocation per entity,
+        and fields are only converted if they are actually read. This
+        applies process-wide, to every Context.
+
+        Args:
+            type: The value of the entity's "type" field
+        """
+        cls = self._classes.get(type, self.base)
+        self._handlers[type] = cls.lazy_from_dict
+
+    def get(self, type):
+        """
+        Get the handler for a type
+
+        Args:
+            type: The value of the entity's "type" field
+
+        Returns:
+            The callable used to instantiate entities of the type, or None
+            if the type is unknown
+        """
+        return self._handlers.get(type)
+
+    def types(self):
+        """
+        Returns:
+            The list of types with a registered handler
+        """
+        return list(self._handlers.keys())
+
+
+_entity_classes = {}
+
+
+def _entity_class(type_name):
+    cls = _entity_classes.get(type_name)
+
+    if cls is not None:
+        return cls
+
+    name = type_name.split(".")[-1]
+
+    for cls in BaseEntity.__subclasses__():
+        if cls.__name__ == name:
+            _entity_classes[type_name] = cls
+            return cls
+
+    raise TypeError("Unknown entity type {}".format(type_name))
+
+
+def _lazy_convert(prop, value, ctx):
+    if prop.typeClass == "primitive":
+        if prop.typeName in DECIMAL_NUMBER_TYPES:
+            return ctx.convert_decimal_number(value)
+        return value
+
+    if prop.typeClass == "object":
+        return _entity_class(prop.typeName).from_dict(value, ctx)
+
+    if prop.typeClass == "array_object":
+        cls = _entity_class(prop.typeName)
+        return [cls.from_dict(d, ctx) for d in value]
+
+    return value
@@ -0,0 +1,74 @@
+class BatchResult(object):
+    """
+    A BatchResult holds the outcome of each request made in a batch, in the
+    order the requests were given. Each result is either the
+    v20.response.Response received or the exception raised when making the
+    request. A batch may partially fail: the failures are reported rather
+    than raised, so the successful results are never lost.
+
+        result = ctx.order.create_many(accountID, orders)
+
+        for index, failure in result.failures():
+            print(orders[index], failure)
+    """
+    def __init__(self, results):
+        self.results = results
+
+    def __len__(self):
+        return len(self.results)
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+    @staticmethod
+    def is_failure(result):
+        """
+        Returns:
+            True if a result is an exception or a Response with an error
+            status
+        """
+        if isinstance(result, Exception):
+            return True
+
+        return int(result.status) >= 400
+
+    def successes(self):
+        """
+        Returns:
+            A list of (index, Response) tuples for the requests that
+            succeeded
+        """
+        return [
+            (index, result)
+            for index, result in enumerate(self.results)
+            if not self.is_failure(result)
+        ]
+
+    def failures(self):
+        """
+        Returns:
+            A list of (index, result) tuples for the requests that failed,
+            where the result is either the Response with an error status
+            or the exception raised
+        """
+        return [
+            (index, result)
+            for index, result in enumerate(self.results)
+            if self.is_failure(result)
+        ]
+
+    @property
+    def ok(self):
+        """
+        True if every request in the batch succeeded
+        """
+        return len(self.failures()) == 0
+
+    def __str__(self):
+        return "BatchResult({} succeeded, {} failed)".format(
+            len(self.successes()),
+            len(self.failures())
+        )
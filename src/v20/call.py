@@ -0,0 +1,213 @@
+import time
+
+
+def multi_request(method):
+    """
+    Mark an EntitySpec method that makes more than one request (or makes
+    its requests lazily, as a generator). Such a method cannot be deferred
+    as a Call, and an AsyncContext does not run it through one.
+    """
+    method.multi_request = True
+
+    return method
+
+
+class RequestCaptured(Exception):
+    """
+    A RequestCaptured exception is raised by a CallContext to stop an
+    EntitySpec method once it has built the Request it wants to send.
+    """
+    def __init__(self, request):
+        self.request = request
+
+
+class CallContext(object):
+    """
+    A CallContext stands in for a v20.Context while an EntitySpec method is
+    being executed. It forwards everything to the real context except for
+    request(), which either captures the Request built by the method or
+    hands back a Response that has already been fetched.
+
+    The candle cache and transaction journal are hidden from the method, so
+    the Request captured is always the one the method would send to the
+    server.
+    """
+    candle_cache = None
+
+    transaction_journal = None
+
+    def __init__(self, ctx, response=None):
+        self._ctx = ctx
+        self._response = response
+
+    def __getattr__(self, name):
+        return getattr(self._ctx, name)
+
+    def request(self, request):
+        if self._response is None:
+            raise RequestCaptured(request)
+
+        return self._response
+
+
+class Call(object):
+    """
+    A Call is a deferred invocation of an EntitySpec method. It separates
+    building the Request from sending it, so that the HTTP exchange can be
+    performed by something other than Context.request (an event loop, a
+    thread pool, ...) while the EntitySpec method still does the request
+    construction and response parsing.
+    """
+    def __init__(self, method, *args, **kwargs):
+        """
+        Create a new Call
+
+        Args:
+            method: A bound EntitySpec method, e.g. ctx.account.get, or
+                the same method of an AsyncContext
+            args: Positional arguments for the method
+            kwargs: Keyword arguments for the method
+        """
+        #
+        # The methods of an AsyncContext wrap those of an EntitySpec
+        #
+        method = getattr(method, "__wrapped__", method)
+
+        if getattr(method, "multi_request", False):
+            raise TypeError(
+                "{}.{} makes more than one request and cannot be "
+                "deferred as a Call".format(
+                    method.__self__.__class__.__module__,
+                    method.__name__
+                )
+            )
+
+        self.spec_class = method.__self__.__class__
+        self.name = method.__name__
+        self.args = args
+        self.kwargs = kwargs
+
+    def _invoke(self, ctx):
+        spec = self.spec_class(ctx)
+        return getattr(spec, self.name)(*self.args, **self.kwargs)
+
+    def run(self, ctx):
+        """
+        Make the call directly, exactly as calling the EntitySpec method
+        would
+
+        Args:
+            ctx: The v20.Context the call is made through
+
+        Returns:
+            The value returned by the EntitySpec method
+        """
+        return self._invoke(ctx)
+
+    def prepare(self, ctx):
+        """
+        Run the EntitySpec method up to the point where it would send its
+        request
+
+        Args:
+            ctx: The v20.Context the call is made through
+
+        Returns:
+            The v20.request.Request built by the method
+        """
+        try:
+            self._invoke(CallContext(ctx))
+        except RequestCaptured as e:
+            return e.request
+
+        raise ValueError(
+            "{}.{} did not make a request".format(
+                self.spec_class.__module__,
+                self.name
+            )
+        )
+
+    def complete(self, ctx, response):
+        """
+        Run the EntitySpec method again, handing it the Response for the
+        Request built by prepare() so that the body is parsed exactly as it
+        would be for a direct call
+
+        Args:
+            ctx: The v20.Context the call is made through
+            response: The v20.response.Response received for the request
+
+        Returns:
+            The value returned by the EntitySpec method
+        """
+        return self._invoke(CallContext(ctx, response))
+
+    def __str__(self):
+        return "{}.{}".format(self.spec_class.__module__, self.name)
+
+
+class Sleep(object):
+    """
+    A step of an operation written as steps (see run_steps) that waits
+    before the next step
+    """
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+
+class Return(object):
+    """
+    A step of an operation written as steps (see run_steps) that ends it
+    with a value
+    """
+    def __init__(self, value):
+        self.value = value
+
+
+def run_steps(ctx, steps):
+    """
+    Run an operation that makes more than one request, written as a
+    generator of steps so that the same code can be run by a Context and,
+    with v20.aio.run_steps, by an AsyncContext. Each step yielded is:
+
+        a Call      the call is made, and its result is sent back into the
+                    generator, or the exception it raised is thrown into it
+        a Sleep     the operation waits
+        a Return    the operation ends with the Return's value
+
+    Args:
+        ctx: The v20.Context the calls are made through
+        steps: The generator of steps
+
+    Returns:
+        The value of the Return step, or None if the generator ends without
+        one
+    """
+    value = None
+    error = None
+
+    try:
+        while True:
+            if error is not None:
+                step = steps.throw(error)
+            else:
+                step = steps.send(value)
+
+            value = None
+            error = None
+
+            if isinstance(step, Return):
+                return step.value
+
+            if isinstance(step, Sleep):
+                time.sleep(step.seconds)
+                continue
+
+            try:
+                value = step.run(ctx)
+            except Exception as e:
+                error = e
+    except StopIteration:
+        return None
+    finally:
+        steps.close()
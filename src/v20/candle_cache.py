@@ -0,0 +1,446 @@
+"""
+A persistent, on-disk store of completed candlesticks.
+
+Candlesticks are stored per (instrument, granularity, price components,
+smoothing, alignment) key in a file of fixed-size little-endian records
+sorted by time:
+
+    int64 time (ns since the epoch)
+    int64 volume
+    float64 o, h, l, c    (once per price component, in the order given
+                           by the price parameter, e.g. "BA" is bid then
+                           ask)
+
+so the file can be memory-mapped directly (e.g. with numpy.memmap). A JSON
+sidecar file records the time ranges that are fully covered by the stored
+candlesticks, and the number of decimal places the prices were received
+with, so that the stored prices are served as the same strings. Incomplete
+candlesticks are never stored.
+"""
+
+import os
+import re
+import struct
+import threading
+import time
+import ujson as json
+
+try:
+    from os import replace
+except ImportError:
+    #
+    # Python 2 has no os.replace. Its os.rename replaces an existing file
+    # everywhere but on Windows.
+    #
+    from os import rename as replace
+
+from v20 import candles
+from v20 import parallel
+from v20 import timestamps
+from v20.request import Request
+from v20.response import Response
+
+
+class CandleStore(object):
+    """
+    The stored candlesticks and covered time ranges for a single key
+    """
+    def __init__(self, path, components):
+        self.path = path
+        self.components = components
+        self.record = struct.Struct("<qq" + "dddd" * len(components))
+        self.ranges = []
+
+        #
+        # The number of decimal places of the prices. The v20 REST server
+        # formats every price of an instrument with its display precision.
+        #
+        self.decimals = None
+
+        if os.path.exists(path + ".json"):
+            with open(path + ".json") as f:
+                sidecar = json.load(f)
+
+            self.ranges = sidecar["ranges"]
+            self.decimals = sidecar.get("decimals")
+
+    def count(self):
+        if not os.path.exists(self.path):
+            return 0
+
+        return os.path.getsize(self.path) // self.record.size
+
+    def _time_at(self, f, index):
+        f.seek(index * self.record.size)
+        return struct.unpack("<q", f.read(8))[0]
+
+    def _bisect(self, f, n, t):
+        lo, hi = 0, n
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+
+            if self._time_at(f, mid) < t:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+    def read(self, from_ns, to_ns):
+        """
+        Returns:
+            The stored records with a time in [from_ns, to_ns)
+        """
+        n = self.count()
+
+        if n == 0:
+            return []
+
+        with open(self.path, "rb") as f:
+            start = self._bisect(f, n, from_ns)
+            end = self._bisect(f, n, to_ns)
+
+            f.seek(start * self.record.size)
+
+            data = f.read((end - start) * self.record.size)
+
+        return [
+            self.record.unpack_from(data, i * self.record.size)
+            for i in range(end - start)
+        ]
+
+    def missing(self, from_ns, to_ns):
+        """
+        Returns:
+            The parts of [from_ns, to_ns) that are not covered, as a list of
+            (from_ns, to_ns) tuples
+        """
+        gaps = []
+
+        start = from_ns
+
+        for range_from, range_to in self.ranges:
+            if range_to <= start:
+                continue
+
+            if range_from >= to_ns:
+                break
+
+            if range_from > start:
+                gaps.append((start, range_from))
+
+            start = max(start, range_to)
+
+        if start < to_ns:
+            gaps.append((start, to_ns))
+
+        return gaps
+
+    def add(self, records, from_ns, to_ns, decimals=None):
+        """
+        Store completed candlestick records and mark [from_ns, to_ns) as
+        covered
+
+        Args:
+            records: The records to store
+            from_ns: The start of the range covered
+            to_ns: The end of the range covered
+            decimals: The number of decimal places of the records' prices as
+                received, or None if unknown
+        """
+        if self.decimals is None:
+            self.decimals = decimals
+
+        n = self.count()
+
+        last = None
+
+        if n > 0:
+            with open(self.path, "rb") as f:
+                last = self._time_at(f, n - 1)
+
+        records = sorted(records)
+
+        if last is None or len(records) == 0 or records[0][0] > last:
+            with open(self.path, "ab") as f:
+                for record in records:
+                    f.write(self.record.pack(*record))
+        else:
+            merged = dict((r[0], r) for r in self.read(-2 ** 63, 2 ** 63 - 1))
+            merged.update((r[0], r) for r in records)
+
+            with open(self.path + ".tmp", "wb") as f:
+                for t in sorted(merged):
+                    f.write(self.record.pack(*merged[t]))
+
+            replace(self.path + ".tmp", self.path)
+
+        if from_ns < to_ns:
+            self.ranges = _merge_ranges(self.ranges + [[from_ns, to_ns]])
+
+            with open(self.path + ".json.tmp", "w") as f:
+                json.dump(
+                    {"ranges": self.ranges, "decimals": self.decimals},
+                    f
+                )
+
+            replace(self.path + ".json.tmp", self.path + ".json")
+
+
+def _merge_ranges(ranges):
+    merged = []
+
+    for range_from, range_to in sorted(ranges):
+        if len(merged) > 0 and range_from <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], range_to)
+        else:
+            merged.append([range_from, range_to])
+
+    return merged
+
+
+class CandleCache(object):
+    """
+    A CandleCache is consulted by instrument.candles for requests with both
+    a fromTime and a toTime. Candlesticks already stored for the range are
+    served from disk, only the missing parts of the range are fetched from
+    the v20 REST server, and the completed candlesticks fetched are added to
+    the store. Install one with Context.set_candle_cache().
+
+    The cache returns the candlesticks starting within [fromTime, toTime).
+    """
+    def __init__(self, directory, max_workers=4):
+        """
+        Create a new CandleCache
+
+        Args:
+            directory: The directory to store candlesticks in. It is created
+                if it does not exist.
+            max_workers: The maximum number of concurrent requests made to
+                fill the missing parts of a range
+        """
+        self.directory = directory
+        self.max_workers = max_workers
+        self._stores = {}
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def store(self, instrument, granularity, price="M", smooth="",
+              dailyAlignment="", alignmentTimezone="", weeklyAlignment=""):
+        """
+        Get the CandleStore for a key
+
+        Returns:
+            A v20.candle_cache.CandleStore
+        """
+        key = (
+            instrument, granularity, price, smooth,
+            dailyAlignment, alignmentTimezone, weeklyAlignment
+        )
+
+        with self._lock:
+            store = self._stores.get(key)
+
+            if store is None:
+                name = re.sub(r"[^A-Za-z0-9_.-]", "-", "_".join(key))
+
+                store = CandleStore(
+                    os.path.join(self.directory, name),
+                    [{"B": "bid", "A": "ask", "M": "mid"}[c] for c in price]
+                )
+
+                self._stores[key] = store
+
+        return store
+
+    def request(self, ctx, request):
+        """
+        Perform a candles request through the cache
+
+        Args:
+            ctx: The v20.Context to fetch missing candlesticks through
+            request: The v20.request.Request for the candles
+
+        Returns:
+            A v20.response.Response
+        """
+        params = request.params
+
+        if params.get("from") is None or params.get("to") is None or \
+           params.get("count") is not None:
+            return ctx.request(request)
+
+        try:
+            from_ns = timestamps.to_ns(params["from"])
+            to_ns = timestamps.to_ns(params["to"])
+        except ValueError:
+            return ctx.request(request)
+
+        instrument = request.path.split("/")[3]
+        granularity = params.get("granularity", "S5")
+
+        store = self.store(
+            instrument,
+            granularity,
+            params.get("price", "M"),
+            params.get("smooth", ""),
+            params.get("dailyAlignment", ""),
+            params.get("alignmentTimezone", ""),
+            params.get("weeklyAlignment", "")
+        )
+
+        with self._lock:
+            gaps = store.missing(from_ns, to_ns)
+
+        now_ns = timestamps.to_ns(time.time())
+
+        #
+        # A candlestick starting later than this may not have ended, and
+        # its interval may not even have a candlestick yet, so it is never
+        # marked as covered
+        #
+        settled_ns = now_ns - candles.granularity_ns(granularity)
+
+        windows = []
+
+        for gap_from, gap_to in gaps:
+            gap_to = min(gap_to, now_ns)
+
+            windows.extend(
+                candles.split_range(granularity, gap_from, gap_to)
+            )
+
+        def fetch(window):
+            window_request = Request(request.method, request.path)
+            window_request.params = dict(params)
+            window_request.params.pop("includeFirst", None)
+            window_request.set_param(
+                "from",
+                timestamps.format_ns(window[0], ctx.datetime_format)
+            )
+            window_request.set_param(
+                "to",
+                timestamps.format_ns(window[1], ctx.datetime_format)
+            )
+            return window, ctx.request(window_request)
+
+        fetched = {}
+
+        for window, response in parallel.ordered_map(
+            fetch,
+            windows,
+            self.max_workers
+        ):
+            if str(response.status) != "200":
+                return response
+
+            window_candles = json.loads(response.raw_body).get("candles", [])
+
+            covered_to = min(window[1], settled_ns)
+
+            complete = []
+
+            decimals = None
+
+            for candle in window_candles:
+                candle_ns = timestamps.to_ns(candle["time"])
+
+                fetched[candle_ns] = candle
+
+                if candle.get("complete"):
+                    complete.append(self._to_record(store, candle_ns, candle))
+
+                    if decimals is None:
+                        decimals = self._decimals(store, candle)
+                else:
+                    covered_to = min(covered_to, candle_ns)
+
+            complete = [r for r in complete if r[0] < covered_to]
+
+            with self._lock:
+                store.add(complete, window[0], covered_to, decimals)
+
+        with self._lock:
+            result = dict(
+                (r[0], self._to_candle(store, r, ctx.datetime_format))
+                for r in store.read(from_ns, to_ns)
+            )
+
+        for candle_ns, candle in fetched.items():
+            if from_ns <= candle_ns < to_ns and candle_ns not in result:
+                result[candle_ns] = candle
+
+        if params.get("includeFirst", "").lower() == "false":
+            result.pop(from_ns, None)
+
+        response = Response(
+            request,
+            request.method,
+            "{}{}".format(ctx._base_url, request.path),
+            200,
+            "OK",
+            {"content-type": "application/json"}
+        )
+
+        response.set_raw_body(
+            json.dumps({
+                "instrument": instrument,
+                "granularity": granularity,
+                "candles": [result[t] for t in sorted(result)]
+            }).encode("utf-8")
+        )
+
+        return response
+
+    def _to_record(self, store, candle_ns, candle):
+        record = [candle_ns, int(candle.get("volume", 0))]
+
+        for component in store.components:
+            data = candle[component]
+            record.extend([
+                float(data["o"]),
+                float(data["h"]),
+                float(data["l"]),
+                float(data["c"])
+            ])
+
+        return tuple(record)
+
+    def _decimals(self, store, candle):
+        """
+        Returns:
+            The number of decimal places of a candlestick's prices
+        """
+        price = str(candle[store.components[0]]["o"])
+
+        if "." not in price:
+            return 0
+
+        return len(price) - price.index(".") - 1
+
+    def _format_price(self, store, price):
+        if store.decimals is None:
+            return repr(price)
+
+        return "{:.{}f}".format(price, store.decimals)
+
+    def _to_candle(self, store, record, datetime_format):
+        candle = {
+            "time": timestamps.format_ns(record[0], datetime_format),
+            "volume": record[1],
+            "complete": True
+        }
+
+        for i, component in enumerate(store.components):
+            o, h, l, c = record[2 + i * 4:6 + i * 4]
+            candle[component] = {
+                "o": self._format_price(store, o),
+                "h": self._format_price(store, h),
+                "l": self._format_price(store, l),
+                "c": self._format_price(store, c)
+            }
+
+        return candle
@@ -0,0 +1,100 @@
+from v20 import timestamps
+
+
+#
+# The maximum number of candlesticks the v20 REST server returns for a
+# single candles request
+#
+MAX_CANDLE_COUNT = 5000
+
+
+#
+# The length of each candlestick granularity in seconds. Weekly and monthly
+# candles use their longest possible length.
+#
+GRANULARITY_SECONDS = {
+    "S5": 5,
+    "S10": 10,
+    "S15": 15,
+    "S30": 30,
+    "M1": 60,
+    "M2": 120,
+    "M4": 240,
+    "M5": 300,
+    "M10": 600,
+    "M15": 900,
+    "M30": 1800,
+    "H1": 3600,
+    "H2": 7200,
+    "H3": 10800,
+    "H4": 14400,
+    "H6": 21600,
+    "H8": 28800,
+    "H12": 43200,
+    "D": 86400,
+    "W": 604800,
+    "M": 2678400,
+}
+
+
+def granularity_ns(granularity):
+    """
+    Returns:
+        The length of a candlestick granularity in nanoseconds
+    """
+    try:
+        return GRANULARITY_SECONDS[granularity] * 1000000000
+    except KeyError:
+        raise ValueError("Unknown granularity {}".format(granularity))
+
+
+def split_range(granularity, from_ns, to_ns, max_count=MAX_CANDLE_COUNT):
+    """
+    Split a time range into consecutive windows that each cover no more
+    than max_count candlesticks of the granularity
+
+    Args:
+        granularity: The candlestick granularity
+        from_ns: The start of the range, in nanoseconds since the epoch
+        to_ns: The end of the range, in nanoseconds since the epoch
+        max_count: The maximum number of candlesticks in a window
+
+    Returns:
+        A list of (from_ns, to_ns) tuples
+    """
+    span = granularity_ns(granularity) * (max_count - 1)
+
+    windows = []
+
+    start = from_ns
+
+    while start < to_ns:
+        end = min(start + span, to_ns)
+        windows.append((start, end))
+        start = end
+
+    return windows
+
+
+def window_params(window, index, granularity, datetime_format):
+    """
+    Build the fromTime/toTime/includeFirst parameters for a window produced
+    by split_range. Every window after the first starts one candlestick
+    before its boundary and excludes that first candlestick, so the
+    candlestick at the boundary is always requested whichever way the
+    server treats the end of the previous window.
+    """
+    start, end = window
+
+    params = {"toTime": timestamps.format_ns(end, datetime_format)}
+
+    if index == 0:
+        params["fromTime"] = timestamps.format_ns(start, datetime_format)
+    else:
+        params["fromTime"] = timestamps.format_ns(
+            start - granularity_ns(granularity),
+            datetime_format
+        )
+        params["includeFirst"] = "false"
+
+    return params
@@ -0,0 +1,118 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def require_numpy():
+    if numpy is None:
+        raise ImportError(
+            "numpy is required for columnar results (pip install numpy)"
+        )
+
+
+def time_to_ns(times):
+    """
+    Convert a list of wire-format DateTimes (RFC3339 or UNIX) into an int64
+    array of nanoseconds since the epoch
+    """
+    require_numpy()
+
+    if len(times) == 0:
+        return numpy.zeros(0, dtype=numpy.int64)
+
+    if times[0].endswith("Z"):
+        return numpy.array(
+            [t[:-1] for t in times],
+            dtype="datetime64[ns]"
+        ).view(numpy.int64)
+
+    seconds, _, fraction = numpy.char.partition(
+        numpy.array(times), "."
+    ).T
+
+    fraction = numpy.char.ljust(fraction, 9, "0")
+
+    return seconds.astype(numpy.int64) * 1000000000 + \
+        fraction.astype(numpy.int64)
+
+
+class CandlestickDataColumns(object):
+    """
+    The open, high, low and close prices of a price component (bid, ask or
+    mid) of a series of candlesticks, each held as a float64 array
+    """
+    def __init__(self, o, h, l, c):
+        self.o = o
+        self.h = h
+        self.l = l
+        self.c = c
+
+    @staticmethod
+    def from_list(data):
+        """
+        Instantiate a new CandlestickDataColumns from a list of CandlestickData
+        dicts (generally from loading a JSON response)
+        """
+        return CandlestickDataColumns(*[
+            numpy.array([d[key] for d in data], dtype=numpy.float64)
+            for key in ("o", "h", "l", "c")
+        ])
+
+
+class CandlestickColumns(object):
+    """
+    A series of candlesticks held column by column in NumPy arrays rather
+    than as a list of Candlestick objects. time is an int64 array of
+    nanoseconds since the epoch, volume is int64 and complete is bool. The
+    bid, ask and mid components are CandlestickDataColumns, or None if the
+    component was not requested.
+    """
+    def __init__(
+        self,
+        time,
+        volume,
+        complete,
+        bid=None,
+        ask=None,
+        mid=None,
+        instrument=None,
+        granularity=None
+    ):
+        self.instrument = instrument
+        self.granularity = granularity
+        self.time = time
+        self.volume = volume
+        self.complete = complete
+        self.bid = bid
+        self.ask = ask
+        self.mid = mid
+
+    def __len__(self):
+        return len(self.time)
+
+    @staticmethod
+    def from_list(data, instrument=None, granularity=None):
+        """
+        Instantiate a new CandlestickColumns directly from a list of
+        Candlestick dicts (generally from loading a JSON response), without
+        building any Candlestick objects
+        """
+        require_numpy()
+
+        components = {}
+
+        for component in ("bid", "ask", "mid"):
+            if len(data) > 0 and data[0].get(component) is not None:
+                components[component] = CandlestickDataColumns.from_list(
+                    [d[component] for d in data]
+                )
+
+        return CandlestickColumns(
+            time_to_ns([d["time"] for d in data]),
+            numpy.array([d["volume"] for d in data], dtype=numpy.int64),
+            numpy.array([d["complete"] for d in data], dtype=numpy.bool_),
+            instrument=instrument,
+            granularity=granularity,
+            **components
+        )
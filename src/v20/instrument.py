@@ -1,8 +1,13 @@
-import ujson as json
+import time
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
 from v20 import spec_properties
+from v20.columns import CandlestickColumns
+from v20 import candles
+from v20 import parallel
+from v20 import timestamps
+from v20.call import multi_request
 
 
 
@@ -26,6 +31,11 @@ class Candlestick(BaseEntity):
     #
     _properties = spec_properties.instrument_Candlestick
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Candlestick instance
@@ -76,6 +86,9 @@ class Candlestick(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Candlestick.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('bid') is not None:
@@ -119,6 +132,11 @@ class CandlestickData(BaseEntity):
     #
     _properties = spec_properties.instrument_CandlestickData
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CandlestickData instance
@@ -156,6 +174,9 @@ class CandlestickData(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CandlestickData.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('o') is not None:
@@ -201,6 +222,11 @@ class OrderBook(BaseEntity):
     #
     _properties = spec_properties.instrument_OrderBook
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderBook instance
@@ -245,6 +271,9 @@ class OrderBook(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderBook.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -286,6 +315,11 @@ class OrderBookBucket(BaseEntity):
     #
     _properties = spec_properties.instrument_OrderBookBucket
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderBookBucket instance
@@ -320,6 +354,9 @@ class OrderBookBucket(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderBookBucket.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -360,6 +397,11 @@ class PositionBook(BaseEntity):
     #
     _properties = spec_properties.instrument_PositionBook
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PositionBook instance
@@ -404,6 +446,9 @@ class PositionBook(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PositionBook.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -445,6 +490,11 @@ class PositionBookBucket(BaseEntity):
     #
     _properties = spec_properties.instrument_PositionBookBucket
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PositionBookBucket instance
@@ -479,6 +529,9 @@ class PositionBookBucket(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PositionBookBucket.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -565,6 +618,10 @@ class EntitySpec(object):
             weeklyAlignment:
                 The day of the week used for granularities that have weekly
                 alignment.
+            as_columns:
+                Flag that controls whether the candles are returned as a
+                v20.columns.CandlestickColumns of NumPy arrays instead of a
+                list of Candlestick objects. Requires numpy.
 
         Returns:
             v20.response.Response containing the results from submitting the
@@ -631,7 +688,10 @@ class EntitySpec(object):
             kwargs.get('weeklyAlignment')
         )
 
-        response = self.ctx.request(request)
+        if self.ctx.candle_cache is not None:
+            response = self.ctx.candle_cache.request(self.ctx, request)
+        else:
+            response = self.ctx.request(request)
 
 
         if response.content_type is None:
@@ -640,7 +700,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -656,7 +716,13 @@ class EntitySpec(object):
                 parsed_body['granularity'] = \
                     jbody.get('granularity')
 
-            if jbody.get('candles') is not None:
+            if jbody.get('candles') is not None and kwargs.get('as_columns'):
+                parsed_body['candles'] = CandlestickColumns.from_list(
+                    jbody.get('candles'),
+                    jbody.get('instrument'),
+                    jbody.get('granularity')
+                )
+            elif jbody.get('candles') is not None:
                 parsed_body['candles'] = [
                     self.ctx.instrument.Candlestick.from_dict(d, self.ctx)
                     for d in jbody.get('candles')
@@ -709,6 +775,105 @@ class EntitySpec(object):
         return response
 
 
+    @multi_request
+    def candles_range(
+        self,
+        instrument,
+        granularity,
+        fromTime,
+        toTime=None,
+        max_workers=4,
+        **kwargs
+    ):
+        """
+        Fetch the candlesticks for an instrument over a time range of any
+        length. The range is split into windows small enough for a single
+        candles request, the windows are fetched concurrently over the
+        context's connection pool, and the candlesticks are yielded in time
+        order without duplicates as each window arrives.
+
+        Args:
+            instrument:
+                Name of the Instrument
+            granularity:
+                The granularity of the candlesticks to fetch
+            fromTime:
+                The start of the time range, as a datetime, a number of
+                seconds since the epoch or a wire-format DateTime
+            toTime:
+                The end of the time range, in any of the formats accepted
+                for fromTime. The current time is used if not provided.
+            max_workers:
+                The maximum number of candles requests in flight at once
+            kwargs:
+                Any other candles() parameters (price, smooth,
+                dailyAlignment, ...) applied to every window
+
+        Returns:
+            A generator of v20.instrument.Candlestick objects
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if a window could not be
+            fetched
+        """
+
+        from_ns = timestamps.to_ns(fromTime)
+
+        if toTime is None:
+            to_ns = timestamps.to_ns(time.time())
+        else:
+            to_ns = timestamps.to_ns(toTime)
+
+        windows = candles.split_range(granularity, from_ns, to_ns)
+
+        def fetch(indexed_window):
+            index, window = indexed_window
+
+            params = dict(kwargs)
+
+            params.update(
+                candles.window_params(
+                    window,
+                    index,
+                    granularity,
+                    self.ctx.datetime_format
+                )
+            )
+
+            #
+            # A window ending now is requested by count, as the server
+            # rejects a toTime in the future
+            #
+            if toTime is None and index == len(windows) - 1:
+                del params["toTime"]
+                params["count"] = candles.MAX_CANDLE_COUNT
+
+            response = self.candles(
+                instrument,
+                granularity=granularity,
+                **params
+            )
+
+            return response.get("candles", 200)
+
+        last_ns = None
+
+        for window_candles in parallel.ordered_map(
+            fetch,
+            enumerate(windows),
+            max_workers
+        ):
+            for candle in window_candles:
+                candle_ns = timestamps.to_ns(candle.time)
+
+                if last_ns is not None and candle_ns <= last_ns:
+                    continue
+
+                last_ns = candle_ns
+
+                yield candle
+
+
     def price(
         self,
         instrument,
@@ -754,7 +919,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -868,7 +1033,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -973,7 +1138,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1079,7 +1244,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
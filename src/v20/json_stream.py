@@ -0,0 +1,174 @@
+"""
+Incremental decoding of JSON response bodies.
+
+The elements of an array inside a JSON document (such as the transactions
+of a transaction.range response, or the trades of the account of an
+account.get response) are located while the body is being received, and
+each element is decoded and handed out as soon as it is complete. Only the
+element being located and the unconsumed part of the current chunk are
+held in memory, whatever the size of the body.
+"""
+
+import codecs
+import json
+import re
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+_DECODER = json.JSONDecoder()
+
+
+class _Buffer(object):
+    """
+    The decoded, not yet consumed text of a stream of byte chunks
+    """
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        """
+        Append the next chunk to the buffer, discarding the consumed text
+
+        Returns:
+            False if the stream is exhausted, True otherwise
+        """
+        if self.eof:
+            return False
+
+        if self.pos > 0:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.eof = True
+            self.text += self.decoder.decode(b"", True)
+            return False
+
+        self.text += self.decoder.decode(chunk)
+
+        return True
+
+    def peek(self):
+        """
+        Skip whitespace
+
+        Returns:
+            The next character, or None at the end of the stream
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+
+            if not self.fill():
+                return None
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(
+                "Expected '{}' in JSON stream".format(character)
+            )
+
+        self.pos += 1
+
+    def value(self):
+        """
+        Consume the next JSON value
+
+        Returns:
+            The decoded value
+        """
+        if self.peek() is None:
+            raise ValueError("Unexpected end of JSON stream")
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+
+                #
+                # A number at the end of the buffer may continue in the next
+                # chunk
+                #
+                if end < len(self.text) or self.eof:
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    raise
+
+            #
+            # Read until the unconsumed text has doubled, so that a large
+            # value is only decoded a logarithmic number of times
+            #
+            target = 2 * (len(self.text) - self.pos)
+
+            while len(self.text) - self.pos < target and self.fill():
+                pass
+
+
+def iter_array(chunks, path):
+    """
+    Locate an array in a JSON document received as a stream of byte
+    chunks, and yield each of its elements decoded
+
+    Args:
+        chunks: An iterable of bytes holding a UTF-8 encoded JSON document
+        path: The list of object keys leading from the document to the
+            array, e.g. ["account", "trades"]
+
+    Returns:
+        A generator of the decoded elements. Nothing is yielded if a key of
+        the path is not present.
+
+    Raises:
+        ValueError if the document is not valid JSON
+    """
+    buf = _Buffer(chunks)
+
+    for key in path:
+        buf.expect("{")
+
+        while True:
+            if buf.peek() == "}":
+                return
+
+            name = buf.value()
+
+            buf.expect(":")
+
+            if name == key:
+                break
+
+            buf.value()
+
+            if buf.peek() == ",":
+                buf.pos += 1
+
+    if buf.peek() == "n":
+        buf.value()
+        return
+
+    buf.expect("[")
+
+    if buf.peek() == "]":
+        return
+
+    while True:
+        yield buf.value()
+
+        c = buf.peek()
+
+        if c == ",":
+            buf.pos += 1
+        elif c == "]":
+            return
+        else:
+            raise ValueError("Expected ',' or ']' in JSON stream")
@@ -0,0 +1,50 @@
+class LineReader(object):
+    """
+    A LineReader splits a stream of byte chunks into newline-delimited
+    lines. Each chunk is split with a single bytes.split(), so the only
+    copy made is of a line that spans two chunks. Empty lines are skipped.
+
+    Iterating over a LineReader yields one line at a time. batches() yields
+    all of the complete lines of each chunk at once, so that a consumer
+    falling behind a burst of messages can handle them together.
+    """
+    def __init__(self, chunks):
+        """
+        Create a new LineReader
+
+        Args:
+            chunks: An iterable of bytes, e.g. the iter_content() of a
+                streamed requests response
+        """
+        self.chunks = chunks
+
+    def __iter__(self):
+        for batch in self.batches():
+            for line in batch:
+                yield line
+
+    def batches(self):
+        """
+        Returns:
+            A generator of lists of the lines completed by each chunk
+        """
+        partial = b""
+
+        for chunk in self.chunks:
+            if not chunk:
+                continue
+
+            if partial:
+                chunk = partial + chunk
+
+            lines = chunk.split(b"\n")
+
+            partial = lines.pop()
+
+            batch = [line for line in lines if line and line != b"\r"]
+
+            if batch:
+                yield batch
+
+        if partial.strip():
+            yield [partial]
@@ -0,0 +1,571 @@
+import collections
+import random
+import threading
+import time
+import ujson as json
+
+from requests.structures import CaseInsensitiveDict
+
+from v20 import timestamps
+from v20.errors import V20ConnectionError
+from v20.transport import Reply, Transport
+
+
+def _now():
+    return timestamps.format_ns(int(time.time() * 1000000000))
+
+
+def _encode(body):
+    if isinstance(body, bytes):
+        return body
+
+    if isinstance(body, (dict, list)):
+        return json.dumps(body).encode("utf-8")
+
+    return body.encode("utf-8")
+
+
+class SyntheticStream(object):
+    """
+    A SyntheticStream generates the newline-delimited messages of a v20
+    stream at a configurable rate, with a heartbeat at a fixed interval as
+    the v20 streams send. Subclasses define the messages.
+    """
+    def __init__(
+        self,
+        rate=None,
+        count=None,
+        batch_size=1,
+        heartbeat_interval=5.0,
+        drop_after=None
+    ):
+        """
+        Create a new SyntheticStream
+
+        Args:
+            rate: The number of messages per second, or None to send them
+                as fast as they can be read
+            count: The number of messages after which the stream ends, or
+                None for an endless stream
+            batch_size: The number of messages sent together in each chunk
+            heartbeat_interval: The number of seconds between heartbeats
+            drop_after: The number of messages after which the connection
+                fails with a V20ConnectionError, or None
+        """
+        self.rate = rate
+        self.count = count
+        self.batch_size = batch_size
+        self.heartbeat_interval = heartbeat_interval
+        self.drop_after = drop_after
+
+    def message(self, index):
+        """
+        Returns:
+            The dict of the index'th message of the stream
+        """
+        raise NotImplementedError()
+
+    def heartbeat(self):
+        """
+        Returns:
+            The dict of a heartbeat
+        """
+        raise NotImplementedError()
+
+    def schedule(self, url):
+        """
+        Args:
+            url: The URL of the stream, reported if the connection is
+                dropped
+
+        Returns:
+            A generator of the chunks of bytes of one connection to the
+            stream, each preceded by the number of seconds to wait before
+            sending it (a float), so that the stream can be paced by a
+            blocking or an asyncio reader
+        """
+        start = time.time()
+
+        last_heartbeat = start
+
+        index = 0
+
+        yield 0.0
+
+        yield json.dumps(self.heartbeat()).encode("utf-8") + b"\n"
+
+        while self.count is None or index < self.count:
+            if self.drop_after is not None and index >= self.drop_after:
+                raise V20ConnectionError(url)
+
+            size = self.batch_size
+
+            if self.count is not None:
+                size = min(size, self.count - index)
+
+            if self.drop_after is not None:
+                size = min(size, self.drop_after - index)
+
+            delay = 0.0
+
+            if self.rate is not None:
+                delay = start + (index + size) / float(self.rate) - \
+                    time.time()
+
+            yield max(0.0, delay)
+
+            messages = [self.message(index + i) for i in range(size)]
+
+            index += size
+
+            now = time.time()
+
+            if now - last_heartbeat >= self.heartbeat_interval:
+                messages.append(self.heartbeat())
+                last_heartbeat = now
+
+            yield b"".join(
+                json.dumps(message).encode("utf-8") + b"\n"
+                for message in messages
+            )
+
+    def chunks(self, url):
+        """
+        Args:
+            url: The URL of the stream, reported if the connection is
+                dropped
+
+        Returns:
+            A generator of the chunks of bytes of one connection to the
+            stream
+        """
+        for item in self.schedule(url):
+            if isinstance(item, float):
+                if item > 0:
+                    time.sleep(item)
+            else:
+                yield item
+
+
+class PricingStream(SyntheticStream):
+    """
+    A synthetic pricing.stream. Each instrument's price follows a random
+    walk, and the instruments take turns to tick.
+    """
+    def __init__(self, instruments, price=1.1, spread=0.0001, seed=0,
+                 **kwargs):
+        """
+        Create a new PricingStream
+
+        Args:
+            instruments: The list of instruments to price
+            price: The initial mid price of every instrument
+            spread: The bid/ask spread
+            seed: The seed of the random walk
+            kwargs: Any other SyntheticStream parameters
+        """
+        super(PricingStream, self).__init__(**kwargs)
+
+        self.instruments = list(instruments)
+        self.spread = spread
+        self.prices = dict((i, price) for i in self.instruments)
+        self.random = random.Random(seed)
+
+    def message(self, index):
+        instrument = self.instruments[index % len(self.instruments)]
+
+        mid = self.prices[instrument] + self.random.choice([-1, 1]) * 0.00001
+
+        self.prices[instrument] = mid
+
+        bid = "{:.5f}".format(mid - self.spread / 2)
+        ask = "{:.5f}".format(mid + self.spread / 2)
+
+        return {
+            "type": "PRICE",
+            "instrument": instrument,
+            "time": _now(),
+            "bids": [{"price": bid, "liquidity": 1000000}],
+            "asks": [{"price": ask, "liquidity": 1000000}],
+            "closeoutBid": bid,
+            "closeoutAsk": ask,
+            "status": "tradeable",
+            "tradeable": True,
+        }
+
+    def heartbeat(self):
+        return {"type": "HEARTBEAT", "time": _now()}
+
+
+class TransactionStream(SyntheticStream):
+    """
+    A synthetic transaction.stream of filled Market Orders. Each message is
+    a Transaction with the next ID, and every Transaction sent is kept so
+    that transaction.since can be answered consistently with the stream.
+    """
+    def __init__(self, accountID, instrument="EUR_USD", lastTransactionID=1,
+                 **kwargs):
+        """
+        Create a new TransactionStream
+
+        Args:
+            accountID: The ID of the Account the Transactions belong to
+            instrument: The instrument traded
+            lastTransactionID: The ID of the last Transaction before the
+                stream starts
+            kwargs: Any other SyntheticStream parameters
+        """
+        super(TransactionStream, self).__init__(**kwargs)
+
+        self.accountID = accountID
+        self.instrument = instrument
+        self.lastTransactionID = int(lastTransactionID)
+        self.transactions = []
+        self._lock = threading.Lock()
+
+    def message(self, index):
+        with self._lock:
+            self.lastTransactionID += 1
+
+            id = self.lastTransactionID
+
+            if len(self.transactions) % 2 == 0:
+                transaction = {
+                    "id": str(id),
+                    "time": _now(),
+                    "accountID": self.accountID,
+                    "type": "MARKET_ORDER",
+                    "instrument": self.instrument,
+                    "units": "100",
+                    "timeInForce": "FOK",
+                    "reason": "CLIENT_ORDER",
+                }
+            else:
+                transaction = {
+                    "id": str(id),
+                    "time": _now(),
+                    "accountID": self.accountID,
+                    "type": "ORDER_FILL",
+                    "orderID": str(id - 1),
+                    "instrument": self.instrument,
+                    "units": "100",
+                    "price": "1.10000",
+                    "pl": "0.0000",
+                    "financing": "0.0000",
+                    "commission": "0.0000",
+                    "accountBalance": "100000.0000",
+                    "reason": "MARKET_ORDER",
+                    "tradeOpened": {
+                        "tradeID": str(id),
+                        "units": "100",
+                        "price": "1.10000",
+                    },
+                }
+
+            self.transactions.append(transaction)
+
+            return transaction
+
+    def heartbeat(self):
+        return {
+            "type": "HEARTBEAT",
+            "time": _now(),
+            "lastTransactionID": str(self.lastTransactionID),
+        }
+
+    def since(self, id):
+        """
+        Returns:
+            The body of a transaction.since response
+        """
+        with self._lock:
+            return {
+                "transactions": [
+                    t for t in self.transactions if int(t["id"]) > int(id)
+                ],
+                "lastTransactionID": str(self.lastTransactionID),
+            }
+
+
+class MockTransport(Transport):
+    """
+    A MockTransport answers a Context's requests in-process, without a
+    network, so that code using the v20 API can be tested and measured
+    deterministically offline. It is not a server: nothing listens on a
+    socket, so the HTTP exchange itself is never exercised. It replays
+    responses, either added by hand or recorded from the v20 REST server
+    with a RecordingTransport, and serves SyntheticStreams for the
+    streaming endpoints.
+
+        transport = MockTransport(latency=0.002)
+        transport.load("recorded.jsonl")
+        transport.add_stream(
+            "/v3/accounts/{}/pricing/stream".format(accountID),
+            PricingStream(["EUR_USD", "USD_JPY"], rate=1000)
+        )
+
+        ctx = v20.Context("localhost", transport=transport)
+
+    A request with no response is answered with a 404. To drive a
+    v20.AsyncContext, wrap the MockTransport in a
+    v20.aio_mock.AsyncMockTransport:
+
+        ctx = v20.AsyncContext(
+            "localhost",
+            transport=AsyncMockTransport(transport)
+        )
+    """
+    def __init__(self, latency=0):
+        """
+        Create a new MockTransport
+
+        Args:
+            latency: The number of seconds each response is delayed by, or
+                a callable returning it (e.g. to draw it from a
+                distribution)
+        """
+        self.latency = latency
+
+        self._responses = collections.defaultdict(list)
+        self._streams = {}
+        self._lock = threading.Lock()
+
+        #
+        # The (method, path, params) of every request received
+        #
+        self.requests = []
+
+    def _key(self, method, path, params=None):
+        if params is None:
+            return method, path, None
+
+        return method, path, tuple(sorted(params.items()))
+
+    def add_response(self, method, path, body, status=200, params=None,
+                     reason=None):
+        """
+        Add a response to replay
+
+        Args:
+            method: The HTTP method of the request
+            path: The path of the request, e.g. "/v3/accounts/{id}/summary"
+                with the Account ID filled in
+            body: The body of the response, as a dict, str or bytes
+            status: The HTTP status of the response
+            params: The query parameters the request must have, or None to
+                match any
+            reason: The HTTP reason phrase
+
+        Several responses added for the same request are replayed in turn,
+        the last one repeating once the others are used.
+        """
+        with self._lock:
+            self._responses[self._key(method, path, params)].append(
+                (status, reason or "OK", _encode(body))
+            )
+
+    def add_stream(self, path, stream):
+        """
+        Serve a SyntheticStream for a streaming endpoint. A TransactionStream
+        also answers transaction.since requests for its Account.
+
+        Args:
+            path: The path of the stream, e.g.
+                "/v3/accounts/{id}/transactions/stream" with the Account ID
+                filled in
+            stream: The v20.mock.SyntheticStream to serve
+        """
+        self._streams[path] = stream
+
+    def load(self, path):
+        """
+        Add the responses recorded in a file by a RecordingTransport
+        """
+        with open(path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                record = json.loads(line)
+
+                self.add_response(
+                    record["method"],
+                    record["path"],
+                    record["body"],
+                    status=record["status"],
+                    params=record["params"],
+                    reason=record["reason"]
+                )
+
+    def _find(self, request):
+        with self._lock:
+            for key in [
+                self._key(request.method, request.path, request.params),
+                self._key(request.method, request.path)
+            ]:
+                responses = self._responses.get(key)
+
+                if responses:
+                    if len(responses) > 1:
+                        return responses.pop(0)
+
+                    return responses[0]
+
+        return None
+
+    def _since(self, request):
+        if not request.path.endswith("/transactions/sinceid"):
+            return None
+
+        path = request.path[:-len("sinceid")] + "stream"
+
+        stream = self._streams.get(path)
+
+        if not isinstance(stream, TransactionStream):
+            return None
+
+        return 200, "OK", _encode(stream.since(request.params.get("id", 0)))
+
+    def _receive(self, request):
+        """
+        Log a request
+
+        Returns:
+            The number of seconds its response is delayed by
+        """
+        self.requests.append(
+            (request.method, request.path, dict(request.params))
+        )
+
+        latency = self.latency
+
+        if callable(latency):
+            latency = latency()
+
+        return latency
+
+    def _respond(self, request):
+        """
+        Returns:
+            The SyntheticStream serving a stream request, or the
+            (status, reason, body) of the response to any other request
+        """
+        stream = self._streams.get(request.path)
+
+        if request.stream and stream is not None:
+            return stream
+
+        response = self._find(request) or self._since(request)
+
+        if response is None:
+            response = (
+                404,
+                "Not Found",
+                _encode({
+                    "errorMessage": "No mock response for {} {}".format(
+                        request.method,
+                        request.path
+                    )
+                })
+            )
+
+        return response
+
+    def send(self, request, url, headers, timeout):
+        latency = self._receive(request)
+
+        if latency > 0:
+            time.sleep(latency)
+
+        response = self._respond(request)
+
+        if isinstance(response, SyntheticStream):
+            #
+            # Closing the reply ends the stream at the next chunk
+            #
+            closed = threading.Event()
+
+            def chunks(chunk_size):
+                for chunk in response.chunks(url):
+                    if closed.is_set():
+                        return
+
+                    yield chunk
+
+            return Reply(
+                url,
+                200,
+                "OK",
+                CaseInsensitiveDict(
+                    {"content-type": "application/octet-stream"}
+                ),
+                request_headers=headers,
+                chunks=chunks,
+                chunked=True,
+                release=closed.set
+            )
+
+        status, reason, body = response
+
+        reply = Reply(
+            url,
+            status,
+            reason,
+            CaseInsensitiveDict({"content-type": "application/json"}),
+            request_headers=headers
+        )
+
+        if request.stream:
+            reply.chunks = lambda chunk_size: iter([body])
+        else:
+            reply.content = body
+
+        return reply
+
+
+class RecordingTransport(Transport):
+    """
+    A RecordingTransport sends requests through another Transport and
+    records every response that is not a stream to a file, one JSON object
+    per line, for a MockTransport to replay. Recording is done through a
+    Context; the responses recorded can be replayed to a Context or an
+    AsyncContext.
+    """
+    def __init__(self, transport, path):
+        """
+        Create a new RecordingTransport
+
+        Args:
+            transport: The v20.transport.Transport to send requests with
+            path: The file to append the recorded responses to
+        """
+        self.transport = transport
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, request, url, headers, timeout):
+        reply = self.transport.send(request, url, headers, timeout)
+
+        if request.stream:
+            return reply
+
+        record = json.dumps({
+            "method": request.method,
+            "path": request.path,
+            "params": request.params,
+            "status": reply.status,
+            "reason": reply.reason,
+            "body": reply.content.decode("utf-8"),
+        })
+
+        with self._lock:
+            with open(self.path, "ab") as f:
+                f.write(record.encode("utf-8") + b"\n")
+
+        return reply
+
+    def close_idle_connections(self):
+        self.transport.close_idle_connections()
+
+    def prewarm(self, url, count, timeout):
+        self.transport.prewarm(url, count, timeout)
@@ -1,8 +1,17 @@
+import uuid
 import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
+from v20.base_entity import TypeRegistry
 from v20.request import Request
 from v20 import spec_properties
+from v20 import parallel
+from v20.batch import BatchResult
+from v20.call import Call, Return, Sleep, multi_request, run_steps
+from v20.errors import V20ConnectionError, V20Timeout
+from v20.rate_limit import TokenBucket
+from v20.response import Response
+from v20.transaction import SincePages
 
 
 
@@ -27,6 +36,11 @@ class OrderIdentifier(BaseEntity):
     #
     _properties = spec_properties.order_OrderIdentifier
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderIdentifier instance
@@ -52,6 +66,9 @@ class OrderIdentifier(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderIdentifier.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return OrderIdentifier(**data)
@@ -78,6 +95,11 @@ class DynamicOrderState(BaseEntity):
     #
     _properties = spec_properties.order_DynamicOrderState
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new DynamicOrderState instance
@@ -118,6 +140,9 @@ class DynamicOrderState(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return DynamicOrderState.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('trailingStopValue') is not None:
@@ -154,6 +179,11 @@ class Order(BaseEntity):
     #
     _properties = spec_properties.order_Order
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Order instance
@@ -190,24 +220,13 @@ class Order(BaseEntity):
         appropriately.
         """
 
-        type = data.get("type")
-
-        if type == "TAKE_PROFIT":
-            return TakeProfitOrder.from_dict(data, ctx)
-        if type == "STOP_LOSS":
-            return StopLossOrder.from_dict(data, ctx)
-        if type == "TRAILING_STOP_LOSS":
-            return TrailingStopLossOrder.from_dict(data, ctx)
-        if type == "MARKET":
-            return MarketOrder.from_dict(data, ctx)
-        if type == "FIXED_PRICE":
-            return FixedPriceOrder.from_dict(data, ctx)
-        if type == "LIMIT":
-            return LimitOrder.from_dict(data, ctx)
-        if type == "STOP":
-            return StopOrder.from_dict(data, ctx)
-        if type == "MARKET_IF_TOUCHED":
-            return MarketIfTouchedOrder.from_dict(data, ctx)
+        handler = order_types.get(data.get("type"))
+
+        if handler is not None:
+            return handler(data, ctx)
+
+        if ctx.lazy_entities:
+            return Order.lazy_from_dict(data, ctx)
 
         data = data.copy()
 
@@ -241,6 +260,11 @@ class MarketOrder(BaseEntity):
     #
     _properties = spec_properties.order_MarketOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrder instance
@@ -420,6 +444,9 @@ class MarketOrder(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -517,6 +544,11 @@ class FixedPriceOrder(BaseEntity):
     #
     _properties = spec_properties.order_FixedPriceOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new FixedPriceOrder instance
@@ -666,6 +698,9 @@ class FixedPriceOrder(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return FixedPriceOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -733,6 +768,11 @@ class LimitOrder(BaseEntity):
     #
     _properties = spec_properties.order_LimitOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LimitOrder instance
@@ -921,6 +961,9 @@ class LimitOrder(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LimitOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -988,6 +1031,11 @@ class StopOrder(BaseEntity):
     #
     _properties = spec_properties.order_StopOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopOrder instance
@@ -1183,6 +1231,9 @@ class StopOrder(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -1256,6 +1307,11 @@ class MarketIfTouchedOrder(BaseEntity):
     #
     _properties = spec_properties.order_MarketIfTouchedOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketIfTouchedOrder instance
@@ -1461,6 +1517,9 @@ class MarketIfTouchedOrder(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketIfTouchedOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -1540,6 +1599,11 @@ class TakeProfitOrder(BaseEntity):
     #
     _properties = spec_properties.order_TakeProfitOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TakeProfitOrder instance
@@ -1691,6 +1755,9 @@ class TakeProfitOrder(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TakeProfitOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -1731,6 +1798,11 @@ class StopLossOrder(BaseEntity):
     #
     _properties = spec_properties.order_StopLossOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopLossOrder instance
@@ -1905,6 +1977,9 @@ class StopLossOrder(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopLossOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -1959,6 +2034,11 @@ class TrailingStopLossOrder(BaseEntity):
     #
     _properties = spec_properties.order_TrailingStopLossOrder
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TrailingStopLossOrder instance
@@ -2119,6 +2199,9 @@ class TrailingStopLossOrder(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TrailingStopLossOrder.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensions') is not None:
@@ -2162,6 +2245,11 @@ class OrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_OrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderRequest instance
@@ -2177,6 +2265,9 @@ class OrderRequest(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return OrderRequest(**data)
@@ -2203,6 +2294,11 @@ class MarketOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_MarketOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderRequest instance
@@ -2292,6 +2388,9 @@ class MarketOrderRequest(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2358,6 +2457,11 @@ class LimitOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_LimitOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LimitOrderRequest instance
@@ -2475,6 +2579,9 @@ class LimitOrderRequest(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LimitOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2541,6 +2648,11 @@ class StopOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_StopOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopOrderRequest instance
@@ -2665,6 +2777,9 @@ class StopOrderRequest(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2736,6 +2851,11 @@ class MarketIfTouchedOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_MarketIfTouchedOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketIfTouchedOrderRequest instance
@@ -2863,6 +2983,9 @@ class MarketIfTouchedOrderRequest(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketIfTouchedOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2935,6 +3058,11 @@ class TakeProfitOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_TakeProfitOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TakeProfitOrderRequest instance
@@ -3014,6 +3142,9 @@ class TakeProfitOrderRequest(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TakeProfitOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3052,6 +3183,11 @@ class StopLossOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_StopLossOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopLossOrderRequest instance
@@ -3147,6 +3283,9 @@ class StopLossOrderRequest(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopLossOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3189,6 +3328,11 @@ class TrailingStopLossOrderRequest(BaseEntity):
     #
     _properties = spec_properties.order_TrailingStopLossOrderRequest
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TrailingStopLossOrderRequest instance
@@ -3267,6 +3411,9 @@ class TrailingStopLossOrderRequest(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TrailingStopLossOrderRequest.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('distance') is not None:
@@ -3304,6 +3451,11 @@ class UnitsAvailableDetails(BaseEntity):
     #
     _properties = spec_properties.order_UnitsAvailableDetails
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new UnitsAvailableDetails instance
@@ -3329,6 +3481,9 @@ class UnitsAvailableDetails(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return UnitsAvailableDetails.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('long') is not None:
@@ -3365,6 +3520,11 @@ class UnitsAvailable(BaseEntity):
     #
     _properties = spec_properties.order_UnitsAvailable
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new UnitsAvailable instance
@@ -3407,6 +3567,9 @@ class UnitsAvailable(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return UnitsAvailable.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('default') is not None:
@@ -3456,6 +3619,11 @@ class GuaranteedStopLossOrderEntryData(BaseEntity):
     #
     _properties = spec_properties.order_GuaranteedStopLossOrderEntryData
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new GuaranteedStopLossOrderEntryData instance
@@ -3490,6 +3658,9 @@ class GuaranteedStopLossOrderEntryData(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return GuaranteedStopLossOrderEntryData.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('minimumDistance') is not None:
@@ -3511,6 +3682,22 @@ class GuaranteedStopLossOrderEntryData(BaseEntity):
         return GuaranteedStopLossOrderEntryData(**data)
 
 
+#
+# The handlers used by Order.from_dict to instantiate each type of Order.
+# Shared by every Context in the process.
+#
+order_types = TypeRegistry(Order)
+
+order_types.register("TAKE_PROFIT", TakeProfitOrder)
+order_types.register("STOP_LOSS", StopLossOrder)
+order_types.register("TRAILING_STOP_LOSS", TrailingStopLossOrder)
+order_types.register("MARKET", MarketOrder)
+order_types.register("FIXED_PRICE", FixedPriceOrder)
+order_types.register("LIMIT", LimitOrder)
+order_types.register("STOP", StopOrder)
+order_types.register("MARKET_IF_TOUCHED", MarketIfTouchedOrder)
+
+
 class EntitySpec(object):
     """
     The order.EntitySpec wraps the order module's type definitions
@@ -3541,6 +3728,13 @@ class EntitySpec(object):
     UnitsAvailable = UnitsAvailable
     GuaranteedStopLossOrderEntryData = GuaranteedStopLossOrderEntryData
 
+    #
+    # The handlers used by Order.from_dict to instantiate each type of Order.
+    # Register a handler to replace how a type is built, or skip a type to
+    # have it built lazily.
+    #
+    types = order_types
+
     def __init__(self, ctx):
         self.ctx = ctx
 
@@ -3590,7 +3784,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -3727,6 +3921,273 @@ class EntitySpec(object):
         return response
 
 
+    @multi_request
+    def create_many(
+        self,
+        accountID,
+        orders,
+        max_workers=8,
+        rate=100
+    ):
+        """
+        Create many Orders for an Account at once. The Orders are submitted
+        concurrently over the context's connection pool, at most
+        max_workers at a time and no faster than rate per second. A failure
+        to create one Order does not stop the others being submitted.
+
+        Args:
+            accountID:
+                Account Identifier
+            orders:
+                The list of Orders to create, each an OrderRequest (e.g. a
+                MarketOrderRequest) or a dict in the wire format
+            max_workers:
+                The maximum number of requests in flight at once
+            rate:
+                The maximum number of requests started per second, or None
+                for no limit
+
+        Returns:
+            v20.batch.BatchResult holding, in the order of the orders given,
+            the v20.response.Response of each create request or the
+            exception raised when making it
+        """
+
+        bucket = None
+
+        if rate is not None:
+            bucket = TokenBucket(rate, burst=max_workers)
+
+        def submit(order):
+            return run_steps(
+                self.ctx,
+                self._create_steps(accountID, order, bucket)
+            )
+
+        return BatchResult(
+            list(parallel.ordered_map(submit, orders, max_workers))
+        )
+
+    def _create_steps(self, accountID, order, bucket):
+        """
+        The steps (see v20.call.run_steps) of submitting one Order of
+        create_many
+        """
+        if bucket is not None:
+            yield Sleep(bucket.reserve())
+
+        #
+        # Whatever goes wrong with one Order is reported in its result
+        # rather than losing the results of the others
+        #
+        try:
+            response = yield Call(self.create, accountID, order=order)
+        except Exception as e:
+            response = e
+
+        yield Return(response)
+
+
+    @multi_request
+    def create_reconciled(
+        self,
+        accountID,
+        order,
+        lastTransactionID=None,
+        attempts=3,
+        settle_delay=1.0
+    ):
+        """
+        Create an Order for an Account, confirming the outcome of a request
+        that received no response instead of blindly resubmitting it. The
+        Order is tagged with a client ID (clientExtensions.id, generated if
+        the Order has none). When the create request fails to connect, times
+        out or receives a server error, the Account's Transactions since
+        lastTransactionID are searched for the Order. If the Order was
+        created (or rejected) its outcome is returned, otherwise it is
+        submitted again.
+
+        Args:
+            accountID:
+                Account Identifier
+            order:
+                The Order to create, an OrderRequest or a dict in the wire
+                format
+            lastTransactionID:
+                The ID of the most recent Transaction in the Account before
+                the Order is submitted. Fetched with account.summary if not
+                provided.
+            attempts:
+                The maximum number of times the Order is submitted
+            settle_delay:
+                The number of seconds to wait after a failed request before
+                searching for the Order, giving the server time to finish
+                processing it
+
+        Returns:
+            v20.response.Response containing the results from submitting the
+            request. A response reconstructed from the Account's
+            Transactions has the reason "Reconciled".
+
+        Raises:
+            V20ConnectionError or V20Timeout if the Order could not be
+            submitted and was not found in the Account
+        """
+
+        return run_steps(
+            self.ctx,
+            self._create_reconciled_steps(
+                accountID,
+                order,
+                lastTransactionID,
+                attempts,
+                settle_delay
+            )
+        )
+
+    def _create_reconciled_steps(
+        self,
+        accountID,
+        order,
+        lastTransactionID,
+        attempts,
+        settle_delay
+    ):
+        """
+        The steps (see v20.call.run_steps) of create_reconciled, shared by
+        Context and AsyncContext
+        """
+        order = self._tag(order)
+
+        if lastTransactionID is None:
+            summary = yield Call(self.ctx.account.summary, accountID)
+
+            lastTransactionID = summary.get('lastTransactionID', 200)
+
+        error = None
+
+        response = None
+
+        for attempt in range(attempts):
+            try:
+                response = yield Call(self.create, accountID, order=order)
+            except (V20ConnectionError, V20Timeout) as e:
+                error = e
+                response = None
+
+            if response is not None and int(response.status) < 500:
+                yield Return(response)
+
+            yield Sleep(settle_delay)
+
+            pages = SincePages(lastTransactionID)
+
+            transactions = []
+
+            while not pages.done:
+                page = yield Call(
+                    self.ctx.transaction.since,
+                    accountID,
+                    id=pages.sinceID
+                )
+
+                transactions.extend(pages.add(page))
+
+            reconciled = self._reconciled(
+                accountID,
+                order,
+                transactions,
+                pages.lastTransactionID
+            )
+
+            if reconciled is not None:
+                yield Return(reconciled)
+
+        if response is not None:
+            yield Return(response)
+
+        raise error
+
+    def _tag(self, order):
+        """
+        Returns:
+            The Order as a dict in the wire format, with a client ID
+        """
+        if isinstance(order, dict):
+            order = dict(order)
+        else:
+            order = order.dict()
+
+        clientExtensions = dict(order.get('clientExtensions') or {})
+
+        if clientExtensions.get('id') is None:
+            clientExtensions['id'] = uuid.uuid4().hex
+
+        order['clientExtensions'] = clientExtensions
+
+        return order
+
+    def _reconciled(self, accountID, order, transactions, lastTransactionID):
+        """
+        Returns:
+            The create Response reconstructed from the Transactions created
+            for an Order, or None if the Order is not among them
+        """
+        clientID = order['clientExtensions']['id']
+
+        created = None
+
+        for transaction in transactions:
+            extensions = getattr(transaction, 'clientExtensions', None)
+
+            if extensions is not None and extensions.id == clientID:
+                created = transaction
+                break
+
+        if created is None:
+            return None
+
+        body = {'lastTransactionID': lastTransactionID}
+
+        if created.type.endswith('_REJECT'):
+            status = 400
+            body['orderRejectTransaction'] = created.dict()
+        else:
+            status = 201
+            body['orderCreateTransaction'] = created.dict()
+            body['relatedTransactionIDs'] = [created.id]
+
+            for transaction in transactions:
+                if getattr(transaction, 'orderID', None) != created.id:
+                    continue
+
+                if transaction.type == 'ORDER_FILL':
+                    body['orderFillTransaction'] = transaction.dict()
+                elif transaction.type == 'ORDER_CANCEL':
+                    body['orderCancelTransaction'] = transaction.dict()
+                else:
+                    continue
+
+                body['relatedTransactionIDs'].append(transaction.id)
+
+        call = Call(self.create, accountID, order=order)
+
+        request = call.prepare(self.ctx)
+
+        response = Response(
+            request,
+            request.method,
+            "{}{}".format(self.ctx._base_url, request.path),
+            status,
+            "Reconciled",
+            {"content-type": "application/json"}
+        )
+
+        response.set_raw_body(json.dumps(body).encode("utf-8"))
+
+        return call.complete(self.ctx, response)
+
+
     def list(
         self,
         accountID,
@@ -3799,7 +4260,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -3891,7 +4352,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -3991,7 +4452,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -4102,7 +4563,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -4281,7 +4742,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -4421,7 +4882,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -0,0 +1,41 @@
+import collections
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+def ordered_map(fn, items, max_workers):
+    """
+    Apply fn to each item using a pool of threads, yielding the results in
+    the order of the items. At most max_workers calls are in flight at once
+    and results are yielded as soon as they are next in order, so only a
+    bounded window of results is ever held in memory.
+
+    If the generator is closed before it is exhausted, calls that have not
+    started yet are cancelled.
+
+    Args:
+        fn: The callable to apply
+        items: An iterable of items to apply fn to
+        max_workers: The maximum number of concurrent calls
+
+    Returns:
+        A generator of the results of fn
+    """
+    items = iter(items)
+    pending = collections.deque()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+
+            if len(pending) >= max_workers:
+                yield pending.popleft().result()
+
+        while len(pending) > 0:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+        executor.shutdown(wait=False)
@@ -1,4 +1,3 @@
-import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
@@ -26,6 +25,11 @@ class Position(BaseEntity):
     #
     _properties = spec_properties.position_Position
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Position instance
@@ -97,6 +101,9 @@ class Position(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Position.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('pl') is not None:
@@ -169,6 +176,11 @@ class PositionSide(BaseEntity):
     #
     _properties = spec_properties.position_PositionSide
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PositionSide instance
@@ -232,6 +244,9 @@ class PositionSide(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PositionSide.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -293,6 +308,11 @@ class CalculatedPositionState(BaseEntity):
     #
     _properties = spec_properties.position_CalculatedPositionState
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CalculatedPositionState instance
@@ -333,6 +353,9 @@ class CalculatedPositionState(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CalculatedPositionState.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('netUnrealizedPL') is not None:
@@ -411,7 +434,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -504,7 +527,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -605,7 +628,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -740,7 +763,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
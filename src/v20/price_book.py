@@ -0,0 +1,275 @@
+import array
+import collections
+import threading
+import ujson as json
+
+
+#
+# A snapshot of the latest price of an instrument. Prices and liquidity
+# are floats, time is the wire-format DateTime of the price and version is
+# the book version at which the price was last updated.
+#
+PriceSnapshot = collections.namedtuple(
+    "PriceSnapshot",
+    [
+        "instrument",
+        "time",
+        "bid",
+        "ask",
+        "closeoutBid",
+        "closeoutAsk",
+        "bidLiquidity",
+        "askLiquidity",
+        "tradeable",
+        "version",
+    ]
+)
+
+
+#
+# The number of float values stored per instrument: bid, ask, closeoutBid,
+# closeoutAsk, bidLiquidity and askLiquidity
+#
+VALUE_COUNT = 6
+
+
+class PriceBook(object):
+    """
+    A PriceBook holds the latest price of each instrument received from a
+    pricing stream. Prices are stored in flat arrays indexed by instrument
+    rather than as ClientPrice objects, and reading the latest price of an
+    instrument is a constant time copy out of the arrays.
+
+    The book is safe to update and read from any thread. Listeners are
+    called on the updating thread after each change. A book fed by afeed()
+    from an AsyncContext stream is updated on the event loop itself. To be
+    notified in an asyncio event loop of updates made by another thread,
+    add a listener that hands over to the loop:
+
+        book.add_listener(
+            lambda instrument: loop.call_soon_threadsafe(event.set)
+        )
+
+    When fed from a stream with feed() or afeed(), the messages received
+    together are applied as a batch in which only the last price of each
+    instrument is kept, so a reader that falls behind skips superseded
+    ticks rather than queueing them.
+    """
+    def __init__(self):
+        self._index = {}
+        self._instruments = []
+        self._times = []
+        self._values = array.array("d")
+        self._tradeable = array.array("b")
+        self._versions = array.array("q")
+        self._condition = threading.Condition()
+        self._listeners = []
+
+        #
+        # The number of updates applied to the book
+        #
+        self.version = 0
+
+    def __len__(self):
+        return len(self._instruments)
+
+    def __contains__(self, instrument):
+        return instrument in self._index
+
+    def instruments(self):
+        """
+        Returns:
+            The list of instruments with a price in the book
+        """
+        with self._condition:
+            return list(self._instruments)
+
+    def add_listener(self, listener):
+        """
+        Add a callable to be called with the name of each instrument whose
+        price changes. It is called on the thread updating the book and
+        must not block.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self._listeners.remove(listener)
+
+    def _slot(self, instrument):
+        index = self._index.get(instrument)
+
+        if index is None:
+            index = len(self._instruments)
+            self._index[instrument] = index
+            self._instruments.append(instrument)
+            self._times.append(None)
+            self._values.extend([0.0] * VALUE_COUNT)
+            self._tradeable.append(0)
+            self._versions.append(0)
+
+        return index
+
+    def _store(self, data):
+        index = self._slot(data["instrument"])
+
+        bids = data.get("bids") or [{}]
+        asks = data.get("asks") or [{}]
+
+        offset = index * VALUE_COUNT
+
+        self._values[offset:offset + VALUE_COUNT] = array.array("d", [
+            float(bids[0].get("price", "nan")),
+            float(asks[0].get("price", "nan")),
+            float(data.get("closeoutBid", "nan")),
+            float(data.get("closeoutAsk", "nan")),
+            float(bids[0].get("liquidity", 0)),
+            float(asks[0].get("liquidity", 0)),
+        ])
+
+        self._times[index] = data.get("time")
+        self._tradeable[index] = 1 if data.get("tradeable", True) else 0
+
+        self.version += 1
+        self._versions[index] = self.version
+
+    def update(self, prices):
+        """
+        Apply prices to the book
+
+        Args:
+            prices: A list of prices, each either a dict in the wire format
+                or a v20.pricing.ClientPrice. Prices for the same instrument
+                are applied in order, so the last one wins.
+        """
+        latest = collections.OrderedDict()
+
+        for price in prices:
+            if not isinstance(price, dict):
+                price = price.dict()
+
+            latest[price["instrument"]] = price
+
+        if len(latest) == 0:
+            return
+
+        with self._condition:
+            for data in latest.values():
+                self._store(data)
+
+            self._condition.notify_all()
+
+        for instrument in latest:
+            for listener in self._listeners:
+                listener(instrument)
+
+    def feed(self, response):
+        """
+        Consume a pricing.stream response, applying its prices to the book
+        until the stream ends. Prices are decoded straight from the stream
+        without constructing ClientPrice objects.
+
+        Args:
+            response: The v20.response.Response of a pricing.stream request
+        """
+        response.set_line_parser(json.loads)
+
+        for batch in response.batches():
+            self._feed_batch(batch)
+
+    def afeed(self, response):
+        """
+        Consume a pricing.stream response of a v20.AsyncContext, as feed()
+        does for a Context, without blocking the event loop:
+
+            response = await ctx.pricing.stream(accountID, instruments=...)
+
+            await book.afeed(response)
+
+        Args:
+            response: The v20.aio.AsyncResponse of a pricing.stream request
+
+        Returns:
+            A coroutine applying the stream's prices to the book until the
+            stream ends
+        """
+        from v20.aio import feed_price_book
+
+        response.set_line_parser(json.loads)
+
+        return feed_price_book(self, response)
+
+    def _feed_batch(self, batch):
+        self.update([
+            message for message in batch
+            if message.get("type", "PRICE") == "PRICE"
+        ])
+
+    def get(self, instrument):
+        """
+        Get the latest price of an instrument
+
+        Returns:
+            A v20.price_book.PriceSnapshot, or None if the instrument has no
+            price in the book
+        """
+        with self._condition:
+            index = self._index.get(instrument)
+
+            if index is None:
+                return None
+
+            offset = index * VALUE_COUNT
+
+            return PriceSnapshot(
+                instrument,
+                self._times[index],
+                *self._values[offset:offset + VALUE_COUNT],
+                tradeable=bool(self._tradeable[index]),
+                version=self._versions[index]
+            )
+
+    def snapshot(self):
+        """
+        Returns:
+            A dict of the latest PriceSnapshot of every instrument, all
+            taken at the same book version
+        """
+        with self._condition:
+            return dict(
+                (instrument, self.get(instrument))
+                for instrument in self._instruments
+            )
+
+    def changed_since(self, version):
+        """
+        Returns:
+            The list of instruments whose price changed after a book
+            version
+        """
+        with self._condition:
+            return [
+                instrument
+                for instrument, index in self._index.items()
+                if self._versions[index] > version
+            ]
+
+    def wait(self, version=None, timeout=None):
+        """
+        Block until the book is updated past a version
+
+        Args:
+            version: The book version to wait past. The current version is
+                used if not provided.
+            timeout: The maximum number of seconds to wait
+
+        Returns:
+            The book version when the wait ended
+        """
+        with self._condition:
+            if version is None:
+                version = self.version
+
+            if self.version <= version:
+                self._condition.wait(timeout)
+
+            return self.version
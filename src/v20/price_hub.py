@@ -0,0 +1,409 @@
+import collections
+import os
+import socket
+import threading
+import ujson as json
+
+from v20.line_reader import LineReader
+from v20.resilient_stream import ResilientStream
+
+
+class Subscription(object):
+    """
+    A Subscription receives the prices published by a PriceHub. Prices
+    waiting to be taken are conflated per instrument, so a subscriber that
+    falls behind receives the latest price of each instrument rather than
+    every tick, and the memory held for it is bounded by the number of
+    instruments.
+    """
+    def __init__(self, hub, instruments=None):
+        self.hub = hub
+
+        #
+        # The instruments subscribed to, or None for all of the hub's
+        # instruments
+        #
+        self.instruments = None
+
+        if instruments is not None:
+            self.instruments = set(instruments)
+
+        #
+        # The number of prices dropped because a later price for the same
+        # instrument arrived before they were taken
+        #
+        self.dropped = 0
+
+        self.closed = False
+
+        self._pending = collections.OrderedDict()
+        self._condition = threading.Condition()
+
+    def _offer(self, instrument, message):
+        with self._condition:
+            if instrument in self._pending:
+                del self._pending[instrument]
+                self.dropped += 1
+
+            self._pending[instrument] = message
+
+            self._condition.notify()
+
+    def _take(self, timeout):
+        with self._condition:
+            if len(self._pending) == 0 and not self.closed:
+                self._condition.wait(timeout)
+
+            if len(self._pending) == 0 and self.closed:
+                return None
+
+            messages = list(self._pending.values())
+
+            self._pending.clear()
+
+            return messages
+
+    def get(self, timeout=None):
+        """
+        Take the prices received since the last call, waiting for at least
+        one if there are none
+
+        Args:
+            timeout: The maximum number of seconds to wait
+
+        Returns:
+            A list of prices (dicts in the wire format), one per instrument
+            and in the order they were last updated. The list is empty if
+            the timeout expired, and None once the subscription is closed.
+        """
+        messages = self._take(timeout)
+
+        if messages is None:
+            return None
+
+        return [data for data, _ in messages]
+
+    def __iter__(self):
+        while True:
+            prices = self.get()
+
+            if prices is None:
+                return
+
+            for price in prices:
+                yield price
+
+    def close(self):
+        """
+        Stop receiving prices from the hub
+        """
+        self.hub.unsubscribe(self)
+
+        with self._condition:
+            self.closed = True
+            self._condition.notify_all()
+
+
+class PriceHub(object):
+    """
+    A PriceHub holds a single upstream pricing.stream and fans its prices
+    out to any number of subscribers, either in-process (subscribe()) or in
+    other processes over a Unix domain socket (serve_unix() and
+    PriceHubClient). Each subscriber is conflated independently, so a slow
+    subscriber never holds back or grows the memory of the others.
+
+        hub = PriceHub(ctx, accountID, ["EUR_USD", "USD_JPY"])
+        hub.start()
+        hub.serve_unix("/tmp/prices.sock")
+
+        for price in hub.subscribe(["EUR_USD"]):
+            print(price["instrument"], price["bids"][0]["price"])
+    """
+    def __init__(self, ctx, accountID, instruments, heartbeat_timeout=10.0,
+                 backoff=None, **kwargs):
+        """
+        Create a new PriceHub
+
+        Args:
+            ctx: The v20.Context to open the upstream stream with
+            accountID: The Account to stream prices for
+            instruments: The list of instruments to stream
+            heartbeat_timeout: The number of seconds without a message
+                after which the upstream stream is reconnected
+            backoff: The v20.resilient_stream.Backoff used between
+                reconnections
+            kwargs: Any other pricing.stream() parameters
+        """
+        self.ctx = ctx
+        self.accountID = accountID
+        self.instruments = list(instruments)
+        self.heartbeat_timeout = heartbeat_timeout
+        self.backoff = backoff
+        self.kwargs = kwargs
+
+        self._subscriptions = []
+        self._latest = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._servers = []
+
+        #
+        # The upstream v20.resilient_stream.ResilientStream, while running
+        #
+        self._stream = None
+
+    def subscribe(self, instruments=None):
+        """
+        Subscribe to the hub's prices. The subscription starts with the
+        latest price of each instrument already received.
+
+        Args:
+            instruments: The instruments to receive, or None for all
+
+        Returns:
+            A v20.price_hub.Subscription
+        """
+        subscription = Subscription(self, instruments)
+
+        with self._lock:
+            for instrument, message in self._latest.items():
+                if subscription.instruments is None or \
+                   instrument in subscription.instruments:
+                    subscription._offer(instrument, message)
+
+            self._subscriptions = self._subscriptions + [subscription]
+
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscriptions = [
+                s for s in self._subscriptions if s is not subscription
+            ]
+
+    def publish(self, messages):
+        """
+        Publish prices to the subscribers
+
+        Args:
+            messages: A list of (data, line) tuples, where data is a price
+                dict in the wire format and line its JSON encoding
+        """
+        with self._lock:
+            for message in messages:
+                self._latest[message[0]["instrument"]] = message
+
+            subscriptions = self._subscriptions
+
+        for data, line in messages:
+            instrument = data["instrument"]
+
+            for subscription in subscriptions:
+                if subscription.instruments is None or \
+                   instrument in subscription.instruments:
+                    subscription._offer(instrument, (data, line))
+
+    def run(self):
+        """
+        Stream prices from the v20 REST server and publish them until
+        stop() is called, reconnecting whenever the stream fails
+        """
+        def parse(line):
+            return json.loads(line), line
+
+        stream = ResilientStream(
+            self.ctx,
+            self.ctx.pricing.stream,
+            self.accountID,
+            instruments=",".join(self.instruments),
+            heartbeat_timeout=self.heartbeat_timeout,
+            backoff=self.backoff,
+            line_parser=parse,
+            **self.kwargs
+        )
+
+        self._stream = stream
+
+        #
+        # stop() may have been called before the stream was set
+        #
+        if self._stopped.is_set():
+            stream.close()
+
+        try:
+            for batch in stream.batches():
+                if self._stopped.is_set():
+                    return
+
+                self.publish([
+                    message for message in batch
+                    if message[0].get("type", "PRICE") == "PRICE"
+                ])
+        finally:
+            self._stream = None
+
+    def start(self):
+        """
+        Run the hub in a daemon thread
+
+        Returns:
+            The threading.Thread running the hub
+        """
+        thread = threading.Thread(target=self.run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def stop(self):
+        """
+        Stop the hub, closing the upstream stream, every subscription and
+        every Unix socket server
+        """
+        self._stopped.set()
+
+        stream = self._stream
+
+        if stream is not None:
+            stream.close()
+
+        with self._lock:
+            subscriptions = self._subscriptions
+
+        for subscription in subscriptions:
+            subscription.close()
+
+        for server in self._servers:
+            try:
+                server.shutdown(socket.SHUT_RDWR)
+            except (OSError, socket.error):
+                pass
+
+            server.close()
+
+    def serve_unix(self, path):
+        """
+        Serve the hub's prices to other processes over a Unix domain
+        socket. A client (see PriceHubClient) sends a line holding a
+        comma-separated list of instruments, or an empty line for all of
+        them, and then receives newline-delimited prices, conflated per
+        client.
+
+        Args:
+            path: The filesystem path of the socket. An existing socket at
+                the path is replaced.
+
+        Returns:
+            The threading.Thread accepting connections
+        """
+        if os.path.exists(path):
+            os.unlink(path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(64)
+
+        self._servers.append(server)
+
+        def accept():
+            while not self._stopped.is_set():
+                try:
+                    connection, _ = server.accept()
+                except (OSError, socket.error):
+                    return
+
+                thread = threading.Thread(
+                    target=self._serve_connection,
+                    args=(connection,)
+                )
+                thread.daemon = True
+                thread.start()
+
+        thread = threading.Thread(target=accept)
+        thread.daemon = True
+        thread.start()
+
+        return thread
+
+    def _serve_connection(self, connection):
+        subscription = None
+
+        try:
+            request = b""
+
+            while b"\n" not in request:
+                data = connection.recv(4096)
+
+                if not data:
+                    return
+
+                request += data
+
+            instruments = request.split(b"\n")[0].strip().decode("utf-8")
+
+            subscription = self.subscribe(
+                instruments.split(",") if instruments else None
+            )
+
+            while True:
+                messages = subscription._take(None)
+
+                if messages is None:
+                    return
+
+                connection.sendall(
+                    b"".join(
+                        line.rstrip(b"\r") + b"\n" for _, line in messages
+                    )
+                )
+        except (OSError, socket.error):
+            pass
+        finally:
+            if subscription is not None:
+                subscription.close()
+
+            connection.close()
+
+
+class PriceHubClient(object):
+    """
+    A PriceHubClient receives the prices of a PriceHub served over a Unix
+    domain socket by serve_unix()
+    """
+    def __init__(self, path, instruments=None, chunk_size=65536):
+        """
+        Connect to a PriceHub
+
+        Args:
+            path: The filesystem path of the hub's socket
+            instruments: The instruments to receive, or None for all
+            chunk_size: The maximum number of bytes read from the socket at
+                once
+        """
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.connect(path)
+        self.socket.sendall(
+            ",".join(instruments or []).encode("utf-8") + b"\n"
+        )
+
+        self.lines = LineReader(
+            iter(lambda: self.socket.recv(chunk_size), b"")
+        )
+
+    def __iter__(self):
+        """
+        Returns:
+            A generator of prices (dicts in the wire format)
+        """
+        for line in self.lines:
+            yield json.loads(line)
+
+    def batches(self):
+        """
+        Returns:
+            A generator of lists of the prices received together
+        """
+        for batch in self.lines.batches():
+            yield [json.loads(line) for line in batch]
+
+    def close(self):
+        self.socket.close()
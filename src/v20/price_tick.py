@@ -0,0 +1,78 @@
+import collections
+import ujson as json
+
+
+class PriceTick(collections.namedtuple(
+    "PriceTick",
+    [
+        "instrument",
+        "time",
+        "bid",
+        "ask",
+        "closeoutBid",
+        "closeoutAsk",
+        "tradeable",
+    ]
+)):
+    """
+    A PriceTick is a lightweight representation of a streamed price holding
+    only the top of the book. Prices are floats (None when a side of the
+    book is empty) and time is the wire-format DateTime of the price.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a PriceTick from a price in the wire format
+
+        Args:
+            data: The decoded JSON of a ClientPrice
+
+        Returns:
+            A v20.price_tick.PriceTick
+        """
+        bids = data.get("bids")
+        asks = data.get("asks")
+        closeoutBid = data.get("closeoutBid")
+        closeoutAsk = data.get("closeoutAsk")
+
+        return cls(
+            data.get("instrument"),
+            data.get("time"),
+            float(bids[0]["price"]) if bids else None,
+            float(asks[0]["price"]) if asks else None,
+            float(closeoutBid) if closeoutBid is not None else None,
+            float(closeoutAsk) if closeoutAsk is not None else None,
+            data.get("tradeable", True)
+        )
+
+
+class PriceTickParser(object):
+    """
+    A line parser for pricing.stream that produces PriceTicks directly from
+    the decoded JSON, without constructing ClientPrice, PriceBucket and
+    QuoteHomeConversionFactors entities. Heartbeats are parsed as usual.
+    It is opt-in, and set on a stream response before it is read:
+
+        response = ctx.pricing.stream(accountID, instruments="EUR_USD")
+
+        response.set_line_parser(PriceTickParser(ctx))
+
+        for msg_type, msg in response.parts():
+            if msg_type == "pricing.PriceTick":
+                print(msg.instrument, msg.bid, msg.ask)
+    """
+    def __init__(self, ctx):
+        self.ctx = ctx
+
+    def __call__(self, line):
+        j = json.loads(line)
+
+        if j.get("type") == "HEARTBEAT":
+            return (
+                "pricing.PricingHeartbeat",
+                self.ctx.pricing.PricingHeartbeat.from_dict(j, self.ctx)
+            )
+
+        return "pricing.PriceTick", PriceTick.from_dict(j)
@@ -3,6 +3,7 @@ from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
 from v20 import spec_properties
+from v20.columns import CandlestickColumns
 
 
 
@@ -26,6 +27,11 @@ class ClientPrice(BaseEntity):
     #
     _properties = spec_properties.pricing_ClientPrice
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ClientPrice instance
@@ -109,6 +115,9 @@ class ClientPrice(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ClientPrice.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('bids') is not None:
@@ -170,6 +179,11 @@ class QuoteHomeConversionFactors(BaseEntity):
     #
     _properties = spec_properties.pricing_QuoteHomeConversionFactors
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new QuoteHomeConversionFactors instance
@@ -201,6 +215,9 @@ class QuoteHomeConversionFactors(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return QuoteHomeConversionFactors.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('positiveUnits') is not None:
@@ -238,6 +255,11 @@ class HomeConversions(BaseEntity):
     #
     _properties = spec_properties.pricing_HomeConversions
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new HomeConversions instance
@@ -278,6 +300,9 @@ class HomeConversions(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return HomeConversions.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('accountGain') is not None:
@@ -319,6 +344,11 @@ class PricingHeartbeat(BaseEntity):
     #
     _properties = spec_properties.pricing_PricingHeartbeat
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PricingHeartbeat instance
@@ -344,6 +374,9 @@ class PricingHeartbeat(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PricingHeartbeat.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return PricingHeartbeat(**data)
@@ -403,7 +436,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -516,7 +549,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -649,7 +682,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -780,7 +813,7 @@ class EntitySpec(object):
                 self.ctx = ctx
 
             def __call__(self, line):
-                j = json.loads(line.decode('utf-8'))
+                j = json.loads(line)
 
                 type = j.get("type")
 
@@ -862,6 +895,10 @@ class EntitySpec(object):
             units:
                 The number of units used to calculate the volume-weighted
                 average bid and ask prices in the returned candles.
+            as_columns:
+                Flag that controls whether the candles are returned as a
+                v20.columns.CandlestickColumns of NumPy arrays instead of a
+                list of Candlestick objects. Requires numpy.
 
         Returns:
             v20.response.Response containing the results from submitting the
@@ -942,7 +979,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -958,7 +995,13 @@ class EntitySpec(object):
                 parsed_body['granularity'] = \
                     jbody.get('granularity')
 
-            if jbody.get('candles') is not None:
+            if jbody.get('candles') is not None and kwargs.get('as_columns'):
+                parsed_body['candles'] = CandlestickColumns.from_list(
+                    jbody.get('candles'),
+                    jbody.get('instrument'),
+                    jbody.get('granularity')
+                )
+            elif jbody.get('candles') is not None:
                 parsed_body['candles'] = [
                     self.ctx.instrument.Candlestick.from_dict(d, self.ctx)
                     for d in jbody.get('candles')
@@ -26,6 +26,11 @@ class PriceBucket(BaseEntity):
     #
     _properties = spec_properties.pricing_common_PriceBucket
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PriceBucket instance
@@ -51,6 +56,9 @@ class PriceBucket(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PriceBucket.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -81,6 +89,11 @@ class Price(BaseEntity):
     #
     _properties = spec_properties.pricing_common_Price
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Price instance
@@ -149,6 +162,9 @@ class Price(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Price.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('baseBid') is not None:
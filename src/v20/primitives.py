@@ -26,6 +26,11 @@ class Instrument(BaseEntity):
     #
     _properties = spec_properties.primitives_Instrument
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Instrument instance
@@ -117,6 +122,9 @@ class Instrument(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Instrument.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('minimumTradeSize') is not None:
@@ -178,6 +186,11 @@ class InstrumentCommission(BaseEntity):
     #
     _properties = spec_properties.primitives_InstrumentCommission
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new InstrumentCommission instance
@@ -210,6 +223,9 @@ class InstrumentCommission(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return InstrumentCommission.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('commission') is not None:
@@ -252,6 +268,11 @@ class GuaranteedStopLossOrderLevelRestriction(BaseEntity):
     #
     _properties = spec_properties.primitives_GuaranteedStopLossOrderLevelRestriction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new GuaranteedStopLossOrderLevelRestriction instance
@@ -281,6 +302,9 @@ class GuaranteedStopLossOrderLevelRestriction(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return GuaranteedStopLossOrderLevelRestriction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('volume') is not None:
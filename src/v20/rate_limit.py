@@ -0,0 +1,355 @@
+import contextlib
+import itertools
+import threading
+import time
+
+try:
+    from contextvars import ContextVar
+except ImportError:
+    ContextVar = None
+
+
+class TokenBucket(object):
+    """
+    A TokenBucket limits the rate of requests. Tokens are added
+    continuously at a fixed rate up to a maximum burst, and each request
+    takes one. When the bucket is empty, acquire() blocks until the token
+    it reserves has been added, so waiting callers are served in the order
+    they arrived. A TokenBucket is safe to share between threads.
+    """
+    def __init__(self, rate, burst=None):
+        """
+        Create a new TokenBucket
+
+        Args:
+            rate: The number of tokens added per second
+            burst: The maximum number of tokens the bucket holds, i.e. the
+                number of requests that may be made at once after a quiet
+                period. Defaults to rate (one second's worth).
+        """
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(rate, 1))
+        self.tokens = self.burst
+        self._updated = time.time()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(
+            self.burst,
+            self.tokens + (now - self._updated) * self.rate
+        )
+
+        self._updated = now
+
+    def available(self):
+        """
+        Returns:
+            The number of tokens in the bucket now
+        """
+        with self._lock:
+            self._refill(time.time())
+
+            return self.tokens
+
+    def take(self, tokens=1):
+        """
+        Take tokens from the bucket if they are available, without waiting
+
+        Returns:
+            True if the tokens were taken, False otherwise
+        """
+        with self._lock:
+            self._refill(time.time())
+
+            if self.tokens < tokens:
+                return False
+
+            self.tokens -= tokens
+
+            return True
+
+    def delay(self, tokens=1):
+        """
+        Returns:
+            The number of seconds until the tokens will be available
+        """
+        with self._lock:
+            self._refill(time.time())
+
+            return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens from the bucket ahead of time, without waiting. The
+        caller must wait for the number of seconds returned before using
+        them, e.g. with asyncio.sleep().
+
+        Args:
+            tokens: The number of tokens to take
+
+        Returns:
+            The number of seconds until the tokens will have been added
+        """
+        with self._lock:
+            self._refill(time.time())
+
+            self.tokens -= tokens
+
+            if self.tokens < 0:
+                return -self.tokens / self.rate
+
+            return 0.0
+
+    def acquire(self, tokens=1):
+        """
+        Take tokens from the bucket, waiting until they are available
+
+        Args:
+            tokens: The number of tokens to take
+
+        Returns:
+            The number of seconds waited
+        """
+        wait = self.reserve(tokens)
+
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+
+#
+# Request priorities. When requests are waiting for the rate limit, those
+# with a higher priority (a lower value) are sent first.
+#
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+
+#
+# The HTTP methods of the endpoints that mutate an Account, e.g.
+# order.create, trade.close and position.close
+#
+ORDER_METHODS = ["POST", "PUT", "PATCH", "DELETE"]
+
+
+class _Waiter(object):
+    def __init__(self, budget, priority, sequence):
+        self.budget = budget
+        self.key = (priority, sequence)
+
+
+class _ThreadLocalVar(object):
+    """
+    Stands in for contextvars.ContextVar before Python 3.7, holding a value
+    per thread
+    """
+    def __init__(self):
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", None)
+
+    def set(self, value):
+        previous = self.get()
+
+        self._local.value = value
+
+        return previous
+
+    def reset(self, token):
+        self._local.value = token
+
+
+class RequestScheduler(object):
+    """
+    A RequestScheduler limits the rate at which a Context sends requests.
+    Requests to endpoints that mutate an Account (order.create, trade.close,
+    position.close, ...) and read requests have separate budgets, so a
+    burst of reads can never use up the requests needed to submit or close
+    an order. All requests also share an overall budget, the server's
+    per-connection limit.
+
+    Requests that must wait are sent in priority order, and in the order
+    they arrived within a priority. Order-mutating requests are
+    PRIORITY_HIGH and reads PRIORITY_NORMAL unless the thread (or asyncio
+    task) making them has set a priority with priority():
+
+        ctx.set_scheduler(RequestScheduler())
+
+        with ctx.scheduler.priority(PRIORITY_LOW):
+            transactions = list(ctx.transaction.iter_range(accountID, start))
+    """
+    def __init__(self, rate=100, order_rate=None, read_rate=None, burst=None):
+        """
+        Create a new RequestScheduler
+
+        Args:
+            rate: The overall number of requests per second
+            order_rate: The number of order-mutating requests per second.
+                Defaults to rate.
+            read_rate: The number of read requests per second. Defaults to
+                rate.
+            burst: The number of requests that may be sent at once after a
+                quiet period. Defaults to one second's worth of each budget.
+        """
+        self.total = TokenBucket(rate, burst)
+
+        self.budgets = {
+            "order": TokenBucket(
+                order_rate if order_rate is not None else rate,
+                burst
+            ),
+            "read": TokenBucket(
+                read_rate if read_rate is not None else rate,
+                burst
+            ),
+        }
+
+        self._waiters = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+        #
+        # The priority set with priority(). It is local to each asyncio task
+        # as well as to each thread, so a priority set by one task of an
+        # AsyncContext does not apply to the requests of the others.
+        #
+        if ContextVar is not None:
+            self._priority = ContextVar("priority", default=None)
+        else:
+            self._priority = _ThreadLocalVar()
+
+    @contextlib.contextmanager
+    def priority(self, priority):
+        """
+        Set the priority of the requests made by the current thread, or
+        asyncio task, within a with block
+        """
+        token = self._priority.set(priority)
+
+        try:
+            yield
+        finally:
+            self._priority.reset(token)
+
+    def budget(self, request):
+        """
+        Returns:
+            The name of the budget a v20.request.Request is taken from,
+            "order" or "read"
+        """
+        if request.method in ORDER_METHODS:
+            return "order"
+
+        return "read"
+
+    def acquire(self, request):
+        """
+        Wait until a request may be sent
+
+        Args:
+            request: The v20.request.Request about to be sent
+
+        Returns:
+            The number of seconds waited
+        """
+        start = time.time()
+
+        waiter = self.enqueue(request)
+
+        with self._condition:
+            try:
+                while not self._take(waiter):
+                    self._condition.wait(self._delay(waiter))
+            finally:
+                self._remove(waiter)
+
+        return time.time() - start
+
+    def enqueue(self, request):
+        """
+        Queue a request for the rate limit without waiting, for a caller
+        that waits in its own way, e.g. an AsyncContext with
+        asyncio.sleep(). The request must then be polled until it may be
+        sent, or cancelled.
+
+        Args:
+            request: The v20.request.Request about to be sent
+
+        Returns:
+            The waiter to poll() or cancel()
+        """
+        budget = self.budget(request)
+
+        priority = self._priority.get()
+
+        if priority is None:
+            priority = PRIORITY_HIGH if budget == "order" else PRIORITY_NORMAL
+
+        with self._condition:
+            waiter = _Waiter(budget, priority, next(self._sequence))
+
+            self._waiters.append(waiter)
+
+        return waiter
+
+    def poll(self, waiter):
+        """
+        Take the rate limit for a queued request if it is its turn
+
+        Args:
+            waiter: The waiter returned by enqueue()
+
+        Returns:
+            None if the request may be sent now, or the number of seconds
+            to wait before polling again
+        """
+        with self._condition:
+            if self._take(waiter):
+                self._remove(waiter)
+
+                return None
+
+            return self._delay(waiter)
+
+    def cancel(self, waiter):
+        """
+        Remove a queued request that will not be sent
+        """
+        with self._condition:
+            if waiter in self._waiters:
+                self._remove(waiter)
+
+    def _remove(self, waiter):
+        self._waiters.remove(waiter)
+
+        self._condition.notify_all()
+
+    def _take(self, waiter):
+        #
+        # The overall budget goes to the first waiter, by priority and
+        # arrival, among those whose own budget has a token
+        #
+        ready = [
+            w for w in self._waiters
+            if self.budgets[w.budget].available() >= 1
+        ]
+
+        if len(ready) == 0 or min(ready, key=lambda w: w.key) is not waiter:
+            return False
+
+        if not self.total.take():
+            return False
+
+        self.budgets[waiter.budget].take()
+
+        return True
+
+    def _delay(self, waiter):
+        return max(
+            0.001,
+            self.budgets[waiter.budget].delay(),
+            self.total.delay()
+        )
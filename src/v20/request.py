@@ -10,6 +10,7 @@ class Request(object):
         self.body = ""
         self.line_parser = None
         self.headers = {}
+        self.timeout = None
 
     def set_path_param(self, key, value):
         if value is None:
@@ -37,3 +38,6 @@ class Request(object):
 
     def set_line_parser(self, parser):
         self.line_parser = parser
+
+    def set_timeout(self, timeout):
+        self.timeout = timeout
@@ -0,0 +1,354 @@
+import random
+import time
+
+from v20.call import Call
+from v20.errors import ResponseUnexpectedStatus
+from v20.errors import V20ConnectionError, V20Timeout
+from v20.transaction import SincePages
+
+
+#
+# The response statuses of a stream request that are retried
+#
+RETRY_STATUSES = [429, 500, 502, 503, 504]
+
+
+class Backoff(object):
+    """
+    Jittered exponential backoff. Each delay is drawn uniformly from zero to
+    an exponentially growing cap ("full jitter"), so that many clients
+    reconnecting at once spread out rather than retrying in lockstep.
+    """
+    def __init__(self, initial=0.5, maximum=30.0, multiplier=2.0):
+        """
+        Create a new Backoff
+
+        Args:
+            initial: The cap of the first delay, in seconds
+            maximum: The largest cap of any delay, in seconds
+            multiplier: The factor the cap grows by after each delay
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.attempts = 0
+
+    def delay(self, attempt=None):
+        """
+        Args:
+            attempt: The number of attempts already made. If not provided,
+                the attempts counted by the Backoff since its last reset
+                are used and counted up.
+
+        Returns:
+            The number of seconds to wait before the next attempt
+        """
+        if attempt is None:
+            attempt = self.attempts
+
+            self.attempts += 1
+
+        cap = min(
+            self.maximum,
+            self.initial * self.multiplier ** attempt
+        )
+
+        return random.uniform(0, cap)
+
+    def reset(self):
+        self.attempts = 0
+
+
+class ResilientStream(object):
+    """
+    A ResilientStream wraps a streaming API method (e.g. pricing.stream) in
+    a single iterator that survives failures. The stream is considered dead
+    when nothing, not even a heartbeat, has been received for
+    heartbeat_timeout seconds. A dead, failed or ended stream is
+    reconnected after a jittered exponential backoff, resubscribing with
+    the same arguments.
+
+        stream = ResilientStream(
+            ctx,
+            ctx.pricing.stream,
+            accountID,
+            instruments="EUR_USD,USD_JPY"
+        )
+
+        for msg_type, msg in stream:
+            ...
+    """
+    def __init__(self, ctx, method, *args, **kwargs):
+        """
+        Create a new ResilientStream
+
+        Args:
+            ctx: The v20.Context to stream through
+            method: The streaming API method, e.g. ctx.pricing.stream
+            args: Positional arguments for the method
+            heartbeat_timeout: The number of seconds without a message after
+                which the stream is reconnected. The v20 streams send a
+                heartbeat every 5 seconds. Defaults to 10.
+            backoff: The v20.resilient_stream.Backoff used between
+                reconnections
+            max_retries: The number of consecutive failed attempts after
+                which the last error is raised, or None (the default) to
+                retry forever
+            line_parser: A callable used to parse each line instead of the
+                method's parser
+            kwargs: Keyword arguments for the method
+        """
+        self.ctx = ctx
+        self.heartbeat_timeout = kwargs.pop("heartbeat_timeout", 10.0)
+        self.backoff = kwargs.pop("backoff", None) or Backoff()
+        self.max_retries = kwargs.pop("max_retries", None)
+        self.line_parser = kwargs.pop("line_parser", None)
+        self.call = Call(method, *args, **kwargs)
+
+        #
+        # The number of times the stream has been reconnected
+        #
+        self.reconnects = 0
+
+        #
+        # The v20.response.Response of the connection being read, if any
+        #
+        self.response = None
+
+        self.closed = False
+
+    def connect(self):
+        """
+        Open the stream
+
+        Returns:
+            The v20.response.Response of the stream request
+        """
+        request = self.call.prepare(self.ctx)
+
+        request.set_timeout(self.heartbeat_timeout)
+
+        if self.line_parser is not None:
+            request.set_line_parser(self.line_parser)
+
+        return self.ctx.request(request)
+
+    def _messages(self, response):
+        """
+        The messages of a connected stream, as batches. Overridden to
+        process the messages of each connection.
+        """
+        return response.batches()
+
+    def batches(self):
+        """
+        Returns:
+            A generator of lists of the parts received together, as yielded
+            by Response.batches(), continuing across reconnections until
+            close() is called
+        """
+        failures = 0
+
+        while not self.closed:
+            response = None
+
+            try:
+                response = self.connect()
+
+                self.response = response
+
+                if self.closed:
+                    return
+
+                if str(response.status) == "200":
+                    for batch in self._messages(response):
+                        failures = 0
+                        self.backoff.reset()
+
+                        yield batch
+
+                    if self.closed:
+                        return
+
+                    #
+                    # The server ended the stream
+                    #
+                    error = V20ConnectionError(response.path)
+                else:
+                    response.set_raw_body(b"".join(response.chunks()))
+
+                    error = ResponseUnexpectedStatus(
+                        self.call.complete(self.ctx, response),
+                        200
+                    )
+
+                    if response.status not in RETRY_STATUSES:
+                        raise error
+            except (V20ConnectionError, V20Timeout) as e:
+                if self.closed:
+                    return
+
+                error = e
+            except Exception:
+                #
+                # Reading a connection closed by close() from another
+                # thread can fail in any way
+                #
+                if self.closed:
+                    return
+
+                raise
+            finally:
+                #
+                # The connection is given up whether the stream failed, was
+                # ended by the server or was abandoned by the consumer
+                #
+                self.response = None
+
+                if response is not None:
+                    response.close()
+
+            failures += 1
+
+            if self.max_retries is not None and failures > self.max_retries:
+                raise error
+
+            time.sleep(self.backoff.delay())
+
+            self.reconnects += 1
+
+    def close(self):
+        """
+        Stop the stream. The connection being read is closed, and batches()
+        ends instead of reconnecting. May be called from another thread.
+        """
+        self.closed = True
+
+        response = self.response
+
+        if response is not None:
+            response.close()
+
+    def __iter__(self):
+        for batch in self.batches():
+            for part in batch:
+                yield part
+
+
+class ResilientTransactionStream(ResilientStream):
+    """
+    A ResilientTransactionStream is a ResilientStream of an Account's
+    transaction.stream that also fills gaps. After every (re)connection,
+    and whenever a heartbeat or Transaction shows that Transactions were
+    missed, the missing Transactions are fetched with transaction.since and
+    yielded in order, so the consumer sees every Transaction exactly once.
+
+        stream = ResilientTransactionStream(
+            ctx,
+            accountID,
+            lastTransactionID=lastTransactionID
+        )
+
+        for msg_type, msg in stream:
+            if msg_type == "transaction.Transaction":
+                ...
+    """
+    def __init__(self, ctx, accountID, lastTransactionID=None, **kwargs):
+        """
+        Create a new ResilientTransactionStream
+
+        Args:
+            ctx: The v20.Context to stream through
+            accountID: The Account to stream the Transactions of
+            lastTransactionID: The ID of the last Transaction already seen.
+                The Transactions after it are yielded first. If not
+                provided, gaps are filled from the first message received.
+            kwargs: Any other ResilientStream parameters
+        """
+        super(ResilientTransactionStream, self).__init__(
+            ctx,
+            ctx.transaction.stream,
+            accountID,
+            **kwargs
+        )
+
+        self.accountID = accountID
+
+        self.lastTransactionID = lastTransactionID
+
+    def since(self):
+        """
+        Fetch the Transactions after the last one seen with
+        transaction.since
+
+        A response with one of the retry statuses is retried after a
+        backoff, as a failed stream is reconnected.
+
+        Returns:
+            A generator of ("transaction.Transaction", Transaction) parts
+        """
+        failures = 0
+
+        pages = SincePages(self.lastTransactionID)
+
+        while not pages.done:
+            response = self.ctx.transaction.since(
+                self.accountID,
+                id=pages.sinceID
+            )
+
+            if str(response.status) != "200":
+                failures += 1
+
+                if response.status not in RETRY_STATUSES:
+                    raise ResponseUnexpectedStatus(response, 200)
+
+                if self.max_retries is not None and \
+                   failures > self.max_retries:
+                    raise ResponseUnexpectedStatus(response, 200)
+
+                time.sleep(self.backoff.delay())
+
+                continue
+
+            for transaction in pages.add(response):
+                if int(transaction.id) > int(self.lastTransactionID):
+                    self.lastTransactionID = transaction.id
+
+                    yield "transaction.Transaction", transaction
+
+    def _messages(self, response):
+        #
+        # The stream is connected before the gap is filled so that no
+        # Transaction created in between is missed. Any received twice
+        # are skipped.
+        #
+        if self.lastTransactionID is not None:
+            yield list(self.since())
+
+        for batch in response.batches():
+            parts = []
+
+            for msg_type, msg in batch:
+                if msg_type == "transaction.TransactionHeartbeat":
+                    if self.lastTransactionID is None:
+                        self.lastTransactionID = msg.lastTransactionID
+                    elif int(msg.lastTransactionID) > \
+                            int(self.lastTransactionID):
+                        parts.extend(self.since())
+                elif msg_type == "transaction.Transaction":
+                    if self.lastTransactionID is not None:
+                        if int(msg.id) <= int(self.lastTransactionID):
+                            continue
+
+                        if int(msg.id) > int(self.lastTransactionID) + 1:
+                            parts.extend(self.since())
+
+                            if int(msg.id) <= int(self.lastTransactionID):
+                                continue
+
+                    self.lastTransactionID = msg.id
+
+                parts.append((msg_type, msg))
+
+            yield parts
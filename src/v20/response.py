@@ -1,4 +1,5 @@
 import requests
+import ujson as json
 from v20.errors import ResponseUnexpectedStatus, ResponseNoField, V20Timeout, V20ConnectionError
 
 class Response(object):
@@ -11,19 +12,62 @@ class Response(object):
         self.headers = headers
         self.content_type = headers.get("content-type", None)
         self.raw_body = None
+        self.json_body = None
         self.body = None
         self.lines = None
+        self.chunks_iter = None
         self.line_parser = None
+        self.release = None
 
     def set_raw_body(self, raw_body):
         self.raw_body = raw_body
+        self.json_body = None
+
+    def set_json_body(self, json_body):
+        self.json_body = json_body
+
+    def json(self):
+        """
+        The body of the response decoded from JSON. A body that was set
+        already decoded, such as a single element streamed by
+        Context.iter_array, is returned as is.
+        """
+        if self.json_body is not None:
+            return self.json_body
+
+        return json.loads(self.raw_body)
+
+    @property
+    def text(self):
+        """
+        The body of the response decoded to a str. The raw_body holds the
+        bytes received and is only decoded when this is read.
+        """
+        if isinstance(self.raw_body, bytes):
+            return self.raw_body.decode("utf-8")
+
+        return self.raw_body
 
     def set_lines(self, lines):
         self.lines = lines
 
+    def set_chunks(self, chunks):
+        self.chunks_iter = chunks
+
     def set_line_parser(self, parser):
         self.line_parser = parser
 
+    def set_release(self, release):
+        self.release = release
+
+    def close(self):
+        """
+        Give up the connection of a streaming response that will not be
+        read any further
+        """
+        if self.release is not None:
+            self.release()
+
     def get(self, field, status=None):
         if status is not None:
             if str(self.status) != str(status):
@@ -56,6 +100,52 @@ class Response(object):
         except requests.exceptions.ChunkedEncodingError:
             raise V20ConnectionError(self.path)
 
+    def batches(self):
+        """
+        Parse the stream's lines a batch at a time. Each batch holds the
+        messages that arrived together, which lets a consumer that has
+        fallen behind handle a burst at once (e.g. keeping only the latest
+        price of each instrument).
+
+        Returns:
+            A generator of lists of the parts yielded by parts()
+        """
+        def line_parser(line):
+            return "line", line
+
+        parser = line_parser
+
+        if self.line_parser is not None:
+            parser = self.line_parser
+
+        if self.lines is None:
+            return
+
+        if hasattr(self.lines, "batches"):
+            line_batches = self.lines.batches()
+        else:
+            line_batches = ([line] for line in self.lines)
+
+        try:
+            for batch in line_batches:
+                yield [parser(line) for line in batch]
+        except requests.exceptions.ConnectionError:
+            raise V20Timeout(self.path, "stream")
+        except requests.exceptions.ChunkedEncodingError:
+            raise V20ConnectionError(self.path)
+
+    def chunks(self):
+        if self.chunks_iter is None:
+            return
+
+        try:
+            for chunk in self.chunks_iter:
+                yield chunk
+        except requests.exceptions.ConnectionError:
+            raise V20Timeout(self.path, "stream")
+        except requests.exceptions.ChunkedEncodingError:
+            raise V20ConnectionError(self.path)
+
     def __str__(self):
         s  = "Method = {}\n".format(self.method)
         s += "Path = {}\n".format(self.path)
@@ -0,0 +1,136 @@
+import email.utils
+import time
+
+from v20.rate_limit import TokenBucket
+from v20.resilient_stream import Backoff
+
+
+#
+# The HTTP methods that are safe to retry automatically, as repeating them
+# cannot change an Account
+#
+SAFE_METHODS = ["GET", "HEAD", "OPTIONS"]
+
+
+#
+# The response statuses that are retried
+#
+RETRY_STATUSES = [429, 502, 503, 504]
+
+
+class RetryPolicy(object):
+    """
+    A RetryPolicy decides whether and when a Context retries a failed
+    request. Requests that fail to connect, time out or receive one of the
+    retry statuses are retried after a jittered exponential backoff, or
+    after the time given by a Retry-After header.
+
+    Only safe (read) requests are retried. A request that mutates an
+    Account, such as order.create, may have been carried out by the server
+    even though no response was received, so it is never repeated
+    automatically; see order.create_reconciled for a safe way to submit an
+    Order over an unreliable connection.
+
+    Retries are limited per request by max_retries and across all requests
+    by a retry budget, so that a struggling server is not flooded with
+    retries.
+
+        ctx.set_retry_policy(RetryPolicy(max_retries=3))
+    """
+    def __init__(
+        self,
+        max_retries=3,
+        backoff=None,
+        retry_rate=10,
+        max_retry_after=60,
+        statuses=None,
+        methods=None
+    ):
+        """
+        Create a new RetryPolicy
+
+        Args:
+            max_retries: The maximum number of times a request is retried
+            backoff: The v20.resilient_stream.Backoff giving the delay
+                before each retry. Defaults to Backoff(0.25, 8).
+            retry_rate: The maximum number of retries per second across
+                all requests, or None for no limit
+            max_retry_after: The longest Retry-After, in seconds, that is
+                waited for. A response asking for a longer wait is returned
+                rather than retried.
+            statuses: The response statuses to retry. Defaults to
+                RETRY_STATUSES.
+            methods: The HTTP methods to retry. Defaults to SAFE_METHODS.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff or Backoff(0.25, 8.0)
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses if statuses is not None else RETRY_STATUSES
+        self.methods = methods if methods is not None else SAFE_METHODS
+
+        self.budget = None
+
+        if retry_rate is not None:
+            self.budget = TokenBucket(retry_rate)
+
+    def retry_after(self, response):
+        """
+        Returns:
+            The number of seconds a response's Retry-After header asks the
+            client to wait, or None if it has none
+        """
+        value = response.headers.get("retry-after")
+
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        date = email.utils.parsedate_tz(value)
+
+        if date is None:
+            return None
+
+        return max(0.0, email.utils.mktime_tz(date) - time.time())
+
+    def delay(self, request, attempt, response=None, error=None):
+        """
+        Decide whether to retry a request
+
+        Args:
+            request: The v20.request.Request made
+            attempt: The number of times the request has been retried
+            response: The v20.response.Response received, if any
+            error: The V20ConnectionError or V20Timeout raised, if any
+
+        Returns:
+            The number of seconds to wait before retrying the request, or
+            None if it should not be retried
+        """
+        if request.method not in self.methods:
+            return None
+
+        if attempt >= self.max_retries:
+            return None
+
+        delay = self.backoff.delay(attempt)
+
+        if response is not None:
+            if response.status not in self.statuses:
+                return None
+
+            retry_after = self.retry_after(response)
+
+            if retry_after is not None:
+                if retry_after > self.max_retry_after:
+                    return None
+
+                delay = retry_after
+
+        if self.budget is not None and not self.budget.take():
+            return None
+
+        return delay
@@ -27,6 +27,11 @@ class MT4TransactionHeartbeat(BaseEntity):
     #
     _properties = spec_properties.site_MT4TransactionHeartbeat
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MT4TransactionHeartbeat instance
@@ -52,6 +57,9 @@ class MT4TransactionHeartbeat(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MT4TransactionHeartbeat.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MT4TransactionHeartbeat(**data)
@@ -0,0 +1,66 @@
+import calendar
+import datetime
+
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def to_ns(value):
+    """
+    Convert a DateTime into nanoseconds since the epoch
+
+    Args:
+        value: A datetime (naive datetimes are taken to be UTC), a number of
+            seconds since the epoch, or a wire-format DateTime string in
+            either RFC3339 or UNIX format
+
+    Returns:
+        The number of nanoseconds since the epoch as an int
+    """
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None) - value.utcoffset()
+
+        return calendar.timegm(value.timetuple()) * 1000000000 + \
+            value.microsecond * 1000
+
+    if isinstance(value, (int, float)):
+        return int(round(value * 1000000000))
+
+    if value.endswith("Z"):
+        seconds, _, fraction = value[:-1].partition(".")
+        dt = datetime.datetime.strptime(seconds, "%Y-%m-%dT%H:%M:%S")
+        seconds = calendar.timegm(dt.timetuple())
+    else:
+        seconds, _, fraction = value.partition(".")
+        seconds = int(seconds)
+
+    return seconds * 1000000000 + int((fraction + "000000000")[:9])
+
+
+def format_ns(ns, datetime_format="RFC3339"):
+    """
+    Format nanoseconds since the epoch as a wire-format DateTime
+
+    Args:
+        ns: The number of nanoseconds since the epoch
+        datetime_format: UNIX or RFC3339
+
+    Returns:
+        The DateTime string
+    """
+    seconds, fraction = divmod(ns, 1000000000)
+
+    if datetime_format == "UNIX":
+        return "{}.{:09d}".format(seconds, fraction)
+
+    #
+    # Adding to a naive epoch gives the UTC time without utcfromtimestamp,
+    # which is deprecated, or a timezone, which Python 2 lacks
+    #
+    return "{}.{:09d}Z".format(
+        (_EPOCH + datetime.timedelta(seconds=seconds)).strftime(
+            "%Y-%m-%dT%H:%M:%S"
+        ),
+        fraction
+    )
@@ -1,4 +1,3 @@
-import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
@@ -28,6 +27,11 @@ class Trade(BaseEntity):
     #
     _properties = spec_properties.trade_Trade
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Trade instance
@@ -147,6 +151,9 @@ class Trade(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return Trade.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -243,6 +250,11 @@ class TradeSummary(BaseEntity):
     #
     _properties = spec_properties.trade_TradeSummary
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TradeSummary instance
@@ -362,6 +374,9 @@ class TradeSummary(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TradeSummary.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -439,6 +454,11 @@ class CalculatedTradeState(BaseEntity):
     #
     _properties = spec_properties.trade_CalculatedTradeState
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CalculatedTradeState instance
@@ -469,6 +489,9 @@ class CalculatedTradeState(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CalculatedTradeState.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('unrealizedPL') is not None:
@@ -571,7 +594,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -663,7 +686,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -763,7 +786,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -878,7 +901,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1040,7 +1063,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1222,7 +1245,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -1,8 +1,17 @@
 import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
+from v20.base_entity import TypeRegistry
 from v20.request import Request
 from v20 import spec_properties
+from v20 import parallel
+from v20 import timestamps
+from v20.call import multi_request
+
+try:
+    from urllib.parse import parse_qs, urlparse
+except ImportError:
+    from urlparse import parse_qs, urlparse
 
 
 
@@ -27,6 +36,11 @@ class Transaction(BaseEntity):
     #
     _properties = spec_properties.transaction_Transaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new Transaction instance
@@ -73,78 +87,13 @@ class Transaction(BaseEntity):
         instantiated appropriately.
         """
 
-        type = data.get("type")
-
-        if type == "MARKET_ORDER":
-            return MarketOrderTransaction.from_dict(data, ctx)
-        if type == "ORDER_FILL":
-            return OrderFillTransaction.from_dict(data, ctx)
-        if type == "ORDER_CANCEL":
-            return OrderCancelTransaction.from_dict(data, ctx)
-        if type == "MARKET_ORDER_REJECT":
-            return MarketOrderRejectTransaction.from_dict(data, ctx)
-        if type == "TRADE_CLIENT_EXTENSIONS_MODIFY":
-            return TradeClientExtensionsModifyTransaction.from_dict(data, ctx)
-        if type == "TRADE_CLIENT_EXTENSIONS_MODIFY_REJECT":
-            return TradeClientExtensionsModifyRejectTransaction.from_dict(data, ctx)
-        if type == "TAKE_PROFIT_ORDER":
-            return TakeProfitOrderTransaction.from_dict(data, ctx)
-        if type == "STOP_LOSS_ORDER":
-            return StopLossOrderTransaction.from_dict(data, ctx)
-        if type == "TRAILING_STOP_LOSS_ORDER":
-            return TrailingStopLossOrderTransaction.from_dict(data, ctx)
-        if type == "ORDER_CANCEL_REJECT":
-            return OrderCancelRejectTransaction.from_dict(data, ctx)
-        if type == "TAKE_PROFIT_ORDER_REJECT":
-            return TakeProfitOrderRejectTransaction.from_dict(data, ctx)
-        if type == "STOP_LOSS_ORDER_REJECT":
-            return StopLossOrderRejectTransaction.from_dict(data, ctx)
-        if type == "TRAILING_STOP_LOSS_ORDER_REJECT":
-            return TrailingStopLossOrderRejectTransaction.from_dict(data, ctx)
-        if type == "CLIENT_CONFIGURE":
-            return ClientConfigureTransaction.from_dict(data, ctx)
-        if type == "CLIENT_CONFIGURE_REJECT":
-            return ClientConfigureRejectTransaction.from_dict(data, ctx)
-        if type == "CREATE":
-            return CreateTransaction.from_dict(data, ctx)
-        if type == "CLOSE":
-            return CloseTransaction.from_dict(data, ctx)
-        if type == "REOPEN":
-            return ReopenTransaction.from_dict(data, ctx)
-        if type == "TRANSFER_FUNDS":
-            return TransferFundsTransaction.from_dict(data, ctx)
-        if type == "TRANSFER_FUNDS_REJECT":
-            return TransferFundsRejectTransaction.from_dict(data, ctx)
-        if type == "FIXED_PRICE_ORDER":
-            return FixedPriceOrderTransaction.from_dict(data, ctx)
-        if type == "LIMIT_ORDER":
-            return LimitOrderTransaction.from_dict(data, ctx)
-        if type == "LIMIT_ORDER_REJECT":
-            return LimitOrderRejectTransaction.from_dict(data, ctx)
-        if type == "STOP_ORDER":
-            return StopOrderTransaction.from_dict(data, ctx)
-        if type == "STOP_ORDER_REJECT":
-            return StopOrderRejectTransaction.from_dict(data, ctx)
-        if type == "MARKET_IF_TOUCHED_ORDER":
-            return MarketIfTouchedOrderTransaction.from_dict(data, ctx)
-        if type == "MARKET_IF_TOUCHED_ORDER_REJECT":
-            return MarketIfTouchedOrderRejectTransaction.from_dict(data, ctx)
-        if type == "ORDER_CLIENT_EXTENSIONS_MODIFY":
-            return OrderClientExtensionsModifyTransaction.from_dict(data, ctx)
-        if type == "ORDER_CLIENT_EXTENSIONS_MODIFY_REJECT":
-            return OrderClientExtensionsModifyRejectTransaction.from_dict(data, ctx)
-        if type == "MARGIN_CALL_ENTER":
-            return MarginCallEnterTransaction.from_dict(data, ctx)
-        if type == "MARGIN_CALL_EXTEND":
-            return MarginCallExtendTransaction.from_dict(data, ctx)
-        if type == "MARGIN_CALL_EXIT":
-            return MarginCallExitTransaction.from_dict(data, ctx)
-        if type == "DELAYED_TRADE_CLOSURE":
-            return DelayedTradeClosureTransaction.from_dict(data, ctx)
-        if type == "DAILY_FINANCING":
-            return DailyFinancingTransaction.from_dict(data, ctx)
-        if type == "RESET_RESETTABLE_PL":
-            return ResetResettablePLTransaction.from_dict(data, ctx)
+        handler = transaction_types.get(data.get("type"))
+
+        if handler is not None:
+            return handler(data, ctx)
+
+        if ctx.lazy_entities:
+            return Transaction.lazy_from_dict(data, ctx)
 
         data = data.copy()
 
@@ -171,6 +120,11 @@ class CreateTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_CreateTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CreateTransaction instance
@@ -248,6 +202,9 @@ class CreateTransaction(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CreateTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return CreateTransaction(**data)
@@ -273,6 +230,11 @@ class CloseTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_CloseTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new CloseTransaction instance
@@ -325,6 +287,9 @@ class CloseTransaction(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return CloseTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return CloseTransaction(**data)
@@ -350,6 +315,11 @@ class ReopenTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_ReopenTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ReopenTransaction instance
@@ -402,6 +372,9 @@ class ReopenTransaction(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ReopenTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return ReopenTransaction(**data)
@@ -428,6 +401,11 @@ class ClientConfigureTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_ClientConfigureTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ClientConfigureTransaction instance
@@ -490,6 +468,9 @@ class ClientConfigureTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ClientConfigureTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('marginRate') is not None:
@@ -521,6 +502,11 @@ class ClientConfigureRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_ClientConfigureRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ClientConfigureRejectTransaction instance
@@ -588,6 +574,9 @@ class ClientConfigureRejectTransaction(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ClientConfigureRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('marginRate') is not None:
@@ -619,6 +608,11 @@ class TransferFundsTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TransferFundsTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TransferFundsTransaction instance
@@ -694,6 +688,9 @@ class TransferFundsTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TransferFundsTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('amount') is not None:
@@ -730,6 +727,11 @@ class TransferFundsRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TransferFundsRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TransferFundsRejectTransaction instance
@@ -805,6 +807,9 @@ class TransferFundsRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TransferFundsRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('amount') is not None:
@@ -839,6 +844,11 @@ class MarketOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderTransaction instance
@@ -989,6 +999,9 @@ class MarketOrderTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -1085,6 +1098,11 @@ class MarketOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderRejectTransaction instance
@@ -1240,6 +1258,9 @@ class MarketOrderRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -1337,6 +1358,11 @@ class FixedPriceOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_FixedPriceOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new FixedPriceOrderTransaction instance
@@ -1455,6 +1481,9 @@ class FixedPriceOrderTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return FixedPriceOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -1521,6 +1550,11 @@ class LimitOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_LimitOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LimitOrderTransaction instance
@@ -1680,6 +1714,9 @@ class LimitOrderTransaction(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LimitOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -1746,6 +1783,11 @@ class LimitOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_LimitOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LimitOrderRejectTransaction instance
@@ -1904,6 +1946,9 @@ class LimitOrderRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LimitOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -1970,6 +2015,11 @@ class StopOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_StopOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopOrderTransaction instance
@@ -2136,6 +2186,9 @@ class StopOrderTransaction(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2207,6 +2260,11 @@ class StopOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_StopOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopOrderRejectTransaction instance
@@ -2372,6 +2430,9 @@ class StopOrderRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2443,6 +2504,11 @@ class MarketIfTouchedOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketIfTouchedOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketIfTouchedOrderTransaction instance
@@ -2612,6 +2678,9 @@ class MarketIfTouchedOrderTransaction(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketIfTouchedOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2683,6 +2752,11 @@ class MarketIfTouchedOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketIfTouchedOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketIfTouchedOrderRejectTransaction instance
@@ -2852,6 +2926,9 @@ class MarketIfTouchedOrderRejectTransaction(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketIfTouchedOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -2923,6 +3000,11 @@ class TakeProfitOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TakeProfitOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TakeProfitOrderTransaction instance
@@ -3057,6 +3139,9 @@ class TakeProfitOrderTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TakeProfitOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3094,6 +3179,11 @@ class TakeProfitOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TakeProfitOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TakeProfitOrderRejectTransaction instance
@@ -3227,6 +3317,9 @@ class TakeProfitOrderRejectTransaction(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TakeProfitOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3264,6 +3357,11 @@ class StopLossOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_StopLossOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopLossOrderTransaction instance
@@ -3422,6 +3520,9 @@ class StopLossOrderTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopLossOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3469,6 +3570,11 @@ class StopLossOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_StopLossOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopLossOrderRejectTransaction instance
@@ -3618,6 +3724,9 @@ class StopLossOrderRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopLossOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -3660,6 +3769,11 @@ class TrailingStopLossOrderTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TrailingStopLossOrderTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TrailingStopLossOrderTransaction instance
@@ -3793,6 +3907,9 @@ class TrailingStopLossOrderTransaction(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TrailingStopLossOrderTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('distance') is not None:
@@ -3830,6 +3947,11 @@ class TrailingStopLossOrderRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TrailingStopLossOrderRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TrailingStopLossOrderRejectTransaction instance
@@ -3964,6 +4086,9 @@ class TrailingStopLossOrderRejectTransaction(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TrailingStopLossOrderRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('distance') is not None:
@@ -4001,6 +4126,11 @@ class OrderFillTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_OrderFillTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderFillTransaction instance
@@ -4171,6 +4301,9 @@ class OrderFillTransaction(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderFillTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -4276,6 +4409,11 @@ class OrderCancelTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_OrderCancelTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderCancelTransaction instance
@@ -4350,6 +4488,9 @@ class OrderCancelTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderCancelTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return OrderCancelTransaction(**data)
@@ -4376,6 +4517,11 @@ class OrderCancelRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_OrderCancelRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderCancelRejectTransaction instance
@@ -4444,6 +4590,9 @@ class OrderCancelRejectTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderCancelRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return OrderCancelRejectTransaction(**data)
@@ -4470,6 +4619,11 @@ class OrderClientExtensionsModifyTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_OrderClientExtensionsModifyTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderClientExtensionsModifyTransaction instance
@@ -4545,6 +4699,9 @@ class OrderClientExtensionsModifyTransaction(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderClientExtensionsModifyTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensionsModify') is not None:
@@ -4583,6 +4740,11 @@ class OrderClientExtensionsModifyRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_OrderClientExtensionsModifyRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OrderClientExtensionsModifyRejectTransaction instance
@@ -4663,6 +4825,9 @@ class OrderClientExtensionsModifyRejectTransaction(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OrderClientExtensionsModifyRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('clientExtensionsModify') is not None:
@@ -4701,6 +4866,11 @@ class TradeClientExtensionsModifyTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TradeClientExtensionsModifyTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TradeClientExtensionsModifyTransaction instance
@@ -4771,6 +4941,9 @@ class TradeClientExtensionsModifyTransaction(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TradeClientExtensionsModifyTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('tradeClientExtensionsModify') is not None:
@@ -4803,6 +4976,11 @@ class TradeClientExtensionsModifyRejectTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_TradeClientExtensionsModifyRejectTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TradeClientExtensionsModifyRejectTransaction instance
@@ -4878,6 +5056,9 @@ class TradeClientExtensionsModifyRejectTransaction(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TradeClientExtensionsModifyRejectTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('tradeClientExtensionsModify') is not None:
@@ -4910,6 +5091,11 @@ class MarginCallEnterTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarginCallEnterTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarginCallEnterTransaction instance
@@ -4962,6 +5148,9 @@ class MarginCallEnterTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarginCallEnterTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarginCallEnterTransaction(**data)
@@ -4988,6 +5177,11 @@ class MarginCallExtendTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarginCallExtendTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarginCallExtendTransaction instance
@@ -5047,6 +5241,9 @@ class MarginCallExtendTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarginCallExtendTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarginCallExtendTransaction(**data)
@@ -5073,6 +5270,11 @@ class MarginCallExitTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_MarginCallExitTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarginCallExitTransaction instance
@@ -5125,6 +5327,9 @@ class MarginCallExitTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarginCallExitTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarginCallExitTransaction(**data)
@@ -5154,6 +5359,11 @@ class DelayedTradeClosureTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_DelayedTradeClosureTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new DelayedTradeClosureTransaction instance
@@ -5217,6 +5427,9 @@ class DelayedTradeClosureTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return DelayedTradeClosureTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return DelayedTradeClosureTransaction(**data)
@@ -5243,6 +5456,11 @@ class DailyFinancingTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_DailyFinancingTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new DailyFinancingTransaction instance
@@ -5315,6 +5533,9 @@ class DailyFinancingTransaction(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return DailyFinancingTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('financing') is not None:
@@ -5357,6 +5578,11 @@ class ResetResettablePLTransaction(BaseEntity):
     #
     _properties = spec_properties.transaction_ResetResettablePLTransaction
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ResetResettablePLTransaction instance
@@ -5409,6 +5635,9 @@ class ResetResettablePLTransaction(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ResetResettablePLTransaction.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return ResetResettablePLTransaction(**data)
@@ -5436,6 +5665,11 @@ class ClientExtensions(BaseEntity):
     #
     _properties = spec_properties.transaction_ClientExtensions
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new ClientExtensions instance
@@ -5466,6 +5700,9 @@ class ClientExtensions(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return ClientExtensions.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return ClientExtensions(**data)
@@ -5494,6 +5731,11 @@ class TakeProfitDetails(BaseEntity):
     #
     _properties = spec_properties.transaction_TakeProfitDetails
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TakeProfitDetails instance
@@ -5532,6 +5774,9 @@ class TakeProfitDetails(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TakeProfitDetails.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -5571,6 +5816,11 @@ class StopLossDetails(BaseEntity):
     #
     _properties = spec_properties.transaction_StopLossDetails
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new StopLossDetails instance
@@ -5624,6 +5874,9 @@ class StopLossDetails(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return StopLossDetails.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('price') is not None:
@@ -5668,6 +5921,11 @@ class TrailingStopLossDetails(BaseEntity):
     #
     _properties = spec_properties.transaction_TrailingStopLossDetails
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TrailingStopLossDetails instance
@@ -5707,6 +5965,9 @@ class TrailingStopLossDetails(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TrailingStopLossDetails.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('distance') is not None:
@@ -5745,6 +6006,11 @@ class TradeOpen(BaseEntity):
     #
     _properties = spec_properties.transaction_TradeOpen
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TradeOpen instance
@@ -5800,6 +6066,9 @@ class TradeOpen(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TradeOpen.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -5859,6 +6128,11 @@ class TradeReduce(BaseEntity):
     #
     _properties = spec_properties.transaction_TradeReduce
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TradeReduce instance
@@ -5913,6 +6187,9 @@ class TradeReduce(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TradeReduce.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('units') is not None:
@@ -5969,6 +6246,11 @@ class MarketOrderTradeClose(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderTradeClose
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderTradeClose instance
@@ -6000,6 +6282,9 @@ class MarketOrderTradeClose(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderTradeClose.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarketOrderTradeClose(**data)
@@ -6026,6 +6311,11 @@ class MarketOrderMarginCloseout(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderMarginCloseout
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderMarginCloseout instance
@@ -6046,6 +6336,9 @@ class MarketOrderMarginCloseout(BaseEntity):
         any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderMarginCloseout.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarketOrderMarginCloseout(**data)
@@ -6073,6 +6366,11 @@ class MarketOrderDelayedTradeClose(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderDelayedTradeClose
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderDelayedTradeClose instance
@@ -6104,6 +6402,9 @@ class MarketOrderDelayedTradeClose(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderDelayedTradeClose.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarketOrderDelayedTradeClose(**data)
@@ -6130,6 +6431,11 @@ class MarketOrderPositionCloseout(BaseEntity):
     #
     _properties = spec_properties.transaction_MarketOrderPositionCloseout
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new MarketOrderPositionCloseout instance
@@ -6158,6 +6464,9 @@ class MarketOrderPositionCloseout(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return MarketOrderPositionCloseout.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return MarketOrderPositionCloseout(**data)
@@ -6187,6 +6496,11 @@ class LiquidityRegenerationSchedule(BaseEntity):
     #
     _properties = spec_properties.transaction_LiquidityRegenerationSchedule
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LiquidityRegenerationSchedule instance
@@ -6207,6 +6521,9 @@ class LiquidityRegenerationSchedule(BaseEntity):
         with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LiquidityRegenerationSchedule.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('steps') is not None:
@@ -6240,6 +6557,11 @@ class LiquidityRegenerationScheduleStep(BaseEntity):
     #
     _properties = spec_properties.transaction_LiquidityRegenerationScheduleStep
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new LiquidityRegenerationScheduleStep instance
@@ -6270,6 +6592,9 @@ class LiquidityRegenerationScheduleStep(BaseEntity):
         passed in, with any complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return LiquidityRegenerationScheduleStep.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('bidLiquidityUsed') is not None:
@@ -6306,6 +6631,11 @@ class OpenTradeFinancing(BaseEntity):
     #
     _properties = spec_properties.transaction_OpenTradeFinancing
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new OpenTradeFinancing instance
@@ -6331,6 +6661,9 @@ class OpenTradeFinancing(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return OpenTradeFinancing.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('financing') is not None:
@@ -6362,6 +6695,11 @@ class PositionFinancing(BaseEntity):
     #
     _properties = spec_properties.transaction_PositionFinancing
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new PositionFinancing instance
@@ -6393,6 +6731,9 @@ class PositionFinancing(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return PositionFinancing.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         if data.get('financing') is not None:
@@ -6430,6 +6771,11 @@ class TransactionHeartbeat(BaseEntity):
     #
     _properties = spec_properties.transaction_TransactionHeartbeat
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new TransactionHeartbeat instance
@@ -6460,11 +6806,117 @@ class TransactionHeartbeat(BaseEntity):
         complex child types instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return TransactionHeartbeat.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return TransactionHeartbeat(**data)
 
 
+#
+# The handlers used by Transaction.from_dict to instantiate each type of
+# Transaction. Shared by every Context in the process.
+#
+transaction_types = TypeRegistry(Transaction)
+
+transaction_types.register("MARKET_ORDER", MarketOrderTransaction)
+transaction_types.register("ORDER_FILL", OrderFillTransaction)
+transaction_types.register("ORDER_CANCEL", OrderCancelTransaction)
+transaction_types.register("MARKET_ORDER_REJECT", MarketOrderRejectTransaction)
+transaction_types.register("TRADE_CLIENT_EXTENSIONS_MODIFY", TradeClientExtensionsModifyTransaction)
+transaction_types.register("TRADE_CLIENT_EXTENSIONS_MODIFY_REJECT", TradeClientExtensionsModifyRejectTransaction)
+transaction_types.register("TAKE_PROFIT_ORDER", TakeProfitOrderTransaction)
+transaction_types.register("STOP_LOSS_ORDER", StopLossOrderTransaction)
+transaction_types.register("TRAILING_STOP_LOSS_ORDER", TrailingStopLossOrderTransaction)
+transaction_types.register("ORDER_CANCEL_REJECT", OrderCancelRejectTransaction)
+transaction_types.register("TAKE_PROFIT_ORDER_REJECT", TakeProfitOrderRejectTransaction)
+transaction_types.register("STOP_LOSS_ORDER_REJECT", StopLossOrderRejectTransaction)
+transaction_types.register("TRAILING_STOP_LOSS_ORDER_REJECT", TrailingStopLossOrderRejectTransaction)
+transaction_types.register("CLIENT_CONFIGURE", ClientConfigureTransaction)
+transaction_types.register("CLIENT_CONFIGURE_REJECT", ClientConfigureRejectTransaction)
+transaction_types.register("CREATE", CreateTransaction)
+transaction_types.register("CLOSE", CloseTransaction)
+transaction_types.register("REOPEN", ReopenTransaction)
+transaction_types.register("TRANSFER_FUNDS", TransferFundsTransaction)
+transaction_types.register("TRANSFER_FUNDS_REJECT", TransferFundsRejectTransaction)
+transaction_types.register("FIXED_PRICE_ORDER", FixedPriceOrderTransaction)
+transaction_types.register("LIMIT_ORDER", LimitOrderTransaction)
+transaction_types.register("LIMIT_ORDER_REJECT", LimitOrderRejectTransaction)
+transaction_types.register("STOP_ORDER", StopOrderTransaction)
+transaction_types.register("STOP_ORDER_REJECT", StopOrderRejectTransaction)
+transaction_types.register("MARKET_IF_TOUCHED_ORDER", MarketIfTouchedOrderTransaction)
+transaction_types.register("MARKET_IF_TOUCHED_ORDER_REJECT", MarketIfTouchedOrderRejectTransaction)
+transaction_types.register("ORDER_CLIENT_EXTENSIONS_MODIFY", OrderClientExtensionsModifyTransaction)
+transaction_types.register("ORDER_CLIENT_EXTENSIONS_MODIFY_REJECT", OrderClientExtensionsModifyRejectTransaction)
+transaction_types.register("MARGIN_CALL_ENTER", MarginCallEnterTransaction)
+transaction_types.register("MARGIN_CALL_EXTEND", MarginCallExtendTransaction)
+transaction_types.register("MARGIN_CALL_EXIT", MarginCallExitTransaction)
+transaction_types.register("DELAYED_TRADE_CLOSURE", DelayedTradeClosureTransaction)
+transaction_types.register("DAILY_FINANCING", DailyFinancingTransaction)
+transaction_types.register("RESET_RESETTABLE_PL", ResetResettablePLTransaction)
+
+
+class SincePages(object):
+    """
+    The paging of transaction.since. The server returns a limited page of
+    the Transactions after the ID requested, so the Transactions up to the
+    Account's last one are fetched a page at a time, each page after the
+    last Transaction of the previous one. A SincePages only keeps track of
+    the paging; the requests are made by the caller, blocking or on an
+    event loop:
+
+        pages = SincePages(lastTransactionID)
+
+        while not pages.done:
+            response = ctx.transaction.since(accountID, id=pages.sinceID)
+
+            for transaction in pages.add(response):
+                ...
+    """
+    def __init__(self, sinceID):
+        """
+        Create a new SincePages
+
+        Args:
+            sinceID: The ID of the last Transaction already known
+        """
+        self.sinceID = sinceID
+
+        #
+        # The ID of the Account's last Transaction, as reported by the last
+        # page received
+        #
+        self.lastTransactionID = None
+
+        self.done = False
+
+    def add(self, response):
+        """
+        Take in the transaction.since response for sinceID
+
+        Args:
+            response: The v20.response.Response of the request
+
+        Returns:
+            The list of Transactions of the page
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if the request failed
+        """
+        page = response.get("transactions", 200)
+
+        self.lastTransactionID = response.get("lastTransactionID", 200)
+
+        if len(page) == 0 or \
+           int(page[-1].id) >= int(self.lastTransactionID):
+            self.done = True
+        else:
+            self.sinceID = page[-1].id
+
+        return page
+
+
 class EntitySpec(object):
     """
     The transaction.EntitySpec wraps the transaction module's type definitions
@@ -6524,6 +6976,13 @@ class EntitySpec(object):
     PositionFinancing = PositionFinancing
     TransactionHeartbeat = TransactionHeartbeat
 
+    #
+    # The handlers used by Transaction.from_dict to instantiate each type of Transaction.
+    # Register a handler to replace how a type is built, or skip a type to
+    # have it built lazily.
+    #
+    types = transaction_types
+
     def __init__(self, ctx):
         self.ctx = ctx
 
@@ -6587,7 +7046,13 @@ class EntitySpec(object):
             kwargs.get('type')
         )
 
-        response = self.ctx.request(request)
+        if self.ctx.transaction_journal is not None:
+            response = self.ctx.transaction_journal.request(
+                self.ctx,
+                request
+            )
+        else:
+            response = self.ctx.request(request)
 
 
         if response.content_type is None:
@@ -6596,7 +7061,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -6697,6 +7162,95 @@ class EntitySpec(object):
         return response
 
 
+    @multi_request
+    def iter_range(
+        self,
+        accountID,
+        fromTime,
+        toTime=None,
+        max_workers=4,
+        **kwargs
+    ):
+        """
+        Fetch the Transactions for an Account over a time range. The pages
+        returned by list() are fetched concurrently over the context's
+        connection pool, and the Transactions are yielded in ID order as
+        each page arrives, so only a bounded number of pages is held in
+        memory at once.
+
+        Args:
+            accountID:
+                Account Identifier
+            fromTime:
+                The start of the time range (inclusive), as a datetime, a
+                number of seconds since the epoch or a wire-format DateTime
+            toTime:
+                The end of the time range (inclusive), in any of the formats
+                accepted for fromTime. The current time is used if not
+                provided.
+            max_workers:
+                The maximum number of page requests in flight at once
+            pageSize:
+                The number of Transactions to include in each page. Defaults
+                to the maximum of 1000.
+            type:
+                A filter for restricting the types of Transactions to
+                retreive, either a comma-separated string or a list
+
+        Returns:
+            A generator of v20.transaction.Transaction objects
+
+        Raises:
+            v20.errors.ResponseUnexpectedStatus if the list of pages or a
+            page could not be fetched
+        """
+
+        type = kwargs.get('type')
+
+        if isinstance(type, (list, tuple)):
+            type = ",".join(type)
+
+        fromTime = timestamps.format_ns(
+            timestamps.to_ns(fromTime),
+            self.ctx.datetime_format
+        )
+
+        if toTime is not None:
+            toTime = timestamps.format_ns(
+                timestamps.to_ns(toTime),
+                self.ctx.datetime_format
+            )
+
+        response = self.list(
+            accountID,
+            fromTime=fromTime,
+            toTime=toTime,
+            pageSize=kwargs.get('pageSize', 1000),
+            type=type
+        )
+
+        pages = response.get("pages", 200)
+
+        def fetch(page):
+            query = parse_qs(urlparse(page).query)
+
+            page_response = self.range(
+                accountID,
+                fromID=query["from"][0],
+                toID=query["to"][0],
+                type=query.get("type", [type])[0]
+            )
+
+            return sorted(
+                page_response.get("transactions", 200),
+                key=lambda t: int(t.id)
+            )
+
+        for transactions in parallel.ordered_map(fetch, pages, max_workers):
+            for transaction in transactions:
+                yield transaction
+
+
     def get(
         self,
         accountID,
@@ -6732,7 +7286,13 @@ class EntitySpec(object):
             transactionID
         )
 
-        response = self.ctx.request(request)
+        if self.ctx.transaction_journal is not None:
+            response = self.ctx.transaction_journal.request(
+                self.ctx,
+                request
+            )
+        else:
+            response = self.ctx.request(request)
 
 
         if response.content_type is None:
@@ -6741,7 +7301,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -6848,7 +7408,13 @@ class EntitySpec(object):
             kwargs.get('type')
         )
 
-        response = self.ctx.request(request)
+        if self.ctx.transaction_journal is not None:
+            response = self.ctx.transaction_journal.request(
+                self.ctx,
+                request
+            )
+        else:
+            response = self.ctx.request(request)
 
 
         if response.content_type is None:
@@ -6857,7 +7423,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -6967,7 +7533,13 @@ class EntitySpec(object):
             kwargs.get('id')
         )
 
-        response = self.ctx.request(request)
+        if self.ctx.transaction_journal is not None:
+            response = self.ctx.transaction_journal.request(
+                self.ctx,
+                request
+            )
+        else:
+            response = self.ctx.request(request)
 
 
         if response.content_type is None:
@@ -6976,7 +7548,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -7085,7 +7657,7 @@ class EntitySpec(object):
                 self.ctx = ctx
 
             def __call__(self, line):
-                j = json.loads(line.decode('utf-8'))
+                j = json.loads(line)
 
                 type = j.get("type")
 
@@ -0,0 +1,671 @@
+"""
+A persistent, append-only, on-disk journal of an Account's Transactions.
+
+The journal for each Account lives in its own directory and holds a
+contiguous run of the Account's Transactions, from the first Transaction
+journaled (the start) up to the journal head:
+
+    transactions-00000000.jsonl, transactions-00000001.jsonl, ...
+        Segment files holding the raw JSON of each Transaction, one per
+        line, in ID order. A new segment is started once the current one
+        reaches the journal's segment size.
+
+    index
+        One fixed-size little-endian record per Transaction, in ID order:
+
+            int64 id
+            int64 time (ns since the epoch)
+            int64 segment number
+            int64 offset of the Transaction's line in its segment
+            int64 length of the line
+
+        Transaction times increase with their IDs, so the index is both the
+        ID index and the time index and is binary searched by either.
+
+    journal.json
+        The start and head of the journal. It is written last when
+        Transactions are appended, so index records beyond the head (left
+        by an interrupted append) are discarded when the journal is opened,
+        as is a final index record that was only partly written.
+"""
+
+import os
+import re
+import struct
+import threading
+import ujson as json
+
+try:
+    from os import replace
+except ImportError:
+    #
+    # Python 2 has no os.replace. Its os.rename replaces an existing file
+    # everywhere but on Windows.
+    #
+    from os import rename as replace
+
+from v20 import parallel
+from v20 import timestamps
+from v20.request import Request
+from v20.response import Response
+
+
+#
+# The maximum number of Transactions fetched by a single idrange request
+#
+MAX_RANGE_COUNT = 1000
+
+
+#
+# The Transaction filters that name a category of Transaction types rather
+# than a single type. Requests using them are passed to the server.
+#
+FILTER_CATEGORIES = ["ORDER", "FUNDING", "ADMIN"]
+
+
+class AccountJournal(object):
+    """
+    The journaled Transactions of a single Account. Reading and appending
+    are serialized by the journal's lock, which is never held while
+    Transactions are fetched from the server.
+    """
+    def __init__(self, path, segment_size):
+        self.path = path
+        self.segment_size = segment_size
+        self.record = struct.Struct("<qqqqq")
+        self.start = None
+        self.head = None
+        self._lock = threading.RLock()
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        meta = os.path.join(path, "journal.json")
+
+        if os.path.exists(meta):
+            with open(meta) as f:
+                data = json.load(f)
+                self.start = data["start"]
+                self.head = data["head"]
+
+        self._truncate_index()
+
+    def _index_path(self):
+        return os.path.join(self.path, "index")
+
+    def _segment_path(self, segment):
+        return os.path.join(
+            self.path,
+            "transactions-{:08d}.jsonl".format(segment)
+        )
+
+    def _truncate_index(self):
+        """
+        Discard what an interrupted append left in the index: records
+        beyond the head, and a final record only partly written, which
+        would misalign every record appended after it
+        """
+        if not os.path.exists(self._index_path()):
+            return
+
+        size = os.path.getsize(self._index_path())
+
+        n = size // self.record.size
+
+        end = n
+
+        if n > 0:
+            with open(self._index_path(), "rb") as f:
+                end = self._bisect(f, n, 0, (self.head or 0) + 1)
+
+        if end * self.record.size < size:
+            with open(self._index_path(), "r+b") as f:
+                f.truncate(end * self.record.size)
+
+    def count(self):
+        """
+        Returns:
+            The number of Transactions journaled
+        """
+        if not os.path.exists(self._index_path()):
+            return 0
+
+        return os.path.getsize(self._index_path()) // self.record.size
+
+    def _record_at(self, f, index):
+        f.seek(index * self.record.size)
+        return self.record.unpack(f.read(self.record.size))
+
+    def _bisect(self, f, n, field, value):
+        lo, hi = 0, n
+
+        while lo < hi:
+            mid = (lo + hi) // 2
+
+            if self._record_at(f, mid)[field] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        return lo
+
+    def begin(self, start):
+        """
+        Start an empty journal at a Transaction ID. A journal that has
+        already started is left as it is.
+        """
+        with self._lock:
+            if self.start is None:
+                self.start = start
+                self.head = start - 1
+
+    def covers(self, fromID, toID):
+        """
+        Returns:
+            True if every Transaction with an ID in [fromID, toID] is
+            journaled
+        """
+        return self.start is not None and \
+            self.start <= fromID and toID <= self.head
+
+    def records(self, fromID, toID):
+        """
+        Returns:
+            The index records of the journaled Transactions with an ID in
+            [fromID, toID]
+        """
+        with self._lock:
+            n = self.count()
+
+            if n == 0:
+                return []
+
+            with open(self._index_path(), "rb") as f:
+                start = self._bisect(f, n, 0, fromID)
+                end = self._bisect(f, n, 0, toID + 1)
+
+                f.seek(start * self.record.size)
+
+                data = f.read((end - start) * self.record.size)
+
+        return [
+            self.record.unpack_from(data, i * self.record.size)
+            for i in range(end - start)
+        ]
+
+    def read(self, fromID, toID):
+        """
+        Returns:
+            The raw JSON (bytes) of the journaled Transactions with an ID in
+            [fromID, toID], in ID order
+        """
+        lines = []
+
+        segment = None
+        f = None
+
+        with self._lock:
+            try:
+                for _, _, record_segment, offset, length in \
+                        self.records(fromID, toID):
+                    if record_segment != segment:
+                        if f is not None:
+                            f.close()
+
+                        segment = record_segment
+                        f = open(self._segment_path(segment), "rb")
+
+                    f.seek(offset)
+
+                    lines.append(f.read(length))
+            finally:
+                if f is not None:
+                    f.close()
+
+        return lines
+
+    def find_time(self, time_ns):
+        """
+        Returns:
+            The ID of the first journaled Transaction with a time at or
+            after time_ns, or None if there is none
+        """
+        with self._lock:
+            n = self.count()
+
+            if n == 0:
+                return None
+
+            with open(self._index_path(), "rb") as f:
+                index = self._bisect(f, n, 1, time_ns)
+
+                if index == n:
+                    return None
+
+                return self._record_at(f, index)[0]
+
+    def time_of(self, transactionID):
+        """
+        Returns:
+            The time in ns of a journaled Transaction, or None
+        """
+        records = self.records(transactionID, transactionID)
+
+        if len(records) == 0:
+            return None
+
+        return records[0][1]
+
+    def append(self, transactions, head):
+        """
+        Append Transactions to the journal and advance its head
+
+        Args:
+            transactions: The Transactions (as dicts) following the current
+                head, in ID order
+            head: The ID of the new head of the journal. Every Transaction
+                up to it must have been appended. Transactions already
+                journaled (fetched concurrently by another request) are
+                skipped.
+        """
+        with self._lock:
+            n = self.count()
+
+            segment = 0
+            last = self.head
+
+            if n > 0:
+                with open(self._index_path(), "rb") as f:
+                    segment = self._record_at(f, n - 1)[2]
+
+            index = []
+
+            segment_file = open(self._segment_path(segment), "ab")
+
+            try:
+                for transaction in transactions:
+                    transactionID = int(transaction["id"])
+
+                    if last is not None and transactionID <= last:
+                        continue
+
+                    if segment_file.tell() >= self.segment_size:
+                        segment_file.close()
+                        segment += 1
+                        segment_file = open(self._segment_path(segment), "ab")
+
+                    line = json.dumps(transaction).encode("utf-8")
+
+                    offset = segment_file.tell()
+
+                    segment_file.write(line + b"\n")
+
+                    index.append(self.record.pack(
+                        transactionID,
+                        timestamps.to_ns(transaction["time"]),
+                        segment,
+                        offset,
+                        len(line)
+                    ))
+
+                    last = transactionID
+            finally:
+                segment_file.close()
+
+            with open(self._index_path(), "ab") as f:
+                f.write(b"".join(index))
+
+            if self.start is None:
+                if len(transactions) > 0:
+                    self.start = int(transactions[0]["id"])
+                else:
+                    self.start = head + 1
+
+            self.head = max(self.head or 0, head)
+
+            meta = os.path.join(self.path, "journal.json")
+
+            with open(meta + ".tmp", "w") as f:
+                json.dump({"start": self.start, "head": self.head}, f)
+
+            replace(meta + ".tmp", meta)
+
+
+class TransactionJournal(object):
+    """
+    A TransactionJournal is consulted by transaction.range,
+    transaction.since, transaction.get and transaction.list. Transactions
+    already journaled are served from disk, and only the Transactions
+    beyond the journal head are fetched from the v20 REST server and
+    appended to the journal. Install one with
+    Context.set_transaction_journal().
+
+    The journal of an Account starts at the first Transaction requested
+    through it. Requests for earlier Transactions, and requests filtered by
+    a Transaction category, are passed to the server. Responses served
+    entirely from disk report the journal head as their lastTransactionID.
+    """
+    def __init__(self, directory, segment_size=64 * 1024 * 1024,
+                 max_workers=4):
+        """
+        Create a new TransactionJournal
+
+        Args:
+            directory: The directory to store the journals in. It is
+                created if it does not exist.
+            segment_size: The size in bytes at which a new segment file is
+                started
+            max_workers: The maximum number of concurrent requests made to
+                fetch the Transactions beyond the journal head
+        """
+        self.directory = directory
+        self.segment_size = segment_size
+        self.max_workers = max_workers
+        self._journals = {}
+        self._lock = threading.Lock()
+
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def journal(self, accountID):
+        """
+        Get the AccountJournal for an Account
+
+        Returns:
+            A v20.transaction_journal.AccountJournal
+        """
+        with self._lock:
+            journal = self._journals.get(accountID)
+
+            if journal is None:
+                journal = AccountJournal(
+                    os.path.join(
+                        self.directory,
+                        re.sub(r"[^A-Za-z0-9_.-]", "-", accountID)
+                    ),
+                    self.segment_size
+                )
+
+                self._journals[accountID] = journal
+
+            return journal
+
+    def request(self, ctx, request):
+        """
+        Perform a Transaction request through the journal
+
+        Args:
+            ctx: The v20.Context to fetch Transactions through
+            request: The v20.request.Request for the Transactions
+
+        Returns:
+            A v20.response.Response
+        """
+        accountID = request.path.split("/")[3]
+
+        endpoint = request.base_path.split("/transactions")[1]
+
+        #
+        # Each AccountJournal locks itself only while its files are read or
+        # written, so requests fetching from the server run concurrently
+        #
+        journal = self.journal(accountID)
+
+        if endpoint == "/idrange":
+            return self._range(ctx, request, journal)
+
+        if endpoint == "/sinceid":
+            return self._since(ctx, request, journal)
+
+        if endpoint == "":
+            return self._list(ctx, request, journal)
+
+        if endpoint == "/{transactionID}":
+            return self._get(ctx, request, journal)
+
+        return ctx.request(request)
+
+    def _types(self, request):
+        types = request.params.get("type")
+
+        if types is None:
+            return None
+
+        types = set(types.split(","))
+
+        for category in FILTER_CATEGORIES:
+            if category in types:
+                raise ValueError(category)
+
+        return types
+
+    def _fetch(self, ctx, request, journal, toID):
+        """
+        Fetch the Transactions from the journal head up to toID from the
+        server and append them to the journal
+
+        Returns:
+            None, or the Response of a request that failed
+        """
+        windows = (
+            (fromID, min(fromID + MAX_RANGE_COUNT - 1, toID))
+            for fromID in range(journal.head + 1, toID + 1, MAX_RANGE_COUNT)
+        )
+
+        def fetch(window):
+            window_request = Request(
+                "GET",
+                "/v3/accounts/{accountID}/transactions/idrange"
+            )
+            window_request.set_path_param(
+                "accountID",
+                request.path.split("/")[3]
+            )
+            window_request.set_param("from", window[0])
+            window_request.set_param("to", window[1])
+            return window, ctx.request(window_request)
+
+        for window, response in parallel.ordered_map(
+            fetch,
+            windows,
+            self.max_workers
+        ):
+            if str(response.status) != "200":
+                return response
+
+            jbody = json.loads(response.raw_body)
+
+            transactions = jbody.get("transactions", [])
+
+            #
+            # The server stops at the Account's last Transaction
+            #
+            head = min(window[1], int(jbody.get("lastTransactionID")))
+
+            journal.append(transactions, head)
+
+            if head < window[1]:
+                break
+
+        return None
+
+    def _response(self, ctx, request, body):
+        response = Response(
+            request,
+            request.method,
+            "{}{}".format(ctx._base_url, request.path),
+            200,
+            "OK",
+            {"content-type": "application/json"}
+        )
+
+        response.set_raw_body(body)
+
+        return response
+
+    def _transactions_response(self, ctx, request, journal, fromID, toID,
+                               types, lastTransactionID):
+        lines = journal.read(fromID, toID)
+
+        if types is not None:
+            lines = [
+                line for line in lines
+                if json.loads(line).get("type") in types
+            ]
+
+        return self._response(
+            ctx,
+            request,
+            b'{"transactions":[' + b",".join(lines) +
+            b'],"lastTransactionID":"' + str(lastTransactionID).encode() +
+            b'"}'
+        )
+
+    def _range(self, ctx, request, journal):
+        try:
+            fromID = int(request.params["from"])
+            toID = int(request.params["to"])
+            types = self._types(request)
+        except (KeyError, ValueError):
+            return ctx.request(request)
+
+        journal.begin(fromID)
+
+        if fromID < journal.start:
+            return ctx.request(request)
+
+        if toID > journal.head:
+            failed = self._fetch(ctx, request, journal, toID)
+
+            if failed is not None:
+                return failed
+
+        return self._transactions_response(
+            ctx, request, journal, fromID, toID, types, journal.head
+        )
+
+    def _since(self, ctx, request, journal):
+        try:
+            sinceID = int(request.params["id"])
+        except (KeyError, ValueError):
+            return ctx.request(request)
+
+        if journal.start is not None and sinceID + 1 < journal.start:
+            return ctx.request(request)
+
+        #
+        # Only the Transactions after the journal head are requested from
+        # the server. The request is built anew rather than changing the
+        # caller's.
+        #
+        since_request = request
+
+        if journal.start is not None:
+            since_request = Request("GET", request.base_path)
+            since_request.set_path_param(
+                "accountID",
+                request.path.split("/")[3]
+            )
+            since_request.set_param("id", journal.head)
+            since_request.set_timeout(request.timeout)
+
+        response = ctx.request(since_request)
+
+        if str(response.status) != "200":
+            return response
+
+        jbody = json.loads(response.raw_body)
+
+        transactions = jbody.get("transactions", [])
+
+        lastTransactionID = int(jbody.get("lastTransactionID"))
+
+        if len(transactions) > 0:
+            head = int(transactions[-1]["id"])
+        else:
+            head = lastTransactionID
+
+        journal.begin(sinceID + 1)
+
+        journal.append(transactions, head)
+
+        return self._transactions_response(
+            ctx, request, journal, sinceID + 1, journal.head, None,
+            lastTransactionID
+        )
+
+    def _get(self, ctx, request, journal):
+        try:
+            transactionID = int(request.path.split("/")[-1])
+        except ValueError:
+            return ctx.request(request)
+
+        if not journal.covers(transactionID, transactionID):
+            return ctx.request(request)
+
+        lines = journal.read(transactionID, transactionID)
+
+        if len(lines) == 0:
+            return ctx.request(request)
+
+        return self._response(
+            ctx,
+            request,
+            b'{"transaction":' + lines[0] +
+            b',"lastTransactionID":"' + str(journal.head).encode() + b'"}'
+        )
+
+    def _list(self, ctx, request, journal):
+        params = request.params
+
+        if params.get("type") is not None or \
+           params.get("from") is None or params.get("to") is None or \
+           journal.start is None:
+            return ctx.request(request)
+
+        try:
+            from_ns = timestamps.to_ns(params["from"])
+            to_ns = timestamps.to_ns(params["to"])
+        except ValueError:
+            return ctx.request(request)
+
+        #
+        # The time range must lie strictly within the journal, so that no
+        # Transaction of the range can be outside of it
+        #
+        start_ns = journal.time_of(journal.start)
+        head_ns = journal.time_of(journal.head)
+
+        if start_ns is None or head_ns is None or \
+           not start_ns < from_ns <= to_ns < head_ns:
+            return ctx.request(request)
+
+        fromID = journal.find_time(from_ns)
+        toID = journal.find_time(to_ns + 1) - 1
+
+        pageSize = int(params.get("pageSize", 100))
+
+        ids = [r[0] for r in journal.records(fromID, toID)]
+
+        pages = [
+            "{}{}/idrange?from={}&to={}".format(
+                ctx._base_url,
+                request.path,
+                ids[i],
+                ids[min(i + pageSize, len(ids)) - 1]
+            )
+            for i in range(0, len(ids), pageSize)
+        ]
+
+        return self._response(
+            ctx,
+            request,
+            json.dumps({
+                "from": params["from"],
+                "to": params["to"],
+                "pageSize": pageSize,
+                "count": len(ids),
+                "pages": pages,
+                "lastTransactionID": str(journal.head)
+            }).encode("utf-8")
+        )
@@ -0,0 +1,379 @@
+import threading
+
+import requests
+
+try:
+    from queue import Empty, Full
+except ImportError:
+    from Queue import Empty, Full
+
+from v20.errors import V20ConnectionError, V20Timeout
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def require_httpx():
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for HTTP/2 (pip install 'httpx[http2]')"
+        )
+
+
+def httpx_error(e, url):
+    """
+    Returns:
+        The V20ConnectionError or V20Timeout for an httpx.TransportError
+    """
+    if isinstance(e, httpx.ConnectTimeout):
+        return V20Timeout(url, "connect")
+
+    if isinstance(e, httpx.TimeoutException):
+        return V20Timeout(url, "read")
+
+    return V20ConnectionError(url)
+
+
+class Reply(object):
+    """
+    A Reply is what a Transport hands back for a request: the status line
+    and headers, and either the whole body or an iterator over its chunks
+    """
+    def __init__(
+        self,
+        url,
+        status,
+        reason,
+        headers,
+        request_headers=None,
+        content=None,
+        chunks=None,
+        chunked=False,
+        release=None
+    ):
+        """
+        Create a new Reply
+
+        Args:
+            url: The URL the request was sent to
+            status: The HTTP status code
+            reason: The HTTP reason phrase
+            headers: The response headers, a mapping whose get() is not
+                case sensitive
+            request_headers: The headers sent with the request
+            content: The body as bytes, for a request that is not a stream
+            chunks: For a stream, a callable taking a chunk size (None for
+                chunks as they arrive) and returning an iterator of bytes.
+                It raises V20ConnectionError or V20Timeout when the stream
+                fails.
+            chunked: True if the body arrives in chunks of its own, so it
+                can be read as they arrive rather than in pieces of a fixed
+                size
+            release: For a stream, a callable that gives up the connection
+                the stream is read from
+        """
+        self.url = url
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.request_headers = request_headers
+        self.content = content
+        self.chunks = chunks
+        self.chunked = chunked
+        self.release = release
+
+    def iter_chunks(self, chunk_size):
+        if self.chunks is None:
+            return iter([])
+
+        return self.chunks(chunk_size)
+
+    def close(self):
+        """
+        Give up the connection of a stream that will not be read any further
+        """
+        if self.release is not None:
+            self.release()
+
+
+class Transport(object):
+    """
+    A Transport carries requests from a Context to the v20 REST server.
+    Context.request builds the v20.request.Request and the
+    v20.response.Response; the Transport only performs the HTTP exchange,
+    so the Context can be run over different HTTP implementations.
+    """
+    def send(self, request, url, headers, timeout):
+        """
+        Send a request
+
+        Args:
+            request: The v20.request.Request to send. Its method, params,
+                body and stream flag are used.
+            url: The full URL of the request, without its query string
+            headers: The headers to send
+            timeout: The connect and read timeout in seconds
+
+        Returns:
+            A v20.transport.Reply
+
+        Raises:
+            V20ConnectionError if the server could not be reached, or
+            V20Timeout if it did not respond in time
+        """
+        raise NotImplementedError()
+
+    def close_idle_connections(self):
+        """
+        Close every connection that is not currently in use
+        """
+        pass
+
+    def prewarm(self, url, count, timeout):
+        """
+        Open connections to the server ahead of time
+
+        Args:
+            url: A URL on the server
+            count: The number of connections to open
+            timeout: The timeout for opening each one
+        """
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    A RequestsTransport sends requests over HTTP/1.1 with a requests
+    Session, keeping a pool of connections with one connection per
+    concurrent request. It is the default Transport of a Context.
+    """
+    def __init__(self, pool_connections=10, pool_maxsize=10, pool_block=False):
+        """
+        Create a new RequestsTransport
+
+        Args:
+            pool_connections: The number of per-host connection pools to
+                cache
+            pool_maxsize: The maximum number of connections to keep open to
+                each host
+            pool_block: Flag that controls whether a request should wait for
+                a free connection when pool_maxsize connections are in use
+        """
+        self.session = requests.Session()
+
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self.pool_maxsize = pool_maxsize
+
+    def send(self, request, url, headers, timeout):
+        try:
+            http_response = self.session.request(
+                request.method,
+                url,
+                headers=headers,
+                params=request.params,
+                data=request.body,
+                stream=request.stream,
+                timeout=timeout
+            )
+        except requests.exceptions.ConnectionError:
+            raise V20ConnectionError(url)
+        except requests.exceptions.ConnectTimeout:
+            raise V20Timeout(url, "connect")
+        except requests.exceptions.ReadTimeout:
+            raise V20Timeout(url, "read")
+
+        reply = Reply(
+            http_response.url,
+            http_response.status_code,
+            http_response.reason,
+            http_response.headers,
+            request_headers=http_response.request.headers
+        )
+
+        if request.stream:
+            #
+            # The errors raised while reading are translated by
+            # v20.response.Response
+            #
+            reply.chunks = http_response.iter_content
+            reply.chunked = getattr(http_response.raw, "chunked", False)
+            reply.release = http_response.close
+        else:
+            reply.content = http_response.content
+
+        return reply
+
+    def close_idle_connections(self):
+        for adapter in self.session.adapters.values():
+            #
+            # The idle connections are taken from urllib3's pools, whose
+            # layout is not part of its public API. Should it change, the
+            # adapter is closed instead, which also closes the idle
+            # connections. The connections in use are then closed when
+            # they are given back, rather than kept.
+            #
+            try:
+                self._close_idle(adapter.poolmanager)
+            except (AttributeError, TypeError):
+                adapter.close()
+
+    def _close_idle(self, poolmanager):
+        pools = poolmanager.pools
+
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+
+            if pool is None or pool.pool is None:
+                continue
+
+            queue = pool.pool
+
+            connections = []
+
+            while True:
+                try:
+                    connections.append(queue.get_nowait())
+                except Empty:
+                    break
+
+            for connection in connections:
+                if connection is not None:
+                    connection.close()
+
+                #
+                # A connection given back meanwhile may have taken the
+                # place
+                #
+                try:
+                    queue.put_nowait(None)
+                except Full:
+                    pass
+
+    def prewarm(self, url, count, timeout):
+        def connect():
+            try:
+                self.session.head(url, timeout=timeout)
+            except requests.exceptions.RequestException:
+                pass
+
+        threads = [
+            threading.Thread(target=connect)
+            for i in range(min(count, self.pool_maxsize))
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+
+class HTTP2Transport(Transport):
+    """
+    An HTTP2Transport sends requests over HTTP/2 with httpx, multiplexing
+    every concurrent request and stream over a single TLS connection to the
+    server. It requires the optional httpx[http2] dependency
+    (pip install 'v20[http2]').
+
+        ctx = v20.Context(hostname, token=token, transport=HTTP2Transport())
+
+    If the server does not offer HTTP/2, requests fall back to HTTP/1.1.
+    An AsyncContext uses v20.aio.AsyncHTTP2Transport instead.
+    """
+    def __init__(self, max_connections=10, verify=True):
+        """
+        Create a new HTTP2Transport
+
+        Args:
+            max_connections: The maximum number of connections to open.
+                Over HTTP/2 a single connection carries many concurrent
+                requests, so more than one is only opened once the server's
+                limit of concurrent streams on a connection is reached.
+            verify: Flag that controls whether the server's TLS certificate
+                is verified
+        """
+        require_httpx()
+
+        self.client = httpx.Client(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+
+    def send(self, request, url, headers, timeout):
+        body = request.body
+
+        if not isinstance(body, bytes):
+            body = body.encode("utf-8")
+
+        http_request = self.client.build_request(
+            request.method,
+            url,
+            headers=headers,
+            params=request.params,
+            content=body,
+            timeout=timeout
+        )
+
+        try:
+            http_response = self.client.send(
+                http_request,
+                stream=request.stream
+            )
+        except httpx.TransportError as e:
+            raise httpx_error(e, url)
+
+        reply = Reply(
+            str(http_response.url),
+            http_response.status_code,
+            http_response.reason_phrase,
+            http_response.headers,
+            request_headers=http_request.headers
+        )
+
+        if request.stream:
+            def chunks(chunk_size):
+                try:
+                    for chunk in http_response.iter_bytes(chunk_size):
+                        yield chunk
+                except httpx.TransportError as e:
+                    raise httpx_error(e, url)
+                finally:
+                    http_response.close()
+
+            reply.chunks = chunks
+            reply.chunked = True
+            reply.release = http_response.close
+        else:
+            reply.content = http_response.content
+
+        return reply
+
+    def close_idle_connections(self):
+        #
+        # httpx closes idle connections itself once their keep-alive
+        # expires. Closing the client would also end streams in progress.
+        #
+        pass
+
+    def prewarm(self, url, count, timeout):
+        #
+        # A single HTTP/2 connection serves every request
+        #
+        try:
+            self.client.head(url, timeout=timeout)
+        except httpx.TransportError:
+            pass
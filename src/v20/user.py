@@ -1,4 +1,3 @@
-import ujson as json
 from v20.base_entity import BaseEntity
 from v20.base_entity import EntityDict
 from v20.request import Request
@@ -26,6 +25,11 @@ class UserInfo(BaseEntity):
     #
     _properties = spec_properties.user_UserInfo
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new UserInfo instance
@@ -61,6 +65,9 @@ class UserInfo(BaseEntity):
         appropriately.
         """
 
+        if ctx.lazy_entities:
+            return UserInfo.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return UserInfo(**data)
@@ -87,6 +94,11 @@ class UserInfoExternal(BaseEntity):
     #
     _properties = spec_properties.user_UserInfoExternal
 
+    #
+    # Attribute storage for this object, one slot per property
+    #
+    __slots__ = tuple(p.name for p in _properties)
+
     def __init__(self, **kwargs):
         """
         Create a new UserInfoExternal instance
@@ -118,6 +130,9 @@ class UserInfoExternal(BaseEntity):
         instantiated appropriately.
         """
 
+        if ctx.lazy_entities:
+            return UserInfoExternal.lazy_from_dict(data, ctx)
+
         data = data.copy()
 
         return UserInfoExternal(**data)
@@ -175,7 +190,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 
@@ -266,7 +281,7 @@ class EntitySpec(object):
         if not response.content_type.startswith("application/json"):
             return response
 
-        jbody = json.loads(response.raw_body)
+        jbody = response.json()
 
         parsed_body = {}
 